@@ -2,9 +2,23 @@
 
 # Must be run from the docs directory
 
-# Remove the old api_reference files
-rm -rf docs/source/api_reference/*.rst
-sphinx-apidoc -o docs/source/api_reference qtnmtts
+# Generate the api_reference stubs in a temporary directory and only copy over
+# the ones that changed, so unchanged stubs keep their mtime and Sphinx can reuse
+# its cached doctrees (index.rst is updated in place by build_index.py)
+api_ref_dir=docs/source/api_reference
+stub_dir=$(mktemp -d)
+sphinx-apidoc -o "$stub_dir" qtnmtts
+for stale in "$api_ref_dir"/*.rst; do
+    [ -e "$stale" ] || continue
+    name=$(basename "$stale")
+    if [ "$name" != "index.rst" ] && [ ! -f "$stub_dir/$name" ]; then
+        rm "$stale"
+    fi
+done
+for stub in "$stub_dir"/*.rst; do
+    cmp -s "$stub" "$api_ref_dir/$(basename "$stub")" || cp "$stub" "$api_ref_dir/"
+done
+rm -rf "$stub_dir"
 
 # Run the Python script to update api_reference index.rst
 
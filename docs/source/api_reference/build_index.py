@@ -5,15 +5,15 @@ index_file = (
     "docs/source/api_reference/index.rst"  # Update with the actual path if different
 )
 
-# Fetch all .rst files in api_reference directory
-rst_files = [
-    f
-    for f in os.listdir(api_ref_dir)
-    if os.path.isfile(os.path.join(api_ref_dir, f)) and f.endswith(".rst")
-]
-
-# Exclude the index.rst file if it exists in the api_reference directory
-rst_files = [f for f in rst_files if f != "index.rst"]
+# Fetch all .rst files in api_reference directory, excluding index.rst
+with os.scandir(api_ref_dir) as entries:
+    rst_files = [
+        entry.name
+        for entry in entries
+        if entry.is_file()
+        and entry.name.endswith(".rst")
+        and entry.name != "index.rst"
+    ]
 
 # Create the toctree entry for each file
 toctree_entries = [
@@ -29,9 +29,44 @@ toctree_block = (
     "   :caption: API Reference:\n\n" + "\n".join(toctree_entries)
 )
 
-# Append or update the toctree block in index.rst
-# Note: You might want to adjust this to insert the toctree block at a specific position
-with open(index_file, "a") as index:
-    index.write(toctree_block)
+# Replace the autogenerated toctree block in index.rst, appending it if absent.
+# Only write when the content changes so Sphinx's incremental cache stays valid.
+BEGIN_MARKER = ".. BEGIN AUTOGEN"
+END_MARKER = ".. END AUTOGEN"
+
+
+def _write_if_changed(path: str, new: str) -> bool:
+    """Write new to path only if it differs from the current contents."""
+    try:
+        with open(path) as f:
+            old = f.read()
+    except FileNotFoundError:
+        old = None
+    if old == new:
+        return False
+    with open(path, "w") as f:
+        f.write(new)
+    return True
+
+
+try:
+    with open(index_file) as index:
+        index_content = index.read()
+except FileNotFoundError:
+    index_content = ""
+
+autogen_block = f"{BEGIN_MARKER}\n\n{toctree_block}\n\n{END_MARKER}\n"
+start = index_content.find(BEGIN_MARKER)
+end = index_content.find(END_MARKER, start)
+if start != -1 and end != -1:
+    end = index_content.find("\n", end)
+    end = len(index_content) if end == -1 else end + 1
+    new_content = index_content[:start] + autogen_block + index_content[end:]
+else:
+    separator = "\n" if index_content and not index_content.endswith("\n") else ""
+    new_content = index_content + separator + autogen_block
 
-print(f"Updated {index_file} with {len(rst_files)} API reference entries.")
+if _write_if_changed(index_file, new_content):
+    print(f"Updated {index_file} with {len(rst_files)} API reference entries.")
+else:
+    print(f"{index_file} is up to date.")
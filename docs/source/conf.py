@@ -18,11 +18,13 @@ release = "0.0.1"
 # templates_path = ['_templates']
 exclude_patterns = []
 
+# autodoc records each documented module's source file as a dependency, so
+# Sphinx's incremental build only re-reads API pages whose module changed.
+# build_docs.sh keeps the generated stubs untouched when their content is the same.
 extensions = [
     "sphinx.ext.autodoc",
     "sphinx.ext.napoleon",
 ]
-autosummary_generate = True
 
 
 # -- Options for HTML output -------------------------------------------------
@@ -1,3 +1,3 @@
-from ._core_types import IsDataclass
+from ._core_types import IsDataclass, is_dataclass_instance
 
-__all__ = ["IsDataclass"]
+__all__ = ["IsDataclass", "is_dataclass_instance"]
@@ -2,9 +2,17 @@ from typing import ClassVar, Protocol
 
 
 class IsDataclass(Protocol):
-    """Protocol for checking if a class is a dataclass."""
+    """Protocol for checking if a class is a dataclass.
+
+    Only intended for static type hints, use is_dataclass_instance at runtime.
+    """
 
     __dataclass_fields__: ClassVar[dict[str, str]]
 
 
+def is_dataclass_instance(obj: object) -> bool:
+    """Return True if obj is an instance of a dataclass (not a dataclass type)."""
+    return hasattr(type(obj), "__dataclass_fields__")
+
+
 CoeffType = int | float | complex
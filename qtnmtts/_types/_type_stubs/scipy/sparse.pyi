@@ -10,11 +10,16 @@ class csc_matrix:
         dtype: DTypeLike | None = None,
         copy: bool = False,
     ) -> None: ...
+    @property
+    def shape(self) -> tuple[int, int]: ...
     def get_shape(self) -> tuple[int, int]: ...
     def __mul__(self, other: float) -> Self: ...
     def __rmul__(self, other: float) -> Self: ...
     def __truediv__(self, other: float) -> Self: ...
+    def __add__(self, other: csc_matrix) -> csc_matrix: ...
+    def __sub__(self, other: csc_matrix) -> csc_matrix: ...
     def todense(self) -> NDArray[np.complex128]: ...
+    def toarray(self) -> NDArray[np.complex128]: ...
 
 class csr_matrix:
     def __init__(
@@ -28,8 +33,15 @@ class csr_matrix:
         dtype: DTypeLike | None = None,
         copy: bool = False,
     ) -> None: ...
+    @property
+    def shape(self) -> tuple[int, int]: ...
     def get_shape(self) -> tuple[int, int]: ...
     def __mul__(self, other: float) -> Self: ...
     def __rmul__(self, other: float) -> Self: ...
     def __truediv__(self, other: float) -> Self: ...
     def todense(self) -> NDArray[np.complex128]: ...
+    def toarray(self) -> NDArray[np.complex128]: ...
+
+def identity(
+    n: int, dtype: DTypeLike | None = None, format: str | None = None
+) -> csc_matrix: ...
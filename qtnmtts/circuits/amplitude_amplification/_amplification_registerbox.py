@@ -1,7 +1,7 @@
 """Amplitude amplification Oracle Class."""
 
 # from __future__ import annotations
-from pytket.circuit import QubitRegister, Qubit
+from pytket.circuit import CircBox, QubitRegister, Qubit
 from qtnmtts.circuits.core import RegisterBox, QRegMap
 from qtnmtts.circuits.lcu import LCUBox
 from qtnmtts.circuits.reflection import ReflectionBox
@@ -9,7 +9,7 @@ from qtnmtts.circuits.reflection import ReflectionBox
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class AmplificationQRegs:
     """AmplificationBox qubit registers.
 
@@ -70,9 +70,15 @@ class AmplificationBox(RegisterBox):
         # W
         iter_circ.add_registerbox(self.lcu_box, qreg_map_w)
 
+        # Box a single iteration once and add the same box iter_num times
+        iter_circ.name = f"{self.__class__.__name__}Iteration"
+        iter_circ.flatten_registers()  # type: ignore
+        iter_box = CircBox(iter_circ)
+
         circ = self._lcu_box.initialise_circuit()
+        circ_qubits = lcu_box.qubits
         for _ in range(iter_num):
-            circ.append(iter_circ.copy())
+            circ.add_gate(iter_box, circ_qubits)  # type: ignore
 
         circ.name = self.__class__.__name__
 
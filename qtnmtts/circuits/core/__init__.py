@@ -4,7 +4,11 @@ from ._registerbox import RegisterBox
 from .register_circuit import RegisterCircuit, QRegMap
 from .qcontrol_registerbox import QControlRegisterBox, PytketQControlRegisterBox
 from .power_registerbox import PowerBox
-from .qreg_functions import extend_new_qreg_dataclass, make_qreg_dataclass
+from .qreg_functions import (
+    extend_new_qreg_dataclass,
+    make_qreg_dataclass,
+    qreg_dataclass_dict,
+)
 
 __all__ = [
     "PowerBox",
@@ -15,4 +19,5 @@ __all__ = [
     "RegisterCircuit",
     "extend_new_qreg_dataclass",
     "make_qreg_dataclass",
+    "qreg_dataclass_dict",
 ]
@@ -14,7 +14,8 @@ if TYPE_CHECKING:
     from qtnmtts.circuits.core import PowerBox
     from qtnmtts.circuits.core import QControlRegisterBox
 
-from dataclasses import is_dataclass
+from qtnmtts._types import is_dataclass_instance
+from qtnmtts.circuits.core.qreg_functions import qreg_dataclass_dict
 
 
 class RegisterBox:
@@ -66,7 +67,7 @@ class RegisterBox:
             qreg (Any): The qreg input
 
         """
-        if not is_dataclass(qreg):
+        if not is_dataclass_instance(qreg):
             raise ValueError(
                 f"qreg input must be a dataclass of \
                     QubitRegisters not type {type(qreg)}."
@@ -86,7 +87,7 @@ class RegisterBox:
                         Qubit in RegisterCircuit input."
                     )
 
-        for qreg_attr in qreg.__dict__.values():
+        for qreg_attr in qreg_dataclass_dict(qreg).values():
             if isinstance(qreg_attr, list):
                 for qreg in qreg_attr:
                     verify_qreg_in_circ(qreg)
@@ -131,7 +132,7 @@ class RegisterBox:
         self._reg_circuit.rename_units(rename_qubits)
 
         # Rename the qubit registers in the qreg dataclass
-        qreg_old_data = self._qreg.__dict__
+        qreg_old_data = qreg_dataclass_dict(self._qreg)
         new_q_registers = self._reg_circuit.q_registers
 
         qreg_new_data: dict[str, QubitRegister] = {}
@@ -1,6 +1,6 @@
 """Functions for QubitRegister dataclasses."""
 
-from dataclasses import make_dataclass
+from dataclasses import fields, make_dataclass
 from pytket.circuit import QubitRegister
 from typing import Any
 from collections.abc import Mapping
@@ -35,11 +35,28 @@ def make_qreg_dataclass(
         else:
             data_class_input.append((qreg_name, QubitRegister))
 
-    QRegs = make_dataclass(dataclass_name, data_class_input)
+    QRegs = make_dataclass(dataclass_name, data_class_input, slots=True)
     qregs = QRegs(*list(qreg_dict.values()))
     return qregs
 
 
+def qreg_dataclass_dict(qreg: Any) -> dict[str, Any]:
+    """Return the attributes of a QubitRegister dataclass as a dictionary.
+
+    Works for slotted dataclasses, which have no instance __dict__.
+
+    Args:
+    ----
+        qreg (Any): The QubitRegister dataclass.
+
+    Returns:
+    -------
+        dict[str, Any]: The attribute names and QubitRegisters of the dataclass.
+
+    """
+    return {field.name: getattr(qreg, field.name) for field in fields(qreg)}
+
+
 def extend_new_qreg_dataclass(
     data_class_name: str,
     qreg_old: Any,
@@ -68,9 +85,10 @@ def extend_new_qreg_dataclass(
         ValueError: If the attribute name already exists in the dataclass.
 
     """
+    qreg_old_data = qreg_dataclass_dict(qreg_old)
     for key in extend_attrs:
-        if key in qreg_old.__dict__.keys():
+        if key in qreg_old_data:
             raise ValueError(
                 f"QubitRegister attribute {key} already exists in {qreg_old}."
             )
-    return make_qreg_dataclass({**qreg_old.__dict__, **extend_attrs}, data_class_name)
+    return make_qreg_dataclass({**qreg_old_data, **extend_attrs}, data_class_name)
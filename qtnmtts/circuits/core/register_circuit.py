@@ -2,18 +2,14 @@
 
 from qtnmtts.circuits.core import RegisterBox
 from pytket.circuit import QubitRegister, Qubit
-from pytket._tket.circuit import Circuit, CircBox
-from dataclasses import dataclass
-from copy import deepcopy
+from pytket._tket.circuit import Circuit
 from typing import Self
 from collections.abc import Sequence
-from collections import Counter
 
 
 MAP_INPUT_TYPES = QubitRegister | Qubit | list[Qubit]
 
 
-@dataclass
 class RegisterMapElement:
     """Qubit Register Map Element.
 
@@ -38,19 +34,28 @@ class RegisterMapElement:
 
     """
 
-    box: QubitRegister | Qubit | list[Qubit]
-    circ: QubitRegister | Qubit | list[Qubit]
+    __slots__ = ("box", "circ")
 
-    def __post_init__(self):
+    def __init__(
+        self,
+        box: QubitRegister | Qubit | list[Qubit],
+        circ: QubitRegister | Qubit | list[Qubit],
+    ) -> None:
         """Initialise the RegisterMapElement."""
-        if isinstance(self.box, (QubitRegister | list)) and isinstance(
-            self.circ, (QubitRegister | list)
+        if (
+            isinstance(box, QubitRegister | list)
+            and isinstance(circ, QubitRegister | list)
+            and len(box) != len(circ)
         ):
-            if len(self.box) != len(self.circ):
-                raise ValueError(
-                    f"box qreg {self.box} and circuit qreg {self.circ} are"
-                    "not the same size"
-                )
+            raise ValueError(
+                f"box qreg {box} and circuit qreg {circ} are not the same size"
+            )
+        self.box = box
+        self.circ = circ
+
+    def __repr__(self):
+        """Return string representation of the RegisterMapElement."""
+        return f"RegisterMapElement(box={self.box!r}, circ={self.circ!r})"
 
 
 class QRegMap:
@@ -76,6 +81,15 @@ class QRegMap:
 
     """
 
+    __slots__ = (
+        "_box_qubits",
+        "_circ_qubits",
+        "_qubit_map",
+        "box_qregs",
+        "circ_qregs",
+        "items",
+    )
+
     def __init__(
         self,
         box_qregs: Sequence[QubitRegister | Qubit | list[Qubit]],
@@ -91,11 +105,12 @@ class QRegMap:
 
         self._box_qubits = self.qubit_list(box_qregs)
         self._circ_qubits = self.qubit_list(reg_circ_qregs)
+        self._qubit_map = dict(zip(self._box_qubits, self._circ_qubits, strict=True))
 
     @property
     def qubit_map(self) -> dict[Qubit, Qubit]:
         """Return the qubit map."""
-        return dict(zip(self.box_qubits, self.circ_qubits, strict=True))
+        return self._qubit_map
 
     @property
     def box_qubits(self) -> list[Qubit]:
@@ -118,10 +133,11 @@ class QRegMap:
             else:
                 qubits.append(element)
 
-        counts = Counter(qubits)
-        for item, count in counts.items():
-            if count > 1:
-                raise ValueError(f"Qubit {item} appears more than once in the input")
+        seen: set[Qubit] = set()
+        for qubit in qubits:
+            if qubit in seen:
+                raise ValueError(f"Qubit {qubit} appears more than once in the input")
+            seen.add(qubit)
 
         return qubits
 
@@ -154,30 +170,32 @@ class QRegMap:
 
     def __repr__(self):
         """Return string representation of the QRegMap."""
-        mapping_str = "\n"
+        parts = ["QRegMap (box -> circ):\n\n"]
         for item in self.items:
             if isinstance(item.box, QubitRegister) and isinstance(
                 item.circ, QubitRegister
             ):
-                mapping_str += f"QREG: {item.box.name} [{len(item.box)}] -> \
-                    {item.circ.name} [{len(item.circ)}]\n"
+                parts.append(
+                    f"QREG: {item.box.name} [{len(item.box)}] -> "
+                    f"{item.circ.name} [{len(item.circ)}]\n"
+                )
 
             elif isinstance(item.box, Qubit) and isinstance(item.circ, Qubit):
-                mapping_str += f"QUBIT: {item.box.reg_name} ({item.box.index}) -> \
-                      {item.circ.reg_name} ({item.circ.index})\n"
+                parts.append(
+                    f"QUBIT: {item.box.reg_name} ({item.box.index}) -> "
+                    f"{item.circ.reg_name} ({item.circ.index})\n"
+                )
 
             elif isinstance(item.box, list) and isinstance(item.circ, list):
-                box_qubits_str = "".join(
-                    [f"{qubit.reg_name} ({qubit.index})," for qubit in item.box]
+                box_qubits_str = ",".join(
+                    f"{qubit.reg_name} ({qubit.index})" for qubit in item.box
                 )
-                circ_qubits_str = "".join(
-                    [f"{qubit.reg_name} ({qubit.index})," for qubit in item.circ]
-                )
-                mapping_str += (
-                    f"QUBITS: {box_qubits_str[:-1]} -> {circ_qubits_str[:-1]}\n"
+                circ_qubits_str = ",".join(
+                    f"{qubit.reg_name} ({qubit.index})" for qubit in item.circ
                 )
+                parts.append(f"QUBITS: {box_qubits_str} -> {circ_qubits_str}\n")
 
-        return f"QRegMap (box -> circ):\n{mapping_str}"
+        return "".join(parts)
 
 
 class RegisterCircuit(Circuit):
@@ -222,37 +240,45 @@ class RegisterCircuit(Circuit):
             RegisterCircuit: The RegisterCircuit with the register_box added.
 
         """
+        box_qubits = register_box.qubits
+        circ_qubits = set(self.qubits)
+
         if qreg_map is None:
             # if not set(register_box.q_registers).issubset(set(self.q_registers)):
             #     raise ValueError(
             #         "register_box QubitRegisters are not a subset of "
             #         "circuit QubitRegisters of the same size"
             #     )
-            if not set(register_box.qubits).issubset(set(self.qubits)):
+            if not circ_qubits.issuperset(box_qubits):
                 raise ValueError(
                     "register_box qubits are not a subset of circuit qubits"
                 )
-            qubits = register_box.qubits
+            qubits = box_qubits
 
         else:
-            if not set(qreg_map.box_qubits).issubset(set(register_box.qubits)):
+            if not set(box_qubits).issuperset(qreg_map.box_qubits):
                 raise ValueError("qreg map box qubits are not a subset of box qubits")
 
-            if not set(qreg_map.circ_qubits).issubset(set(self.qubits)):
+            if not circ_qubits.issuperset(qreg_map.circ_qubits):
                 raise ValueError("qreg map circ qubits are not a subset of circ qubits")
 
             # Orders the map in the same order as the box qregs
             # Then form the qubit input list
+            qubits = list(map(qreg_map.qubit_map.__getitem__, box_qubits))
 
-            qubits = [qreg_map.qubit_map[q_regbox] for q_regbox in register_box.qubits]
-
-        circ = register_box.get_circuit().copy()
-        circ.flatten_registers()
-
-        self.add_gate(CircBox(circ), qubits)
+        self.add_gate(register_box.to_circbox(), qubits)
 
         return self
 
     def copy(self) -> Self:
-        """Return a copy of the RegisterCircuit."""
-        return deepcopy(self)
+        """Return a copy of the RegisterCircuit.
+
+        Circuit.copy returns a plain pytket Circuit, so the copy is built by
+        appending onto a new instance of the same class. This avoids the pickle
+        round-trip of deepcopy.
+        """
+        new = type(self)()
+        new.append(self)
+        if self.name is not None:
+            new.name = self.name
+        return new
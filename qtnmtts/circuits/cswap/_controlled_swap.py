@@ -7,7 +7,7 @@ from pytket.circuit import QubitRegister, OpType, Qubit
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class CSWAPQRegNames:
     c: Qubit
     a: list[QubitRegister]
@@ -49,8 +49,6 @@ class CSWAPRegisterBox(RegisterBox):
         if len(a_qregs) != len(b_qregs):
             raise ValueError("The number of state registers must be equal.")
 
-        n_swap_regisers = len(a_qregs)
-
         circ = RegisterCircuit(self.__class__.__name__)
         circ.add_qubit(control_qubit)
         a_qregs = [circ.add_q_register(qreg) for qreg in a_qregs]
@@ -60,8 +58,10 @@ class CSWAPRegisterBox(RegisterBox):
 
         qregs = CSWAPQRegNames(control_qubit, a_qregs, b_qregs)
 
-        for n in range(n_swap_regisers):
-            for a, b in zip(a_qregs[n], b_qregs[n], strict=True):
-                circ.add_gate(OpType.CSWAP, [control_qubit, a, b])
+        add_gate = circ.add_gate  # type: ignore
+        cswap = OpType.CSWAP
+        for a_qreg, b_qreg in zip(a_qregs, b_qregs, strict=True):
+            for a, b in zip(a_qreg, b_qreg, strict=True):
+                add_gate(cswap, [control_qubit, a, b])
 
         super().__init__(qregs, circ)
@@ -1,16 +1,19 @@
 """IndexBox class for indexed operations."""
 
+from __future__ import annotations
 from qtnmtts.circuits.core import RegisterBox, QRegMap, RegisterCircuit
 from pytket.circuit import QubitRegister
-from qtnmtts.circuits.index.method import IndexMethodBase
-from math import ceil, log2
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from qtnmtts.circuits.index.method import IndexMethodBase
 
 
 """IndexBox Baseclass for Indexed operations."""
 
 
-@dataclass
+@dataclass(slots=True)
 class IndexOpMap:
     """IndexOMap data class.
 
@@ -41,7 +44,7 @@ class IndexOpMap:
             raise ValueError("The box qubits must match the qreg map box qubits")
 
 
-@dataclass
+@dataclass(slots=True)
 class IndexOpMapRegs:
     """IndexOpMapRegs data class.
 
@@ -85,12 +88,21 @@ class IndexOperations:
         self._register_ops = register_ops
         self._q_registers = list(register_ops.keys())
 
-        self._index: list[IndexOpMapRegs] = []
-        for i in range(n_index):
-            list_data: list[IndexOpMap] = []
-            for op_map in register_ops.values():
-                list_data.append(op_map[i])
-            self._index.append(IndexOpMapRegs(list_data))
+        self._index: list[IndexOpMapRegs] = [
+            IndexOpMapRegs(list(op_maps))
+            for op_maps in zip(*register_ops.values(), strict=True)
+        ]
+
+        self._n_index = n_index
+        # Integer form of ceil(log2(n_index))
+        self._n_index_qubits = (n_index - 1).bit_length() if n_index > 1 else 0
+        self._index_qreg = QubitRegister(self._index_qreg_str, self._n_index_qubits)
+
+        n_bits = self._n_index_qubits
+        self._index_bools = tuple(
+            tuple(bool((i >> (n_bits - 1 - j)) & 1) for j in range(n_bits))
+            for i in range(n_index)
+        )
 
     def _check_input(self, register_ops: dict[QubitRegister, list[IndexOpMap]]):
         """Check the register data.
@@ -108,8 +120,9 @@ class IndexOperations:
             int: The length of the operations.
 
         """
-        len_data = len(next(iter(register_ops.values())))
-        if not all(len(sublist) == len_data for sublist in register_ops.values()):
+        ops_lists = iter(register_ops.values())
+        len_data = len(next(ops_lists))
+        if not all(len(sublist) == len_data for sublist in ops_lists):
             raise ValueError("All target qreg operations must have the same length")
         return len_data
 
@@ -121,17 +134,17 @@ class IndexOperations:
     @property
     def n_index_qubits(self) -> int:
         """Return the number of index qubits."""
-        return int(ceil(log2(len(self.index))))
+        return self._n_index_qubits
 
     @property
-    def index_qreg(self):
+    def index_qreg(self) -> QubitRegister:
         """Return the index qubit register."""
-        return QubitRegister(self._index_qreg_str, self.n_index_qubits)
+        return self._index_qreg
 
     @property
     def n_index(self) -> int:
         """Return the data length."""
-        return len(self.index)
+        return self._n_index
 
     @property
     def target_q_registers(self) -> list[QubitRegister]:
@@ -144,11 +157,9 @@ class IndexOperations:
         return self._register_ops
 
     @property
-    def index_bools(self) -> list[list[bool]]:
-        """Return the index boolean list."""
-        from qtnmtts.circuits.utils import int_to_bits
-
-        return [int_to_bits(i, self.n_index_qubits) for i in range(self.n_index)]
+    def index_bools(self) -> tuple[tuple[bool, ...], ...]:
+        """Return the big-endian bit string of each index."""
+        return self._index_bools
 
 
 class IndexBox(RegisterBox):
@@ -10,10 +10,11 @@ from typing import Any, TYPE_CHECKING
 from qtnmtts.circuits.core import RegisterCircuit
 
 if TYPE_CHECKING:
+    from qtnmtts.circuits.core import RegisterBox
     from qtnmtts.circuits.index import IndexOperations
 
 
-@dataclass
+@dataclass(slots=True)
 class IndexQRegs:
     """QROMBox qubit registers.
 
@@ -55,3 +56,12 @@ class IndexMethodBase(ABC):
     def has_work(self) -> bool:
         """Return True if the index method has a work register."""
         pass
+
+    @staticmethod
+    def _is_identity(box: RegisterBox) -> bool:
+        """Return True if the box has no gates and no phase.
+
+        Controlling such a box is the identity, so index methods skip it.
+        """
+        reg_circuit = box.reg_circuit
+        return reg_circuit.n_gates == 0 and not reg_circuit.phase
@@ -8,10 +8,11 @@ from typing import Any, TYPE_CHECKING
 from dataclasses import dataclass
 
 if TYPE_CHECKING:
+    from qtnmtts.circuits.core import RegisterBox, QControlRegisterBox
     from qtnmtts.circuits.index import IndexOperations
 
 
-@dataclass
+@dataclass(slots=True)
 class IndexDefaultQRegs:
     """IndexDault Method qubit registers.
 
@@ -74,11 +75,20 @@ class IndexDefault(IndexMethodBase):
 
         self._qregs = IndexDefaultQRegs(index_qreg, indexed_ops.target_q_registers)
 
+        # The same box can be indexed on several target registers, only
+        # build its controlled box once per index
+        qc_boxes: dict[tuple[RegisterBox, int], QControlRegisterBox] = {}
         for i, operation in enumerate(indexed_ops.index):
             for reg_operation in operation.op_map_reg:
-                qc_box = reg_operation.box.qcontrol(
-                    indexed_ops.n_index_qubits, control_index=i
-                )
+                if self._is_identity(reg_operation.box):
+                    continue
+                key = (reg_operation.box, i)
+                qc_box = qc_boxes.get(key)
+                if qc_box is None:
+                    qc_box = reg_operation.box.qcontrol(
+                        indexed_ops.n_index_qubits, control_index=i
+                    )
+                    qc_boxes[key] = qc_box
                 qreg_map = QRegMap(
                     [qc_box.qreg.control, reg_operation.targ_qreg_map.box_qubits],
                     [index_qreg, reg_operation.targ_qreg_map.circ_qubits],
@@ -9,6 +9,8 @@ from pytket._tket.circuit import Circuit
 from pytket.circuit import QubitRegister
 from typing import Any, TYPE_CHECKING
 from dataclasses import dataclass
+from itertools import pairwise
+import numpy as np
 
 
 if TYPE_CHECKING:
@@ -16,7 +18,7 @@ if TYPE_CHECKING:
     from qtnmtts.circuits.index import IndexOpMapRegs
 
 
-@dataclass
+@dataclass(slots=True)
 class IndexUnaryItQRegs:
     """Unary Iteration qubit registers."""
 
@@ -25,6 +27,41 @@ class IndexUnaryItQRegs:
     target: list[QubitRegister]
 
 
+_TOFFOLI_NAMES = {
+    (False, False): "Toffoli(0, 0)",
+    (False, True): "Toffoli(0, 1)",
+    (True, False): "Toffoli(1, 0)",
+    (True, True): "Toffoli(1, 1)",
+}
+
+
+def _pack_index_bools(
+    index_bools: tuple[tuple[bool, ...], ...], n_bits: int
+) -> tuple[list[int], list[int]]:
+    """Pack the index bit strings into ints and find their first different bits.
+
+    Bit q of each packed int is the bool of index qubit q. The first different bit
+    between index_bools[i] and index_bools[i+1] is the lowest set bit of their XOR,
+    it is used to calculate the cascade up and down for each index.
+
+    Args:
+    ----
+        index_bools (tuple[tuple[bool, ...], ...]): The bit string of each index.
+        n_bits (int): The number of bits in each bit string.
+
+    Returns:
+    -------
+        The packed bit strings and the first different bit of each adjacent pair.
+
+    """
+    bit_weights = 1 << np.arange(n_bits, dtype=np.int64)
+    packed: list[int] = (
+        np.asarray(index_bools, dtype=np.int64).reshape(-1, n_bits) @ bit_weights
+    ).tolist()
+    first_diff = [((a ^ b) & -(a ^ b)).bit_length() - 1 for a, b in pairwise(packed)]
+    return packed, first_diff
+
+
 class IndexUnaryIteration(IndexMethodBase):
     """Index circuit with unary iteration.
 
@@ -56,18 +93,33 @@ class IndexUnaryIteration(IndexMethodBase):
             circuit. default - CCX gate.dagger.
 
         """
-        if toffoli is None and uncompute_toffoli is None:
-            self._toffoli = CircBox(Circuit(3).CCX(0, 1, 2))
-            self._uncompute_toffoli: Op = self._toffoli.dagger
-        elif toffoli is not None and uncompute_toffoli is None:
-            self._toffoli = toffoli
-            self._uncompute_toffoli: Op = toffoli.dagger
-        elif toffoli is not None and uncompute_toffoli is not None:
-            self._toffoli = toffoli
-            self._uncompute_toffoli = uncompute_toffoli
-        elif toffoli is None and uncompute_toffoli is not None:
+        if toffoli is None and uncompute_toffoli is not None:
             raise ValueError("Provide toffoli as well as uncompute_toffoli")
 
+        # the only place the toffoli is daggered, the indexed variants below
+        # reuse these two Ops
+        self._toffoli: Op = (
+            CircBox(Circuit(3).CCX(0, 1, 2)) if toffoli is None else toffoli
+        )
+        self._uncompute_toffoli: Op = (
+            self._toffoli.dagger if uncompute_toffoli is None else uncompute_toffoli
+        )
+
+        # There are only 8 indexed toffoli variants, keyed by
+        # (uncompute, control_0, control_1), so build each CircBox once. The
+        # controls are looked up with the 0 or 1 bits of the index
+        self._index_toffolis: dict[tuple[bool, int, int], CircBox] = {
+            (uncompute, control_0, control_1): self._index_toffoli(
+                op, control_0, control_1
+            )
+            for uncompute, op in (
+                (False, self._toffoli),
+                (True, self._uncompute_toffoli),
+            )
+            for control_0 in (False, True)
+            for control_1 in (False, True)
+        }
+
     def index_circuit(
         self, indexed_ops: IndexOperations, work_qreg_str: str = "w"
     ) -> tuple[RegisterCircuit, Any]:
@@ -94,11 +146,15 @@ class IndexUnaryIteration(IndexMethodBase):
 
         self._indexed_ops = indexed_ops
 
-        self._index_qreg = circ.add_q_register(self._indexed_ops.index_qreg)
+        # the registers are kept from the typed inputs rather than the pytket
+        # add_q_register return, so the qubit lists below are typed
+        self._index_qreg = self._indexed_ops.index_qreg
+        circ.add_q_register(self._index_qreg)
 
-        self._work_qreg = circ.add_q_register(
+        self._work_qreg = QubitRegister(
             work_qreg_str, self._indexed_ops.n_index_qubits - 1
         )
+        circ.add_q_register(self._work_qreg)
         for t_qreg in self._indexed_ops.target_q_registers:
             circ.add_q_register(t_qreg)
 
@@ -106,33 +162,38 @@ class IndexUnaryIteration(IndexMethodBase):
             self._index_qreg, self._work_qreg, self._indexed_ops.target_q_registers
         )
 
-        # Calculate the different bits between index_bools[i] and index_bools[i-1]
-        # we work out the different bits so we know which part of the control condition
-        # we need to recompute
-        diffs: list[list[bool]] = []
-        for i in range(1, self._indexed_ops.n_index):
-            diffs.append(
-                [
-                    a != b
-                    for a, b in zip(
-                        self._indexed_ops.index_bools[i - 1],
-                        self._indexed_ops.index_bools[i],
-                        strict=True,
-                    )
-                ]
-            )
-
-        # get the index of the first different bits between index_bools[i]
-        # and index_bools[+1] that are used to calculate the cascade up for each index
-        self._first_diff = [diff.index(True) for diff in diffs]
+        # qubits used on every index, looked up once
+        self._index_qubits: list[Qubit] = self._index_qreg.to_list()
+        self._work_qubits: list[Qubit] = self._work_qreg.to_list()
+        self._bottom_work_qubit: Qubit = self._work_qubits[-1]
+        self._top_toffoli_qubits: list[Qubit] = [
+            self._index_qubits[0],
+            self._index_qubits[1],
+            self._work_qubits[0],
+        ]
+        # the toffoli qubits of each cascade step q_i, the top toffoli acts on
+        # index_qreg[0], index_qreg[1], work_qreg[0], the rest on
+        # work_qreg[q_i-2], index_qreg[q_i], work_qreg[q_i-1]
+        self._cascade_qubits: list[list[Qubit]] = [[], self._top_toffoli_qubits] + [
+            [
+                self._work_qubits[q_i - 2],
+                self._index_qubits[q_i],
+                self._work_qubits[q_i - 1],
+            ]
+            for q_i in range(2, self._indexed_ops.n_index_qubits)
+        ]
+
+        packed_bools, self._first_diff = _pack_index_bools(
+            self._indexed_ops.index_bools, self._indexed_ops.n_index_qubits
+        )
 
         self._bottom_q_ind = self._indexed_ops.n_index_qubits - 1
         self._last_index = self._indexed_ops.n_index - 1
 
-        for i, (operation, bools) in enumerate(
-            zip(self._indexed_ops.index, self._indexed_ops.index_bools, strict=False)
+        for i, (operation, bits) in enumerate(
+            zip(self._indexed_ops.index, packed_bools, strict=False)
         ):
-            circ = self._build_index_circ(i, circ, operation, bools)
+            circ = self._build_index_circ(i, circ, operation, bits)
 
         return circ, self._qregs
 
@@ -156,7 +217,11 @@ class IndexUnaryIteration(IndexMethodBase):
             control_qubit (Qubit): The control qubit.
 
         """
+        if not operation.op_map_reg:
+            return circ
         for reg_operation in operation.op_map_reg:
+            if self._is_identity(reg_operation.box):
+                continue
             qc_box = reg_operation.box.qcontrol(1)
             qreg_map = QRegMap(
                 [qc_box.qreg.control[0], reg_operation.targ_qreg_map.box_qubits],
@@ -178,16 +243,14 @@ class IndexUnaryIteration(IndexMethodBase):
             control_1 (bool): The second control bool.
 
         """
-        circ = Circuit(3, f"Toffoli{int(control_0), int(control_1)}")
-        if not control_0:
-            circ.X(0)
-        if not control_1:
-            circ.X(1)
+        circ = Circuit(3, _TOFFOLI_NAMES[control_0, control_1])
+        # X conjugate the controls which are on the 0 state
+        flipped = [q for q, control in ((0, control_0), (1, control_1)) if not control]
+        for q in flipped:
+            circ.X(q)
         circ.add_gate(toffoli, [0, 1, 2])
-        if not control_0:
-            circ.X(0)
-        if not control_1:
-            circ.X(1)
+        for q in flipped:
+            circ.X(q)
         return CircBox(circ)
 
     def _build_index_circ(
@@ -195,7 +258,7 @@ class IndexUnaryIteration(IndexMethodBase):
         i: int,
         circ: RegisterCircuit,
         operation: IndexOpMapRegs,
-        bools: list[bool],
+        bits: int,
     ):
         """Build the index components for the unary iteration method.
 
@@ -209,7 +272,7 @@ class IndexUnaryIteration(IndexMethodBase):
             i (int): The index of the circuit.
             circ (RegisterCircuit): The circuit to add the index to.
             operation (IndexOpMapRegs): The operation to be applied.
-            bools (list[bool]): The bit string for the index.
+            bits (int): The bit string for the index packed into an int.
 
         Returns:
         -------
@@ -218,27 +281,27 @@ class IndexUnaryIteration(IndexMethodBase):
         """
         # First index cascade down from the top qubit to the bottom qubit
         if i == 0:
-            circ = self._cascade_down(i, circ, bools)
-            circ = self._qcontrol(circ, operation, self._work_qreg.to_list()[-1])
+            circ = self._cascade_down(i, circ, bits)
+            circ = self._qcontrol(circ, operation, self._bottom_work_qubit)
         else:
             # add the adjacent AND added fist between the first diff of i and i-1
-            circ = self._adjacent_and(i, circ, bools)
+            circ = self._adjacent_and(i, circ, bits)
 
             # if first diff is not the bottom qubit then cascade down
             if self._first_diff[i - 1] != self._bottom_q_ind:
-                circ = self._cascade_down(i, circ, bools)
+                circ = self._cascade_down(i, circ, bits)
 
             # add the qcontrol to the bottom work qubit
-            circ = self._qcontrol(circ, operation, self._work_qreg.to_list()[-1])
+            circ = self._qcontrol(circ, operation, self._bottom_work_qubit)
 
             # if the first diff is the bottom qubit then cascade up
             # or if the last index
             if i == self._last_index or self._first_diff[i - 1] == self._bottom_q_ind:
-                circ = self._cascade_up(i, circ, bools)
+                circ = self._cascade_up(i, circ, bits)
 
         return circ
 
-    def _cascade_up(self, i: int, circ: RegisterCircuit, bools: list[bool]):
+    def _cascade_up(self, i: int, circ: RegisterCircuit, bits: int):
         """Cascade up the work qubits in the unary iteration method.
 
         The Cascade up finishes at the work qubit of the the first different qubit
@@ -248,7 +311,7 @@ class IndexUnaryIteration(IndexMethodBase):
         ----
             i (int): The index of the circuit.
             circ (RegisterCircuit): The circuit to add the index to.
-            bools (list[bool]): The bit string for the index.
+            bits (int): The bit string for the index packed into an int.
 
         Returns:
         -------
@@ -272,22 +335,18 @@ class IndexUnaryIteration(IndexMethodBase):
             if q_i == 1:
                 # the top Toffili is acts on index_qreg[0], index_qreg[1], work_qreg[0]
                 circ.add_gate(
-                    self._index_toffoli(self._uncompute_toffoli, bools[0], bools[1]),
-                    [self._index_qreg[0], self._index_qreg[1], self._work_qreg[0]],
+                    self._index_toffolis[True, bits & 1, (bits >> 1) & 1],
+                    self._top_toffoli_qubits,
                 )
             else:
                 # the rest is on work_qreg[q-2], index_qreg[q_i], work_qreg[q_i-1]
                 circ.add_gate(
-                    self._index_toffoli(self._uncompute_toffoli, True, bools[q_i]),
-                    [
-                        self._work_qreg[q_i - 2],
-                        self._index_qreg[q_i],
-                        self._work_qreg[q_i - 1],
-                    ],
+                    self._index_toffolis[True, True, (bits >> q_i) & 1],
+                    self._cascade_qubits[q_i],
                 )
         return circ
 
-    def _cascade_down(self, i: int, circ: RegisterCircuit, bools: list[bool]):
+    def _cascade_down(self, i: int, circ: RegisterCircuit, bits: int):
         """Cascade down the work qubits in the unary iteration method.
 
         The Cascade down starts at the work qubit of the first different qubit of j
@@ -297,7 +356,7 @@ class IndexUnaryIteration(IndexMethodBase):
         ----
             i (int): The index of the circuit.
             circ (RegisterCircuit): The circuit to add the index to.
-            bools (list[bool]): The bit string for the index.
+            bits (int): The bit string for the index packed into an int.
 
         Returns:
         -------
@@ -317,21 +376,17 @@ class IndexUnaryIteration(IndexMethodBase):
             # same logic as cascade up
             if q_i == 1:
                 circ.add_gate(
-                    self._index_toffoli(self._toffoli, bools[0], bools[1]),
-                    [self._index_qreg[0], self._index_qreg[1], self._work_qreg[0]],
+                    self._index_toffolis[False, bits & 1, (bits >> 1) & 1],
+                    self._top_toffoli_qubits,
                 )
             else:
                 circ.add_gate(
-                    self._index_toffoli(self._toffoli, True, bools[q_i]),
-                    [
-                        self._work_qreg[q_i - 2],
-                        self._index_qreg[q_i],
-                        self._work_qreg[q_i - 1],
-                    ],
+                    self._index_toffolis[False, True, (bits >> q_i) & 1],
+                    self._cascade_qubits[q_i],
                 )
         return circ
 
-    def _adjacent_and(self, i: int, circ: RegisterCircuit, bools: list[bool]):
+    def _adjacent_and(self, i: int, circ: RegisterCircuit, bits: int):
         """Add the adjacent AND to the circuit.
 
         The adjacent AND is added to the circuit for the unary iteration method.
@@ -342,7 +397,7 @@ class IndexUnaryIteration(IndexMethodBase):
         ----
             i (int): The index of the circuit.
             circ (RegisterCircuit): The circuit to add the index to.
-            bools (list[bool]): The bit string for the index.
+            bits (int): The bit string for the index packed into an int.
 
         Returns:
         -------
@@ -354,14 +409,15 @@ class IndexUnaryIteration(IndexMethodBase):
         # if the first diff is not 0 or 1 then add a CNOT between work qubits
         if self._first_diff[j] not in [0, 1]:
             circ.CX(
-                self._work_qreg[self._first_diff[j] - 2],
-                self._work_qreg[self._first_diff[j] - 1],
+                self._work_qubits[self._first_diff[j] - 2],
+                self._work_qubits[self._first_diff[j] - 1],
             )  # always 1 as work qubit
         # else if the first diff is 0 or 1 then add a CNOT between index and work qubits
         elif self._first_diff[j] == 1:
-            if bools[0] is False:
-                circ.X(self._index_qreg[0])
-            circ.CX(self._index_qreg[0], self._work_qreg[0])
-            if bools[0] is False:
-                circ.X(self._index_qreg[0])
+            index_qubit, _, work_qubit = self._top_toffoli_qubits
+            if not bits & 1:
+                circ.X(index_qubit)
+            circ.CX(index_qubit, work_qubit)
+            if not bits & 1:
+                circ.X(index_qubit)
         return circ
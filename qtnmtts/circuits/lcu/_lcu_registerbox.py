@@ -9,7 +9,7 @@ from pytket.utils.operators import QubitPauliOperator
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class LCUQRegs:
     """LCUBox qubit registers.
 
@@ -141,7 +141,7 @@ class LCUBox(RegisterBox):
         return QControlLCUBox(self, n_control, control_qreg_str, control_index)
 
 
-@dataclass
+@dataclass(slots=True)
 class QControlLCUQRegs(LCUQRegs):
     """QControlQubitiseBox registers.
 
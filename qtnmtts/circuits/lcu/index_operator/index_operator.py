@@ -2,26 +2,43 @@
 
 from pytket.circuit import Op, QubitRegister, Qubit, OpType
 from pytket.pauli import Pauli, QubitPauliString
-from pytket._tket.circuit import Circuit, Unitary1qBox
+from pytket._tket.circuit import Unitary1qBox
 from qtnmtts.circuits.index import IndexOpMap
 from pytket.utils.operators import QubitPauliOperator
-from qtnmtts.circuits.core import RegisterBox, QRegMap
-import cmath
+from qtnmtts.circuits.core import RegisterBox, RegisterCircuit, QRegMap
+from dataclasses import dataclass
+from typing import ClassVar
+from numpy.typing import NDArray
+import numpy as np
+
+
+@dataclass(slots=True)
+class SerialLCUTermQRegs:
+    """SerialLCUOperator term RegisterBox qubit registers.
+
+    Attributes
+    ----------
+        q (QubitRegister): The register the term Paulis act on (default - q)
+
+    """
+
+    q: QubitRegister
 
 
 class SerialLCUOperator:
     """Generates the op_map_list for LCU for a QubitPauliOperator.
 
-    Each term of Paulis in the QubitPauliOperator is converted to a list of phased
-    pytket Ops. Each term in the QubitPauliOperator is then converted to
-    a RegisterBox. The op_map_list is a dictionary with the state register
+    Each term of Paulis in the QubitPauliOperator is converted to a list of
+    pytket Pauli Ops and a phase. Each term in the QubitPauliOperator is then
+    converted to a RegisterBox. The op_map_list is a dictionary with the state register
     as the key and a list of IndexOpMap for each tome as the value.
     Each IndexOpMap contains the RegisterBox and the QRegMap for the term.
 
     The term is stored as a list of pytket Ops and a magnitude.
-    The phase of the coeff of the term is absorbed into the pauli Op making it
-    a general SU(2) Op. This is because in LCU the Prepare state can only be
-    positive magnitudes, so the phase is absorbed into the LCU for each term
+    The phase of the coeff of the term is added as the global phase of the term
+    circuit, which becomes a relative phase once the term is controlled. This is
+    because in LCU the Prepare state can only be positive magnitudes, so the
+    phase is absorbed into the LCU for each term
 
     Args:
     ----
@@ -30,21 +47,31 @@ class SerialLCUOperator:
 
     """
 
+    _PAULI_OPS: ClassVar[dict[Pauli, Op]] = {
+        Pauli.I: Op.create(OpType.noop),
+        Pauli.X: Op.create(OpType.X),
+        Pauli.Y: Op.create(OpType.Y),
+        Pauli.Z: Op.create(OpType.Z),
+    }
+
     def __init__(self, hamiltonian: QubitPauliOperator, n_state_qubits: int):
         """Initialise the SerialLCUOperator Class."""
-        terms_ops: list[list[Op]] = [
-            self.pauli_ops(term, coeff)  # type: ignore
-            for term, coeff in hamiltonian._dict.items()
-        ]
-        terms_qubits: list[list[Qubit]] = [
-            self.term_qubits(term) for term in hamiltonian._dict.keys()
-        ]
-
-        self._is_hermitian = all(
-            self._is_term_hermitian(coeff)  # type: ignore
-            for coeff in hamiltonian._dict.values()
+        # single pass over the terms, filling the ops, qubits and coeffs
+        n_terms = len(hamiltonian._dict)  # type: ignore
+        terms_ops: list[list[Op]] = []
+        terms_qubits: list[list[Qubit]] = []
+        coeffs = np.empty(n_terms, dtype=np.complex128)
+        for k, (term, coeff) in enumerate(hamiltonian._dict.items()):  # type: ignore
+            qubits, paulis = self._term_support(term)
+            terms_ops.append([self._PAULI_OPS[pauli] for pauli in paulis])
+            terms_qubits.append(qubits)
+            coeffs[k] = complex(coeff)
+        self._is_hermitian = self._is_hermitian_coeffs(coeffs)
+        # phase of each coeff in half turns, added as the term circuit phase
+        terms_phases = (np.angle(coeffs) / np.pi).tolist()
+        self._op_map_list = self._op_map_list(  # type: ignore
+            terms_ops, terms_phases, terms_qubits, n_state_qubits
         )
-        self._op_map_list = self._op_map_list(terms_ops, terms_qubits, n_state_qubits)  # type: ignore
 
     @property
     def op_map_list(self) -> dict[QubitRegister, list[IndexOpMap]]:
@@ -56,16 +83,22 @@ class SerialLCUOperator:
         """Return True if the operator is hermitian."""
         return self._is_hermitian
 
-    def _term_to_registerbox(self, term_ops: list[Op]) -> RegisterBox:
-        """Convert a term to a RegisterBox."""
-        circ = Circuit(len(term_ops))
-        for q, op in enumerate(term_ops):
-            circ.add_gate(op, [q])
-        return RegisterBox.from_Circuit(circ)
+    def _term_to_registerbox(self, term_ops: list[Op], phase: float) -> RegisterBox:
+        """Convert a term and its phase (in half turns) to a RegisterBox."""
+        circ = RegisterCircuit()
+        circ.add_phase(phase)
+        state_qreg = QubitRegister("q", len(term_ops))
+        circ.add_q_register(state_qreg)  # type: ignore
+        for qubit, op in zip(state_qreg, term_ops, strict=True):
+            # identity Paulis are left as empty wires
+            if op.type != OpType.noop:
+                circ.add_gate(op, [qubit])  # type: ignore
+        return RegisterBox(SerialLCUTermQRegs(state_qreg), circ)
 
     def _op_map_list(
         self,
         terms_ops: list[list[Op]],
+        terms_phases: list[float],
         terms_qubits: list[list[Qubit]],
         n_state_qubits: int,
     ) -> dict[QubitRegister, list[IndexOpMap]]:
@@ -74,6 +107,7 @@ class SerialLCUOperator:
         Args:
         ----
             terms_ops (list[list[Op]]): The list of ops for each term.
+            terms_phases (list[float]): The phase of each term in half turns.
             terms_qubits (list[list[Qubit]]): The list of qubits in each term.
             n_state_qubits (int): The number of qubits in the state register.
 
@@ -83,8 +117,10 @@ class SerialLCUOperator:
 
         """
         op_map_list: list[IndexOpMap] = []
-        for term_ops, term_qubits in zip(terms_ops, terms_qubits, strict=True):
-            reg_box = self._term_to_registerbox(term_ops)
+        for term_ops, phase, term_qubits in zip(
+            terms_ops, terms_phases, terms_qubits, strict=True
+        ):
+            reg_box = self._term_to_registerbox(term_ops, phase)
             op_map_list.append(
                 IndexOpMap(reg_box, QRegMap([reg_box.qubits], [term_qubits]))
             )
@@ -95,7 +131,9 @@ class SerialLCUOperator:
 
         The phase of the coeff of the term is absorbed into
         the first pauli Op making as a general Unitary1qBox.
-        If the term is empty then the identity is returned.
+        If the term is empty then the identity is returned. The term circuits
+        of the op_map_list do not use this, they add the phase as the global
+        phase of the circuit instead.
 
         Args:
         ----
@@ -107,22 +145,14 @@ class SerialLCUOperator:
             list[Op]: The list of phased pytket Ops.
 
         """
-        ops = {
-            Pauli.I: Op.create(OpType.noop),
-            Pauli.X: Op.create(OpType.X),
-            Pauli.Y: Op.create(OpType.Y),
-            Pauli.Z: Op.create(OpType.Z),
-        }
-
         paulis = list(term.map.values())
 
         if paulis == []:
             paulis = [Pauli.I]
 
-        pauli_ops = [ops[pauli] for pauli in paulis]
+        pauli_ops = [self._PAULI_OPS[pauli] for pauli in paulis]
 
-        _, phase = cmath.polar(coeff)
-        exp = cmath.exp(phase * 1j)
+        exp = coeff / abs(coeff) if coeff else 1 + 0j
 
         pauli_ops[0] = Unitary1qBox(pauli_ops[0].get_unitary() * exp)
 
@@ -135,13 +165,35 @@ class SerialLCUOperator:
             qubits = [Qubit(0)]
         return qubits
 
-    def _is_term_hermitian(self, coeff: complex) -> bool:
-        """Return True if the term is hermitian."""
-        _, phase = cmath.polar(coeff)
-        exp = cmath.exp(phase * 1j)
+    @staticmethod
+    def _term_support(term: QubitPauliString) -> tuple[list[Qubit], list[Pauli]]:
+        """Return the qubits and Paulis of the term without identities.
 
-        if cmath.isclose(exp, 1) or cmath.isclose(exp, -1):
-            is_hermitian = True
-        else:
-            is_hermitian = False
-        return is_hermitian
+        An identity term is kept as a single identity so the term circuit still
+        acts on a qubit.
+        """
+        qubits: list[Qubit] = []
+        paulis: list[Pauli] = []
+        for qubit, pauli in term.map.items():
+            if pauli != Pauli.I:
+                qubits.append(qubit)
+                paulis.append(pauli)
+        if not qubits:
+            qubits = list(term.map.keys())[:1] or [Qubit(0)]
+            paulis = [Pauli.I]
+        return qubits, paulis
+
+    @staticmethod
+    def _is_hermitian_coeffs(coeffs: NDArray[np.complex128]) -> bool:
+        """Return True if every coefficient has a real (+1 or -1) phase."""
+        magnitudes = np.abs(coeffs)
+        phases = np.divide(
+            coeffs, magnitudes, out=np.ones_like(coeffs), where=magnitudes != 0
+        )
+        # same tolerance as cmath.isclose
+        return bool(
+            np.all(
+                np.isclose(phases, 1, rtol=1e-9, atol=0)
+                | np.isclose(phases, -1, rtol=1e-9, atol=0)
+            )
+        )
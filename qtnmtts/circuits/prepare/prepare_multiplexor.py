@@ -2,7 +2,6 @@
 
 import numpy
 from pytket.circuit import StatePreparationBox
-from math import ceil, log2
 from qtnmtts.circuits.prepare import PrepareBox
 
 
@@ -23,15 +22,15 @@ class PrepareMultiplexorBox(PrepareBox):
 
     def __init__(self, unnorm_state: list[float], prepare_qreg_str: str = "p") -> None:
         """Initialise the PrepareCustomBox."""
-        self._l1_norm: float = sum(unnorm_state)
+        unnorm_arr = numpy.asarray(unnorm_state, dtype=numpy.float64)
+        self._l1_norm: float = float(unnorm_arr.sum())
 
-        self._lcu_state = numpy.sqrt(numpy.array(unnorm_state) / self._l1_norm).tolist()
+        full_state_nqubits = (len(unnorm_state) - 1).bit_length()
 
-        full_state_nqubits = int(ceil(log2(len(unnorm_state))))
-
-        self._lcu_state.extend(
-            (numpy.zeros((2**full_state_nqubits) - len(unnorm_state))).tolist()
-        )
+        # write the amplitudes straight into the zero padded state
+        lcu_state = numpy.zeros(2**full_state_nqubits, dtype=numpy.float64)
+        numpy.sqrt(unnorm_arr / self._l1_norm, out=lcu_state[: len(unnorm_arr)])
+        self._lcu_state = lcu_state.tolist()
 
         prepare_box = StatePreparationBox(self._lcu_state)
         super().__init__(prepare_box, prepare_qreg_str=prepare_qreg_str)
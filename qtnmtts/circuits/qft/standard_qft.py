@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from pytket.circuit import QubitRegister
 
 
-@dataclass
+@dataclass(slots=True)
 class QFTQRegs:
     """QFTBox qubit registers.
 
@@ -49,17 +49,21 @@ class QFTBox(RegisterBox):
         qft_circ = RegisterCircuit()
         qft_circ.name = "QFT"
         self._has_swaps = do_swaps
-        qreg = qft_circ.add_q_register(default_qreg_str, n_qubits)
+        qreg = QubitRegister(default_qreg_str, n_qubits)
+        qft_circ.add_q_register(qreg)
         qregs = QFTQRegs(qreg)
 
+        qubits = qreg.to_list()
+        # the CU1 angle only depends on the distance between the qubits
+        angles = [1 / (1 << d) for d in range(n_qubits)]
         for i in range(n_qubits):
-            qft_circ.H(qreg[i])
+            qft_circ.H(qubits[i])
             for j in range(i + 1, n_qubits):
-                qft_circ.CU1(1 / 2 ** (j - i), qreg[j], qreg[i])
+                qft_circ.CU1(angles[j - i], qubits[j], qubits[i])
 
         if do_swaps:
             for k in range(0, n_qubits // 2):
-                qft_circ.SWAP(qreg[k], qreg[n_qubits - k - 1])
+                qft_circ.SWAP(qubits[k], qubits[n_qubits - k - 1])
 
         self._qreg = qreg
 
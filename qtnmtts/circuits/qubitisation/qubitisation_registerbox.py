@@ -17,7 +17,7 @@ from qtnmtts.circuits.lcu import LCUBox
 from qtnmtts.circuits.reflection import ReflectionBox
 
 
-@dataclass
+@dataclass(slots=True)
 class QubitiseQRegs:
     """QubitiseBox qubit registers.
 
@@ -170,7 +170,7 @@ class QubitiseBox(RegisterBox):
             ValueError: If power is odd.
 
         """
-        if (power & (power - 1) == 0) and power != 0 and power != 1:
+        if power > 1 and not power & (power - 1):
             power_box = PowerBox(self, 2)
             power_box.qcontrol = self._qcontrol_squared
             return PowerBox(power_box, power // 2)
@@ -243,7 +243,7 @@ class QControlQubitiseBox(QControlRegisterBox):
             power (int): The power to raise the QControlQubitiseBox to.
 
         """
-        if (power & (power - 1) == 0) and power != 0 and power != 1:
+        if power > 1 and not power & (power - 1):
             qcontrol_square_box = QControlSquareQubitiseBox(
                 self._qubitise_box,
                 self._n_control,
@@ -297,26 +297,25 @@ class QControlSquareQubitiseBox(QControlRegisterBox):
             {"control": control_qreg},
         )
 
+        # both iterations apply the same boxes, so build them once
+        if control_reflection:
+            lcu_box: RegisterBox = squared_qubitise_box.lcu_box
+            reflection_box: RegisterBox = squared_qubitise_box.reflection_box.qcontrol(
+                1, control_qreg_str
+            )
+            reflection_qreg_map = QRegMap(
+                [reflection_box.qreg.reflection, reflection_box.qreg.control],
+                [qregs.prepare, qregs.control],
+            )
+        else:
+            lcu_box = squared_qubitise_box.lcu_box.qcontrol(1, control_qreg_str)
+            reflection_box = squared_qubitise_box.reflection_box
+            reflection_qreg_map = QRegMap(
+                [reflection_box.qreg.reflection], [qregs.prepare]
+            )
+
         for _ in range(2):
-            if control_reflection:
-                circ.add_registerbox(squared_qubitise_box.lcu_box)
-
-                qc_reflection_box = squared_qubitise_box.reflection_box.qcontrol(
-                    1, control_qreg_str
-                )
-                qreg_map = QRegMap(
-                    [qc_reflection_box.qreg.reflection, qc_reflection_box.qreg.control],
-                    [qregs.prepare, qregs.control],
-                )
-                circ.add_registerbox(qc_reflection_box, qreg_map)
-            else:
-                qc_lcu_box = squared_qubitise_box.lcu_box.qcontrol(1, control_qreg_str)
-                circ.add_registerbox(qc_lcu_box)
-
-                qreg_map = QRegMap(
-                    [squared_qubitise_box.reflection_box.qreg.reflection],
-                    [qregs.prepare],
-                )
-                circ.add_registerbox(squared_qubitise_box.reflection_box, qreg_map)
+            circ.add_registerbox(lcu_box)
+            circ.add_registerbox(reflection_box, reflection_qreg_map)
 
         super().__init__(squared_qubitise_box, qregs, circ, n_control, control_index)
@@ -1,6 +1,7 @@
 """Contains the ReflectionBox class."""
 
 from dataclasses import dataclass
+from functools import cache
 from pytket.circuit import OpType, QubitRegister
 from qtnmtts.circuits.core import (
     RegisterBox,
@@ -11,7 +12,7 @@ from qtnmtts.circuits.core import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class ReflectionQRegs:
     """ReflectionBox qubit registers.
 
@@ -24,6 +25,66 @@ class ReflectionQRegs:
     reflection: QubitRegister
 
 
+@cache
+def _reflection_circuit(
+    n_qubits: int, positive: bool, reflection_qreg_str: str, name: str
+) -> RegisterCircuit:
+    """Build the ReflectionBox circuit.
+
+    The circuit only depends on the arguments, so it is built once per set of
+    arguments. The returned circuit is shared and must be copied before use.
+    """
+    circ = RegisterCircuit(name)
+
+    reflection_qreg = QubitRegister(reflection_qreg_str, n_qubits)
+    circ.add_q_register(reflection_qreg)
+    qubit_list = reflection_qreg.to_list()
+
+    for p in qubit_list:
+        circ.X(p)
+
+    if n_qubits == 1:
+        circ.Z(qubit_list[0])
+    else:
+        circ.add_gate(OpType.CnZ, [*qubit_list[1:], qubit_list[0]])
+    for p in qubit_list:
+        circ.X(p)
+
+    if positive:
+        circ.add_phase(1.0)
+    return circ
+
+
+@cache
+def _qcontrol_reflection_circuit(
+    reflection_qreg: QubitRegister, positive: bool, control_qreg_str: str, name: str
+) -> RegisterCircuit:
+    """Build the QControlReflectionBox circuit.
+
+    The circuit only depends on the arguments, so it is built once per set of
+    arguments. The returned circuit is shared and must be copied before use.
+    """
+    circ = RegisterCircuit(name)
+    circ.add_q_register(reflection_qreg)
+    control_qreg = QubitRegister(control_qreg_str, 1)
+    circ.add_q_register(control_qreg)
+
+    qubit_list = reflection_qreg.to_list()
+
+    for p in qubit_list:
+        circ.X(p)
+
+    circ.add_gate(OpType.CnZ, [*qubit_list, control_qreg[0]])
+
+    for p in qubit_list:
+        circ.X(p)
+    # The following Z gate ensures that we implement the reflection at 0 and not
+    # minus the reflectation at zero.
+    if positive:
+        circ.add_gate(OpType.Z, [control_qreg[0]])
+    return circ
+
+
 class ReflectionBox(RegisterBox):
     """Constructs a ReflectionBox.
 
@@ -46,25 +107,11 @@ class ReflectionBox(RegisterBox):
         """Initialise the ReflectionBox."""
         self._positive = positive
 
-        circ = RegisterCircuit(f"{self.__repr__()}")
-
-        reflection_qreg = circ.add_q_register(reflection_qreg_str, n_qubits)
-        qreg = ReflectionQRegs(reflection_qreg)
-
-        for p in reflection_qreg.to_list():
-            circ.X(p)
-
-        if n_qubits == 1:
-            circ.Z(reflection_qreg[0])
-        else:
-            circ.add_gate(
-                OpType.CnZ, [*reflection_qreg.to_list()[1:], reflection_qreg[0]]
-            )
-        for p in reflection_qreg.to_list():
-            circ.X(p)
+        circ = _reflection_circuit(
+            n_qubits, positive, reflection_qreg_str, f"{self.__repr__()}"
+        ).copy()
 
-        if self._positive:
-            circ.add_phase(1.0)
+        qreg = ReflectionQRegs(QubitRegister(reflection_qreg_str, n_qubits))
         super().__init__(qreg, circ)
 
     @property
@@ -130,27 +177,17 @@ class QControlReflectionBox(QControlRegisterBox):
         control_index: int | None = None,
     ):
         """Initialise the QControlReflectionBox."""
-        circ = reflection_box.initialise_circuit()
-        circ.name = f"Q{1}C{self.__class__.__name__}"
-        control_qreg = circ.add_q_register(control_qreg_str, 1)
+        circ = _qcontrol_reflection_circuit(
+            reflection_box.qreg.reflection,
+            reflection_box.positive,
+            control_qreg_str,
+            f"Q{1}C{self.__class__.__name__}",
+        ).copy()
+        control_qreg = QubitRegister(control_qreg_str, 1)
 
         qregs = extend_new_qreg_dataclass(
             "QControlReflectionQRegs", reflection_box.qreg, {"control": control_qreg}
         )
 
-        for p in reflection_box.qreg.reflection.to_list():
-            circ.X(p)
-
-        circ.add_gate(
-            OpType.CnZ, [*reflection_box.qreg.reflection.to_list(), control_qreg[0]]
-        )
-
-        for p in reflection_box.qreg.reflection.to_list():
-            circ.X(p)
-        # The following Z gate ensures that we implement the reflection at 0 and not
-        # minus the reflectation at zero.
-        if reflection_box.positive:
-            circ.add_gate(OpType.Z, [control_qreg[0]])
-
         n_control = 1
         super().__init__(reflection_box, qregs, circ, n_control, control_index)
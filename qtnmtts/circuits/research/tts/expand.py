@@ -1,28 +1,218 @@
 """Module for truncated Taylor Series."""
 
 from pytket.utils.operators import QubitPauliOperator
-from pytket._tket.pauli import QubitPauliString
+from pytket._tket.pauli import QubitPauliString, Pauli
+from pytket.circuit import Qubit
+from numpy.typing import NDArray
+from typing import Any
 import numpy as np
+from math import factorial
+
+# Pauli operators in the symplectic (x, z) encoding, Y = i X Z
+_PAULI_XZ = {Pauli.I: (0, 0), Pauli.X: (1, 0), Pauli.Z: (0, 1), Pauli.Y: (1, 1)}
+_XZ_PAULI = {xz: pauli for pauli, xz in _PAULI_XZ.items()}
+
+
+def _popcount(a: NDArray[np.uint64]) -> NDArray[np.int64]:
+    """Return the number of set bits of each element (SWAR popcount)."""
+    a = a - ((a >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    a = (a & np.uint64(0x3333333333333333)) + (
+        (a >> np.uint64(2)) & np.uint64(0x3333333333333333)
+    )
+    a = (a + (a >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    return ((a * np.uint64(0x0101010101010101)) >> np.uint64(56)).astype(np.int64)
+
+
+def _to_symplectic(
+    operator: QubitPauliOperator,
+) -> tuple[list[Qubit], NDArray[np.uint64], NDArray[np.uint64], NDArray[np.complex128]]:
+    """Convert an operator to bit packed x and z vectors and coefficients.
+
+    Bit j of the x and z vectors of a term is the Pauli on qubits[j].
+    Only numeric coefficients and up to 64 qubits are supported.
+    """
+    terms: dict[QubitPauliString, complex] = {
+        term: complex(coeff)  # type: ignore
+        for term, coeff in operator._dict.items()  # type: ignore
+    }
+    qubits = sorted({qubit for term in terms for qubit in term.map})
+    if len(qubits) > 64:
+        raise ValueError("ExpQubitOper supports operators on at most 64 qubits.")
+    bit = {qubit: 1 << j for j, qubit in enumerate(qubits)}
+
+    x = np.zeros(len(terms), dtype=np.uint64)
+    z = np.zeros(len(terms), dtype=np.uint64)
+    for t, term in enumerate(terms):
+        x_t = z_t = 0
+        for qubit, pauli in term.map.items():
+            x_j, z_j = _PAULI_XZ[pauli]
+            x_t |= x_j * bit[qubit]
+            z_t |= z_j * bit[qubit]
+        x[t] = x_t
+        z[t] = z_t
+    coeffs = np.fromiter(terms.values(), dtype=np.complex128, count=len(terms))
+    return qubits, x, z, coeffs
+
+
+def _from_symplectic(
+    qubits: list[Qubit],
+    x: NDArray[np.uint64],
+    z: NDArray[np.uint64],
+    coeffs: NDArray[np.complex128],
+) -> QubitPauliOperator:
+    """Convert bit packed x and z vectors and coefficients to an operator."""
+    terms: dict[QubitPauliString, complex] = {}
+    for x_t, z_t, coeff in zip(x.tolist(), z.tolist(), coeffs.tolist(), strict=True):
+        term_qubits: list[Qubit] = []
+        paulis: list[Pauli] = []
+        for j, qubit in enumerate(qubits):
+            pauli = _XZ_PAULI[(x_t >> j) & 1, (z_t >> j) & 1]
+            if pauli != Pauli.I:
+                term_qubits.append(qubit)
+                paulis.append(pauli)
+        terms[QubitPauliString(term_qubits, paulis)] = coeff
+    return QubitPauliOperator(terms)  # type: ignore
+
+
+def _pauli_multiply_sparse(
+    x1: NDArray[np.uint64],
+    z1: NDArray[np.uint64],
+    c1: NDArray[np.complex128],
+    x2: NDArray[np.uint64],
+    z2: NDArray[np.uint64],
+    c2: NDArray[np.complex128],
+) -> tuple[NDArray[np.uint64], NDArray[np.uint64], NDArray[np.complex128]]:
+    """Multiply two operators in the symplectic encoding.
+
+    Every pair of terms is multiplied at once. With P = i^(x.z) X^x Z^z the
+    product of two terms is P1 P2 = i^t P with
+    t = x1.z1 + x2.z2 + 2 z1.x2 - x.z, where x = x1 ^ x2 and z = z1 ^ z2.
+    Terms with the same Pauli string are then summed.
+    """
+    x = (x1[:, None] ^ x2[None, :]).ravel()
+    z = (z1[:, None] ^ z2[None, :]).ravel()
+    t = (
+        _popcount(x1 & z1)[:, None]
+        + _popcount(x2 & z2)[None, :]
+        + 2 * _popcount(z1[:, None] & x2[None, :])
+    ).ravel() - _popcount(x & z)
+    coeffs = np.outer(c1, c2).ravel() * np.array([1, 1j, -1, -1j])[t % 4]
+    return _sum_duplicates(x, z, coeffs)
+
+
+def _sum_duplicates(
+    x: NDArray[np.uint64], z: NDArray[np.uint64], coeffs: NDArray[np.complex128]
+) -> tuple[NDArray[np.uint64], NDArray[np.uint64], NDArray[np.complex128]]:
+    """Sum the coefficients of the terms with the same Pauli string."""
+    xz, inverse = np.unique(np.stack([x, z], axis=1), axis=0, return_inverse=True)
+    summed = np.zeros(len(xz), dtype=np.complex128)
+    np.add.at(summed, inverse.ravel(), coeffs)
+    return xz[:, 0], xz[:, 1], summed
+
+
+def _compress(
+    x: NDArray[np.uint64],
+    z: NDArray[np.uint64],
+    coeffs: NDArray[np.complex128],
+    abs_tol: float,
+) -> tuple[NDArray[np.uint64], NDArray[np.uint64], NDArray[np.complex128]]:
+    """Zero real and imaginary parts below abs_tol and drop the zero terms.
+
+    Same as QubitPauliOperator.compress for numeric coefficients.
+    """
+    coeffs = np.where(np.abs(coeffs.real) <= abs_tol, 0, coeffs.real) + 1j * np.where(
+        np.abs(coeffs.imag) <= abs_tol, 0, coeffs.imag
+    )
+    keep = coeffs != 0
+    return x[keep], z[keep], coeffs[keep]
+
+
+def _is_symplectic_compatible(operator: QubitPauliOperator) -> bool:
+    """Return True if the operator has numeric coefficients and at most 64 qubits."""
+    terms: dict[QubitPauliString, Any] = operator._dict  # type: ignore
+    try:
+        for coeff in terms.values():
+            complex(coeff)
+    except TypeError:
+        return False
+    return len({qubit for term in terms for qubit in term.map}) <= 64
 
 
 class ExpQubitOper:
-    """Uses Taylor expansion."""
+    """Uses Taylor expansion.
+
+    For numeric coefficients on up to 64 qubits the products of the expansion are
+    computed on bit packed Pauli strings. Otherwise, e.g. for symbolic
+    coefficients, the QubitPauliOperator arithmetic is used.
+    """
 
     def __init__(self, operator: QubitPauliOperator, k: np.int64):
         """Initialise the Qubit Pauli Operator and the max order of truncation."""
         self._operator = operator  # operator is the argument of exponential
-        self._k = k  # max order of expansion
+        self._k = int(k)  # max order of expansion
 
     def taylor_expand(self) -> QubitPauliOperator:
         """Return the exponential of i times the operator."""
+        tol = 10.0**-self._k
+
+        if not _is_symplectic_compatible(self._operator):
+            exp_Op = self._taylor_expand_operator()
+            exp_Op.compress(tol)  # type: ignore
+            return exp_Op
+
+        if len(self._operator._dict) == 1:  # type: ignore
+            exp_Op = self._taylor_expand_single_term()
+            exp_Op.compress(tol)  # type: ignore
+            return exp_Op
+
+        qubits, x_op, z_op, c_op = _to_symplectic(self._operator)
+
+        # Horner's scheme S = I + H S / kk for kk = k, ..., 1, compressing each
+        # step so the working operator stays sparse
+        identity_x = np.zeros(1, dtype=np.uint64)
+        identity_c = np.ones(1, dtype=np.complex128)
+        x_s, z_s, c_s = identity_x, identity_x, identity_c
+        for kk in range(self._k, 0, -1):
+            x_s, z_s, c_s = _pauli_multiply_sparse(x_op, z_op, c_op, x_s, z_s, c_s)
+            x_s, z_s, c_s = _sum_duplicates(
+                np.concatenate([identity_x, x_s]),
+                np.concatenate([identity_x, z_s]),
+                np.concatenate([identity_c, c_s / kk]),
+            )
+            x_s, z_s, c_s = _compress(x_s, z_s, c_s, tol)
+
+        exp_Op = _from_symplectic(qubits, x_s, z_s, c_s)
+        exp_Op.compress(tol)  # type: ignore
+
+        return exp_Op  # type: ignore
+
+    def _taylor_expand_operator(self) -> QubitPauliOperator:
+        """Return the expansion using the QubitPauliOperator arithmetic."""
         exp_Op = QubitPauliOperator({QubitPauliString(): 1})
         H_k = QubitPauliOperator({QubitPauliString(): 1})
         for kk in range(self._k):
-            # print(kk)
             H_k = H_k * self._operator  # type: ignore
-            exp_Op += (1 / np.math.factorial(kk + 1)) * H_k  # type: ignore
+            exp_Op += (1 / factorial(kk + 1)) * H_k  # type: ignore
+        return exp_Op  # type: ignore
 
-        # exp_Op.map(complex)
-        exp_Op.compress(10**-self._k)  # type: ignore
+    def _taylor_expand_single_term(self) -> QubitPauliOperator:
+        """Return the expansion of a single term operator c P.
 
-        return exp_Op  # type: ignore
+        As P^2 = I the even orders sum onto the identity and the odd orders onto P.
+        """
+        ((term, coeff),) = self._operator._dict.items()  # type: ignore
+        coeff = complex(coeff)  # type: ignore
+        even = odd = 0j
+        c_j = 1 + 0j  # c^j / j!
+        for j in range(self._k + 1):
+            if j:
+                c_j *= coeff / j
+            if j % 2:
+                odd += c_j
+            else:
+                even += c_j
+
+        identity = QubitPauliString()
+        if term == identity:
+            return QubitPauliOperator({identity: even + odd})
+        return QubitPauliOperator({identity: even, term: odd})  # type: ignore
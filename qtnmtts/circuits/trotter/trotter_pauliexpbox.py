@@ -1,14 +1,17 @@
 """initialise the TrotterBox class."""
 
+from __future__ import annotations
+
 from dataclasses import dataclass
+from functools import lru_cache
 from qtnmtts.circuits.core import RegisterBox, RegisterCircuit
-from pytket.circuit import PauliExpBox, QubitRegister
-from pytket.pauli import QubitPauliString
+from pytket.circuit import PauliExpBox, Qubit, QubitRegister
+from pytket.pauli import Pauli, QubitPauliString
 from pytket.utils import QubitPauliOperator
 from sympy import Symbol  # type: ignore
 
 
-@dataclass
+@dataclass(slots=True)
 class TrotterQReg:
     """TrotterBox qubit registers.
 
@@ -21,6 +24,19 @@ class TrotterQReg:
     state: QubitRegister
 
 
+@lru_cache(maxsize=4096)
+def _pauli_string_terms(
+    pauli_string: QubitPauliString,
+) -> tuple[tuple[Qubit, ...], tuple[int, ...], tuple[Pauli, ...]]:
+    """Return the qubits, qubit indices and Paulis of a Pauli string.
+
+    Cached, as the same Pauli strings are unpacked for every Trotter step. The
+    cache is bounded so it does not keep every Pauli string for the process.
+    """
+    qubits = tuple(pauli_string.map.keys())
+    return qubits, tuple(q.index[0] for q in qubits), tuple(pauli_string.map.values())
+
+
 class PauliTerm:
     """PauliTerm class.
 
@@ -43,9 +59,10 @@ class PauliTerm:
 
     def __init__(self, pauli_string: QubitPauliString, coeff: float):
         """Initialise the PauliTerm class."""
-        self.qubits = list(pauli_string.map.keys())
-        self.q_inds = [q.index[0] for q in self.qubits]
-        self.paulis = list(pauli_string.map.values())
+        qubits, q_inds, paulis = _pauli_string_terms(pauli_string)
+        self.qubits = list(qubits)
+        self.q_inds = list(q_inds)
+        self.paulis = list(paulis)
         self.coeff = coeff
 
 
@@ -69,7 +86,8 @@ class TrotterPauliExpBox(RegisterBox):
 
     Args:
     ----
-        operator (QubitPauliOperator): The Hamiltonian to be approximated.
+        operator (QubitPauliOperator | list[PauliTerm]): The Hamiltonian to be
+            approximated, or its PauliTerms from pauli_terms.
         n_state_qubits (int): The number of qubits in the state register.
         time_slice (Symbol|float): The time slice of the Trotter step.
         state_qreg_str (str, optional): The string of the state qreg.
@@ -78,28 +96,53 @@ class TrotterPauliExpBox(RegisterBox):
 
     def __init__(
         self,
-        operator: QubitPauliOperator,
+        operator: QubitPauliOperator | list[PauliTerm],
         n_state_qubits: int,
         time_slice: float | Symbol,
         state_qreg_str: str = "q",
     ):
         """Initialise the TrotterPauliExpBox class."""
-        time_slice_op: QubitPauliOperator = operator * time_slice  # type: ignore
+        terms = operator if isinstance(operator, list) else self.pauli_terms(operator)
 
         circ = RegisterCircuit(self.__class__.__name__)
 
-        state_qreg = circ.add_q_register(state_qreg_str, n_state_qubits)
+        state_qreg = QubitRegister(state_qreg_str, n_state_qubits)
+        circ.add_q_register(state_qreg)
         qregs = TrotterQReg(state_qreg)
 
-        d = time_slice_op._dict  # type: ignore
-        paulis = [PauliTerm(pauli, coeff) for pauli, coeff in d.items()]  # type: ignore
-        for p in paulis:
-            circ.add_gate(
-                PauliExpBox(p.paulis, p.coeff), [qregs.state[i] for i in p.q_inds]
-            )
+        # construct all the boxes before adding them to the circuit
+        state_qubits = state_qreg.to_list()
+        boxes = [
+            PauliExpBox(p.paulis, p.coeff * time_slice)  # type: ignore
+            for p in terms
+        ]
+        qubit_lists = [[state_qubits[i] for i in p.q_inds] for p in terms]
+        for box, qubits in zip(boxes, qubit_lists, strict=True):
+            circ.add_gate(box, qubits)
 
         super().__init__(qregs, circ)
 
+    @staticmethod
+    def pauli_terms(operator: QubitPauliOperator) -> list[PauliTerm]:
+        """Return the PauliTerms of the operator.
+
+        The terms can be passed to the constructor to build Trotter steps for
+        several time slices without unpacking the operator each time.
+
+        Args:
+        ----
+            operator (QubitPauliOperator): The Hamiltonian to be approximated.
+
+        Returns:
+        -------
+            list[PauliTerm]: The terms of the operator.
+
+        """
+        return [
+            PauliTerm(pauli, coeff)  # type: ignore
+            for pauli, coeff in operator._dict.items()  # type: ignore
+        ]
+
     def symbol_substitution(self, symbol_map: dict[Symbol, float]):
         """Return a new TrotterPauliExpBox with symbols substituted."""
         self._reg_circuit.symbol_substitution(symbol_map)
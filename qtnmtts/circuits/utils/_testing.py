@@ -1,10 +1,9 @@
+from functools import cache
 from qtnmtts.circuits.core import RegisterBox, QRegMap
 from numpy.typing import NDArray
 import numpy as np
 from qtnmtts.measurement.utils import circuit_unitary_postselect, unitary_postselect
 from pytket.utils.operators import QubitPauliOperator
-from pytket.pauli import QubitPauliString, Pauli
-from pytket.circuit import Qubit
 
 
 def get_controlled_circ_u_postselect_ancilla(
@@ -34,7 +33,7 @@ def get_controlled_circ_u_postselect_ancilla(
     circ.add_registerbox(qc_box, qreg_map)
     circ.X(qc_box.qreg.control[0])
     circ.Ry(rotation, qc_box.qreg.control[0]).dagger()
-    post_select_dict = qc_box.register_box.postselect
+    post_select_dict = qc_box.register_box.postselect.copy()
     post_select_dict[qc_box.qreg.control[0]] = 0
     circ_u = circuit_unitary_postselect(circ, post_select_dict)
     return circ_u
@@ -65,13 +64,8 @@ def get_controlled_scipy_u(
             register_box.qubits, scipy_h, register_box.postselect.copy()
         )
     factor = np.cos(rotation * np.pi / 2) ** 2
-    scipy_u = (
-        factor * scipy_h
-        - (1 - factor)
-        * QubitPauliOperator({QubitPauliString([Qubit(0)], [Pauli.I]): 1})
-        .to_sparse_matrix(int(np.log2(scipy_h.shape[0])))
-        .todense()
-    )
+    identity = np.eye(scipy_h.shape[0], dtype=np.complex128)
+    scipy_u = factor * scipy_h - (1 - factor) * identity
     return scipy_u
 
 
@@ -82,8 +76,12 @@ def qcontrol_test(register_box: RegisterBox, atol: float):
     np.testing.assert_allclose(circ_u, scipy_u, atol=atol)
 
 
+@cache
 def qft_unitary(n_qubits: int) -> NDArray[np.complex128]:
-    """Return the unitary matrix for the n qubit Quantum Fourier transform."""
+    """Return the unitary matrix for the n qubit Quantum Fourier transform.
+
+    The matrix is cached and read only, as it is shared between tests.
+    """
     dim = 2**n_qubits
     list_of_rows: list[list[np.complex128]] = []
     for u in range(dim):
@@ -93,5 +91,11 @@ def qft_unitary(n_qubits: int) -> NDArray[np.complex128]:
         list_of_rows.append(row)
 
     qft_arr = np.array(list_of_rows)
+    qft_arr.flags.writeable = False
 
     return qft_arr
+
+
+def get_n_state_qubits(op: QubitPauliOperator) -> int:
+    """Return the number of state qubits needed by the operator qubit indices."""
+    return max(q.index[0] for pauli in op._dict for q in pauli.map) + 1  # type: ignore
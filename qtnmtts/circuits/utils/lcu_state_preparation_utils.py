@@ -1,7 +1,7 @@
 """utils functions for LCU circuits."""
 
 import string
-from typing import Any
+from itertools import pairwise
 
 import numpy as np
 from numpy.typing import NDArray
@@ -76,36 +76,25 @@ def extend_functions(
     n_qubits_basis = [int(np.ceil(np.log2(d))) for d in dims_basis_variables]
     n_qubits = [int(np.ceil(np.log2(d))) for d in dims_variables]
 
-    n_counter = 0
-
     def _get_regs(
         n_qubits_list: list[int], n_counter: int
     ) -> tuple[list[list[int]], int]:
         """Auxiliary function that computes the registers."""
-        regs: list[list[int]] = []
-        for idx in range(len(n_qubits_list)):
-            regs.append(list(range(n_counter, n_counter + n_qubits_list[idx])))
-            n_counter += n_qubits_list[idx]
-        return regs, n_counter
+        offsets = np.cumsum([n_counter, *n_qubits_list]).tolist()
+        regs = [list(range(start, stop)) for start, stop in pairwise(offsets)]
+        return regs, offsets[-1]
 
-    regs_basis, n_counter = _get_regs(n_qubits_basis, n_counter)
+    regs_basis, n_counter = _get_regs(n_qubits_basis, 0)
     regs, n_counter = _get_regs(n_qubits, n_counter)
 
     dims_basis_variables_extended: list[int] = [2**d for d in n_qubits_basis]
+    basis_slice = tuple(slice(0, d) for d in dims_basis_variables)
 
     def _get_pad(basis: NDArray[np.float64]) -> NDArray[np.float64]:
         """Auxiliary function that pads the basis elements."""
-        return np.pad(
-            basis,
-            np.array(
-                [
-                    (0, dims_basis_variables_extended[i] - dims_basis_variables[i])
-                    for i in range(len(dims_basis_variables))
-                ]
-            ),
-            mode="constant",
-            constant_values=0,
-        )
+        padded = np.zeros(dims_basis_variables_extended, dtype=basis.dtype)
+        padded[basis_slice] = basis
+        return padded
 
     m_basis_extended = _get_pad(m_basis)
     phi_basis_extended = _get_pad(phi_basis)
@@ -140,43 +129,54 @@ def create_einsum_string(n_tensors: int) -> str:
     return einsum_string
 
 
+def _random_complex(
+    shape: tuple[int, ...] | int, rng: np.random.Generator
+) -> NDArray[np.complex128]:
+    """Return uniform random magnitudes in [0, 1) with uniform random phases."""
+    coeffs = np.empty(shape, dtype=np.complex128)
+    np.exp(1j * rng.uniform(-np.pi, np.pi, shape), out=coeffs)
+    coeffs *= rng.random(shape)
+    return coeffs
+
+
 def generate_test_functions(
     dims_basis_variables: tuple[int, ...],
+    rng: np.random.Generator | None = None,
 ) -> NDArray[np.complex128]:
     """Generate test function for testing the LCUStatePreparationBox.
 
     Args:
     ----
         dims_basis_variables (tuple[int]): Dimensions of the basis variables.
+        rng (np.random.Generator): The random generator. Defaults to a new
+            np.random.default_rng().
 
     Returns:
     -------
         tuple[NDArray]: Random magnitudes and phases of the basis coefficients.
 
     """
-    f_basis = np.random.uniform(0, 1, tuple(dims_basis_variables))
-    phi_basis = np.random.uniform(-np.pi, np.pi, tuple(dims_basis_variables))
-    coeffs = f_basis * np.exp(1j * phi_basis)
-    return np.array(coeffs, dtype=np.complex128)
+    rng = np.random.default_rng() if rng is None else rng
+    return _random_complex(tuple(dims_basis_variables), rng)
 
 
 def generate_test_functions_separable(
     dims_basis_variables: tuple[int, ...],
-) -> list[NDArray[np.floating[Any]]]:
+    rng: np.random.Generator | None = None,
+) -> list[NDArray[np.complex128]]:
     """Generate test function for testing the LCUStatePreparationBox.
 
     Args:
     ----
         dims_basis_variables (tuple[int]): Dimensions of the basis variables.
+        rng (np.random.Generator): The random generator. Defaults to a new
+            np.random.default_rng().
 
     Returns:
     -------
-        tuple[NDArray]: Random magnitudes and phases of the basis coefficients.
+        list[NDArray]: Random magnitudes and phases of the basis coefficients.
 
     """
-    coeffs = [
-        np.random.uniform(0, 1, dim)
-        * np.exp(1j * np.random.uniform(-np.pi, np.pi, dim))
-        for dim in dims_basis_variables
-    ]
+    rng = np.random.default_rng() if rng is None else rng
+    coeffs = [_random_complex(dim, rng) for dim in dims_basis_variables]
     return coeffs
@@ -26,7 +26,9 @@ def block_encoded_sparse_matrix(lcu_box: LCUBox) -> csc_matrix:
 
 def int_to_bits(integer: int, length: int) -> list[bool]:
     """Convert an integer to a bit string of inputlength."""
-    return [bool(int(x)) for x in bin(integer)[2:].zfill(length)]
+    integer = int(integer)
+    n_bits = max(length, integer.bit_length(), 1)
+    return [bool((integer >> j) & 1) for j in range(n_bits - 1, -1, -1)]
 
 
 def is_hermitian(lcu_box: LCUBox) -> bool:
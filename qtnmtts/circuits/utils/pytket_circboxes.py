@@ -21,21 +21,21 @@ def phased_paulig_box(paulis: list[Pauli], phase: float) -> ConjugationBox:
         ConjugationBox: The compiled operator.
 
     """
-    compute_circ = Circuit(len(paulis))
+    n_qubits = len(paulis)
+    compute_circ = Circuit(n_qubits)
 
-    for i, pauli in enumerate(paulis):
-        if pauli == Pauli.X:
-            compute_circ.H(i)
-        elif pauli == Pauli.Y:
-            compute_circ.V(i)
-        else:
-            continue
+    x_inds = [i for i, pauli in enumerate(paulis) if pauli == Pauli.X]
+    y_inds = [i for i, pauli in enumerate(paulis) if pauli == Pauli.Y]
+    for i in x_inds:
+        compute_circ.H(i)
+    for i in y_inds:
+        compute_circ.V(i)
 
-    for q0, q1 in zip(compute_circ.qubits[:-1], compute_circ.qubits[1:], strict=True):
-        compute_circ.CX(q0, q1)
+    for i in range(n_qubits - 1):
+        compute_circ.CX(i, i + 1)
 
-    action_circ = Circuit(len(paulis))
-    action_circ.Z(len(paulis) - 1)
+    action_circ = Circuit(n_qubits)
+    action_circ.Z(n_qubits - 1)
     action_circ.Phase(phase)
 
     return ConjugationBox(CircBox(compute_circ), CircBox(action_circ))
@@ -1,10 +1,13 @@
 """Phase estimation module."""
 
+from functools import lru_cache
+from heapq import nlargest
+from operator import itemgetter
 from pytket.circuit import Qubit, QubitRegister
 from pytket._tket.circuit import Circuit
 from pytket.backends.backend import Backend
 from qtnmtts.measurement.shots import measure_distribution
-from qtnmtts.measurement.utils import dist_to_fixed_point
+from numpy.typing import NDArray
 import numpy as np
 
 
@@ -88,8 +91,33 @@ def phase_estimation_results(dist: dict[tuple[int, ...], float], positive: bool
         dict[float, float]: fixed point distribution
 
     """
-    sign = 1 if positive else -1
-    return {decimal * sign: prob for decimal, prob in dist_to_fixed_point(dist).items()}
+    decimals, probs = _fixed_point_arrays(dist)
+    if not positive:
+        decimals = -decimals
+    return dict(zip(decimals.tolist(), probs.tolist(), strict=True))
+
+
+@lru_cache(maxsize=32)
+def _fixed_point_weights(n_bits: int) -> NDArray[np.float64]:
+    """Return the read only fixed point weights 1/2, 1/4, ... of n_bits bits."""
+    weights = np.ldexp(1.0, -np.arange(1, n_bits + 1))
+    weights.flags.writeable = False
+    return weights
+
+
+def _fixed_point_arrays(
+    dist: dict[tuple[int, ...], float],
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Return the fixed point decimals and probabilities of a distribution.
+
+    The bit strings are stacked into a matrix and converted with a single
+    product with the weights 1/2, 1/4, ... of the bits.
+    """
+    n_bits = len(next(iter(dist), ()))
+    bits = np.asarray(list(dist), dtype=np.uint8).reshape(len(dist), n_bits)
+    weights = _fixed_point_weights(n_bits)
+    probs = np.fromiter(dist.values(), dtype=np.float64, count=len(dist))
+    return bits @ weights, probs
 
 
 def energy_timevo_qpe(phase: float, total_time: float):
@@ -145,7 +173,33 @@ def largest_values_dict(d: dict[float, float], n: int) -> dict[float, float]:
         dict: dictionary of n largest values
 
     """
-    return dict(sorted(d.items(), key=lambda item: item[1], reverse=True)[:n])
+    return dict(nlargest(n, d.items(), key=itemgetter(1)))
+
+
+def _largest_energies(
+    energies: NDArray[np.float64], probs: NDArray[np.float64], n: int
+) -> dict[float, float]:
+    """Return the n most probable energies.
+
+    Equal to building a dictionary of the energies and taking its n largest values,
+    so a repeated energy keeps the position of its first and the probability of its
+    last occurrence. The top n are found with a partition rather than a full sort.
+    """
+    _, first, inverse = np.unique(energies, return_index=True, return_inverse=True)
+    last = np.zeros(len(first), dtype=np.intp)
+    np.maximum.at(last, inverse.ravel(), np.arange(len(energies)))
+    order = np.argsort(first)
+    energies = energies[first[order]]
+    probs = probs[last[order]]
+
+    m = len(probs)
+    if 0 < n < m:
+        nth_largest = np.partition(probs, m - n)[m - n]
+        candidates = np.flatnonzero(probs >= nth_largest)
+    else:
+        candidates = np.arange(m)
+    top = candidates[np.argsort(-probs[candidates], kind="stable")][: max(n, 0)]
+    return dict(zip(energies[top].tolist(), probs[top].tolist(), strict=True))
 
 
 def process_timeevo_qpe_results(
@@ -171,12 +225,10 @@ def process_timeevo_qpe_results(
             with their probabilities
 
     """
-    fixedpoint_dist = phase_estimation_results(dist, positive)
-    energy_dist = {
-        energy_timevo_qpe(phase, total_time): prob
-        for phase, prob in fixedpoint_dist.items()
-    }
-    return largest_values_dict(energy_dist, n)
+    phases, probs = _fixed_point_arrays(dist)
+    if not positive:
+        phases = -phases
+    return _largest_energies(energy_timevo_qpe(phases, total_time), probs, n)  # type: ignore
 
 
 def process_qubitised_qpe_results(
@@ -202,9 +254,7 @@ def process_qubitised_qpe_results(
             with their probabilities
 
     """
-    fixedpoint_dist = phase_estimation_results(dist, positive)
-    energy_dist = {
-        energy_qubitised_qpe(phase, l1_norm): prob
-        for phase, prob in fixedpoint_dist.items()
-    }
-    return largest_values_dict(energy_dist, n)
+    phases, probs = _fixed_point_arrays(dist)
+    if not positive:
+        phases = -phases
+    return _largest_energies(energy_qubitised_qpe(phases, l1_norm), probs, n)  # type: ignore
@@ -1,12 +1,17 @@
 """Functions for measuring circuits and operators by sampling from a backend."""
 
+import json
 from pytket.circuit import Qubit
 from pytket._tket.circuit import Circuit
 from pytket._tket.unit_id import Bit
 from pytket.backends.backend import Backend
+from pytket.backends.backend import BackendResult  # type: ignore
 from pytket.pauli import QubitPauliString, Pauli
 from pytket.utils.operators import QubitPauliOperator
 from pytket.utils.distribution import ProbabilityDistribution
+from qtnmtts.measurement.utils import compile_for_backend
+from numpy.typing import NDArray
+import numpy as np
 
 
 def add_measure_post_select(
@@ -36,7 +41,7 @@ def add_measure_post_select(
     postselect_bit_ind = {
         i: postselect_bits[cbit]
         for i, cbit in enumerate(circ.bits)
-        if cbit in list(postselect_bits.keys())
+        if cbit in postselect_bits
     }
     return postselect_bit_ind, circ
 
@@ -57,10 +62,19 @@ def get_shots_distribution(
         dict[tuple[int, ...], float]: dictionary of shots distribution
 
     """
-    if not backend.valid_circuit(circ):
-        circ = backend.get_compiled_circuit(circ)
+    circ = compile_for_backend(backend, circ)
     handle = backend.process_circuit(circ, n_shots)
-    emp_dict = backend.get_result(handle).get_empirical_distribution()
+    return _shots_distribution(backend.get_result(handle))
+
+
+def _shots_distribution(result: BackendResult) -> dict[tuple[int, ...], float]:
+    """Get the distribution of shots from a backend result.
+
+    BackendResult is imported from pytket.backends.backend, as that is the type
+    Backend.get_result returns. The package stub of BackendResult only covers the
+    statevector and unitary results.
+    """
+    emp_dict = result.get_empirical_distribution()
     dist: dict[tuple[int, ...], float] = (
         ProbabilityDistribution.from_empirical_distribution(emp_dict).as_dict()  # type: ignore
     )
@@ -82,28 +96,22 @@ def post_select_distribution(
         dict[tuple[int, ...], float]: dictionary of post select shots distribution
 
     """
-    postselect_ind = list(postselect_bit_ind.keys())
-
-    list_all_ind = list(range(len(next(iter(dist.keys())))))
-
-    measure_ind = [i for i in list_all_ind if i not in postselect_ind]
-
-    post_select_on = tuple(postselect_bit_ind.values())
-
-    post_select_dist = dist.copy()
-    for k in dist.keys():
-        post_select_result = tuple([k[i] for i in postselect_ind])
-
-        if post_select_result != post_select_on:
-            post_select_dist.pop(k)
+    keys = np.asarray(list(dist), dtype=np.uint8)
+    probs = np.fromiter(dist.values(), dtype=np.float64, count=len(dist))
+    postselect_ind = np.fromiter(
+        postselect_bit_ind.keys(), dtype=np.intp, count=len(postselect_bit_ind)
+    )
+    post_select_on = np.fromiter(
+        postselect_bit_ind.values(), dtype=np.uint8, count=len(postselect_bit_ind)
+    )
+    measure_ind = np.setdiff1d(np.arange(keys.shape[1]), postselect_ind)
 
-    renorm_factor = sum(list(post_select_dist.values()))
+    mask = (keys[:, postselect_ind] == post_select_on).all(axis=1)
+    post_select_probs = probs[mask]
+    post_select_probs /= post_select_probs.sum()
 
-    post_select_dist_renorm = {
-        tuple([k[i] for i in measure_ind]): v / renorm_factor
-        for k, v in post_select_dist.items()
-    }
-    return post_select_dist_renorm
+    measured_keys: list[list[int]] = keys[mask][:, measure_ind].tolist()
+    return dict(zip(map(tuple, measured_keys), post_select_probs.tolist(), strict=True))
 
 
 def measure_distribution(
@@ -115,7 +123,7 @@ def measure_distribution(
     """Measure the circuit and get distribution.
 
     Post select on the can be done by passing a dictionary of qubit and post select
-    value.
+    value. An empty dictionary measures without post selection.
 
     Args:
     ----
@@ -130,7 +138,7 @@ def measure_distribution(
         dict[tuple[int, ...], float]: dictionary of shots distribution
 
     """
-    if post_select_dict is not None:
+    if post_select_dict:
         post_select_dict_ind, circ = add_measure_post_select(circ, post_select_dict)
         dist = get_shots_distribution(backend, circ, n_shots)
         dist = post_select_distribution(dist, post_select_dict_ind)
@@ -214,10 +222,11 @@ def expectation_from_dist(dist: dict[tuple[int, ...], float]) -> float:
         float: expectation value
 
     """
-    aritysum = 0.0
-    for row, prob in dist.items():
-        aritysum += prob * (sum(row) % 2)
-    return -2 * aritysum + 1
+    n_bits = len(next(iter(dist), ()))
+    rows = np.asarray(list(dist), dtype=np.uint8).reshape(len(dist), n_bits)
+    probs = np.fromiter(dist.values(), dtype=np.float64, count=len(dist))
+    parity = np.bitwise_xor.reduce(rows, axis=1)
+    return float(1.0 - 2.0 * (probs @ parity))
 
 
 def pauli_expectation(
@@ -276,17 +285,127 @@ def operator_expectation(
         float: operator expectation value
 
     """
-    expectation_value: complex
+    expectation_value: complex = 0
     id_string = QubitPauliString()
-    if id_string in qpo._dict:
-        expectation_value = complex(qpo[id_string])  # type: ignore
-    else:
-        expectation_value = 0
-    operator_without_id = QubitPauliOperator(
-        {p: c for p, c in qpo._dict.items() if (p != id_string)}
-    )
-    for pauli, coeff in operator_without_id._dict.items():
-        expectation_value += complex(coeff) * pauli_expectation(
-            backend, circ, pauli, n_shots, post_select_dict
+    paulis: list[QubitPauliString] = []
+    coeffs: list[complex] = []
+    for pauli, coeff in qpo._dict.items():
+        if pauli == id_string:
+            expectation_value = complex(coeff)  # type: ignore
+        else:
+            paulis.append(pauli)
+            coeffs.append(complex(coeff))  # type: ignore
+    if not paulis:
+        return expectation_value
+
+    # Compile the state preparation once, only the measurements differ per group.
+    # The compiled circuits are cached on the serialised state circuit, so measuring
+    # the same state again does not recompile them
+    circ_key = json.dumps(circ.to_dict())  # type: ignore
+    post_select_key = tuple(post_select_dict.items()) if post_select_dict else None
+    base_circ = compile_for_backend(backend, circ, circ_key)
+    if set(base_circ.qubits) != set(circ.qubits):  # type: ignore
+        # placement relabelled the qubits the paulis act on
+        base_circ = circ
+    # Build one measurement circuit per qubit-wise commuting group and submit them
+    # as one batch
+    groups = qubitwise_commuting_groups(paulis)
+    measured_circs: list[Circuit] = []
+    post_select_inds: list[dict[int, int] | None] = []
+    measured_bits: list[list[Bit]] = []
+    for basis, _ in groups:
+        measured_circ = base_circ.copy()
+        append_pauli_measurement_register(basis, measured_circ)
+        post_select_ind = None
+        if post_select_dict:
+            post_select_ind, measured_circ = add_measure_post_select(
+                measured_circ, post_select_dict
+            )
+        # bits in the order of the (post selected) distribution keys
+        circ_bits: list[Bit] = measured_circ.bits  # type: ignore
+        measured_bits.append(
+            [
+                bit
+                for i, bit in enumerate(circ_bits)
+                if post_select_ind is None or i not in post_select_ind
+            ]
+        )
+        measured_circs.append(
+            compile_for_backend(
+                backend, measured_circ, (circ_key, basis, post_select_key)
+            )
         )
-    return expectation_value
+        post_select_inds.append(post_select_ind)
+
+    handles = backend.process_circuits(measured_circs, n_shots=n_shots)
+    pauli_expectations: dict[QubitPauliString, float] = {}
+    for (_, members), result, post_select_ind, bits in zip(
+        groups,
+        backend.get_results(handles),
+        post_select_inds,
+        measured_bits,
+        strict=True,
+    ):
+        dist = _shots_distribution(result)
+        if post_select_ind is not None:
+            dist = post_select_distribution(dist, post_select_ind)
+        bit_ind = {bit: i for i, bit in enumerate(bits)}
+        selection = np.zeros((len(bits), len(members)), dtype=np.intp)
+        for j, pauli in enumerate(members):
+            for q, p in pauli.map.items():
+                if p != Pauli.I:
+                    selection[bit_ind[Bit(f"c{q.reg_name}", q.index[0])], j] = 1
+        member_expectations = _parity_expectations(dist, selection)
+        pauli_expectations.update(
+            zip(members, member_expectations.tolist(), strict=True)
+        )
+
+    expectations = np.array([pauli_expectations[p] for p in paulis])
+    return expectation_value + complex(
+        np.array(coeffs, dtype=np.complex128) @ expectations
+    )
+
+
+def qubitwise_commuting_groups(
+    paulis: list[QubitPauliString],
+) -> list[tuple[QubitPauliString, list[QubitPauliString]]]:
+    """Greedily group paulis that commute qubit-wise.
+
+    The paulis of a group agree on every qubit where they are both not the identity,
+    so they can all be measured in the basis of a single pauli string.
+
+    Args:
+    ----
+        paulis (list[QubitPauliString]): paulis to be grouped
+
+    Returns:
+    -------
+        list[tuple[QubitPauliString, list[QubitPauliString]]]: measurement basis
+            and paulis of each group
+
+    """
+    groups: list[tuple[dict[Qubit, Pauli], list[QubitPauliString]]] = []
+    for pauli in paulis:
+        pauli_map = {q: p for q, p in pauli.map.items() if p != Pauli.I}
+        for basis, members in groups:
+            if all(basis.get(q, p) == p for q, p in pauli_map.items()):
+                basis.update(pauli_map)
+                members.append(pauli)
+                break
+        else:
+            groups.append((pauli_map, [pauli]))
+    return [(QubitPauliString(basis), members) for basis, members in groups]
+
+
+def _parity_expectations(
+    dist: dict[tuple[int, ...], float], selection: NDArray[np.intp]
+) -> NDArray[np.float64]:
+    """Get the expectation values of the parities of subsets of the bits.
+
+    Column j of the selection matrix marks the bits of the j-th parity.
+    """
+    n_bits = len(next(iter(dist), ()))
+    rows = np.asarray(list(dist), dtype=np.intp).reshape(len(dist), n_bits)
+    probs = np.fromiter(dist.values(), dtype=np.float64, count=len(dist))
+    parity = (rows @ selection) & 1
+    return 1.0 - 2.0 * (probs @ parity)
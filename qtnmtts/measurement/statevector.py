@@ -1,7 +1,7 @@
 """Statevector measurement functions."""
 
 from pytket.utils.operators import QubitPauliOperator
-from qtnmtts.measurement.utils import statevector_postselect
+from qtnmtts.measurement.utils import compile_for_backend, statevector_postselect
 from pytket._tket.circuit import Circuit
 from pytket.circuit import Qubit
 from pytket.backends.backend import Backend
@@ -36,8 +36,7 @@ def operator_expectation_statevector(
     """
     qubits = state_circuit.qubits
 
-    if not backend.valid_circuit(state_circuit):
-        state_circuit = backend.get_compiled_circuit(state_circuit)
+    state_circuit = compile_for_backend(backend, state_circuit)
     try:
         # TODO: Make QPO have terms list dataclass
         coeffs: list[complex] = [complex(v) for v in operator._dict.values()]
@@ -79,8 +78,7 @@ def get_statevector_distribution(
         dict[tuple[int, ...], float]: dictionary of shots distribution
 
     """
-    if not backend.valid_circuit(state_circuit):
-        state_circuit = backend.get_compiled_circuit(state_circuit)
+    state_circuit = compile_for_backend(backend, state_circuit)
     handle = backend.process_circuit(state_circuit)
     dist = backend.get_result(handle).get_probability_distribution().as_dict()
     return dist
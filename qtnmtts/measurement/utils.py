@@ -1,11 +1,69 @@
 """Estimates the expectation value of a circuit with respect to an operator."""
 
+from collections import OrderedDict
+from collections.abc import Hashable
+from weakref import WeakKeyDictionary, ref
 from pytket.circuit import Qubit
+from pytket.backends.backend import Backend
 from pytket.backends.backendresult import BackendResult
 from numpy.typing import NDArray
 from pytket._tket.circuit import Circuit
 import numpy as np
 
+# Maximum number of compiled circuits cached per backend
+_COMPILED_CACHE_SIZE = 128
+_compiled_circuits: WeakKeyDictionary[Backend, OrderedDict[Hashable, Circuit]] = (
+    WeakKeyDictionary()
+)
+
+
+def compile_for_backend(
+    backend: Backend, circ: Circuit, key: Hashable | None = None
+) -> Circuit:
+    """Return the circuit compiled for the backend.
+
+    Valid circuits are returned unchanged. If a key is given, the compiled circuit is
+    cached per backend under the key, so compiling a circuit with the same key again
+    returns the cached circuit. The caller is responsible for the key identifying the
+    circuit. The least recently used circuits are dropped from the cache.
+
+    Each call returns a copy of the cached circuit, so changing it does not change
+    the cache. The returned circuit is not checked with valid_circuit again when it
+    is passed back in. Copy it before adding gates to it, as copies are checked.
+
+    Args:
+    ----
+        backend (Backend): backend to compile the circuit for
+        circ (Circuit): circuit to be compiled
+        key (Hashable | None): cache key of the circuit, not cached if None
+
+    Returns:
+    -------
+        Circuit: circuit valid for the backend
+
+    """
+    compiled_for = getattr(circ, "_compiled_for", None)
+    if (compiled_for is not None and compiled_for() is backend) or (
+        backend.valid_circuit(circ)
+    ):
+        return circ
+    if key is None:
+        compiled = backend.get_compiled_circuit(circ)
+    else:
+        cache = _compiled_circuits.setdefault(backend, OrderedDict())
+        cached = cache.get(key)
+        if cached is None:
+            cached = backend.get_compiled_circuit(circ)
+            cache[key] = cached
+            if len(cache) > _COMPILED_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        compiled = cached.copy()
+    # tag the returned circuit so it is not validated again, copies are untagged
+    compiled._compiled_for = ref(backend)  # type: ignore
+    return compiled
+
 
 def _reorder_qlist(
     post_select_dict: dict[Qubit, int] | list[Qubit], qlist: list[Qubit]
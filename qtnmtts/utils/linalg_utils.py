@@ -1,12 +1,33 @@
 """Basic linear algebra operations."""
 
-from itertools import product
-
 import numpy as np
 from numpy.typing import NDArray
 from scipy.sparse import csr_matrix
 
 
+def _projector_indices(
+    identity_qubits: list[int], proj_bit_string: str
+) -> NDArray[np.int64]:
+    """Return the basis states kept by the projector onto proj_bit_string.
+
+    Index i of the result is the basis state mapped to the i-th state of the
+    identity qubits, assuming the qubit ordering of get_projector_csr_matrix.
+    """
+    # TODO Allow for arbitrary ordering of projection and identity qubits.
+    # Assume certain qubit ordering:
+    # AAA'BB
+    # where AAA is the projection bitstring (here 3 qubits) and BB are qubits to
+    # keep (here 2 qubits). The following line bit shifts to the left the projection
+    # bitstring by the number of qubits to keep. The binary or then sets all
+    # combinations of lower-order bitstings for the qubits to keep, i.e. AAA is
+    # fixed, BB loops through all possible length-2 bitstrings.
+    # This could be generalised to nonconsecutive projection qubits by
+    # fixing bits at the position of each projected qubit.
+    n_qubits_to_keep = len(identity_qubits)
+    proj_bit_mask = int(proj_bit_string, 2) << n_qubits_to_keep
+    return np.arange(2**n_qubits_to_keep, dtype=np.int64) | proj_bit_mask
+
+
 def get_projector_csr_matrix(
     projection_qubits: list[int],
     identity_qubits: list[int],
@@ -49,24 +70,18 @@ def get_projector_csr_matrix(
 
     n_all_qubits = len(all_qubits)
     n_qubits_to_keep = len(identity_qubits)
-    idx_to_keep: list[int] = []
-    # TODO Allow for arbitrary ordering of projection and identity qubits.
-    # The following line bit shifts to the left the projection
-    # bitstring by the number of qubits to keep. The subsequent loop
-    # applies binary or to set all combinations of lower-order bitstings for the
-    # qubits to keep, i.e. AAA is fixed, BB loops through all possible length-2
-    # bitstrings.
-    # This could be generalised to nonconsecutive projection qubits by
-    # fixing bits at the position of each projected qubit.
-    proj_bit_mask = int(proj_bit_string, 2) << n_qubits_to_keep
-    for i in range(2**n_qubits_to_keep):
-        idx: int = i | proj_bit_mask
-        idx_to_keep.append(idx)
+    idx_to_keep = _projector_indices(identity_qubits, proj_bit_string)
 
+    # The kept rows are increasing and hold a single 1 each, in the column of
+    # their position, so the CSR arrays can be written down directly.
+    indptr = np.zeros(2**n_all_qubits + 1, dtype=np.int64)
+    indptr[idx_to_keep + 1] = 1
+    np.cumsum(indptr, out=indptr)
     return csr_matrix(
-        (
-            [1.0] * len(idx_to_keep),
-            (tuple(idx_to_keep), tuple(range(len(idx_to_keep)))),
+        (  # type: ignore
+            np.ones(idx_to_keep.size),
+            np.arange(idx_to_keep.size, dtype=np.int64),
+            indptr,
         ),
         shape=(2**n_all_qubits, 2**n_qubits_to_keep),
     )
@@ -113,25 +128,10 @@ def get_projector_matrix(
     n_all_qubits = len(all_qubits)
     n_qubits_to_keep = len(identity_qubits)
     projector = np.zeros((2**n_all_qubits, 2**n_qubits_to_keep))
-    idx_to_keep: list[int] = []
-    # Assume certain qubit ordering:
-    # AAA'BB
-    # where AAA is the projection bitstring (here 3 qubits) and BB are qubits to
-    # keep (here 2 qubits). The following line bit shifts to the left the projection
-    # bitstring by the number of qubits to keep. The subsequent loop
-    # applies binary or to set all combinations of lower-order bitstings for the
-    # qubits to keep, i.e. AAA is fixed, BB loops through all possible length-2
-    # bitstrings.
-    # This could be generalised to nonconsecutive projection qubits by
-    # fixing bits at the position of each projected qubit.
-    proj_bit_mask = int(proj_bit_string, 2) << n_qubits_to_keep
-    for i in range(2**n_qubits_to_keep):
-        idx = i | proj_bit_mask
-        idx_to_keep.append(idx)
+    idx_to_keep = _projector_indices(identity_qubits, proj_bit_string)
 
     # The projector is 1 in the rows specified by the fixed bitstring AAA.
-    for i, j in zip(idx_to_keep, range(len(idx_to_keep)), strict=True):
-        projector[i, j] = 1.0
+    projector[idx_to_keep, np.arange(idx_to_keep.size)] = 1.0
 
     return projector
 
@@ -144,8 +144,7 @@ def partial_trace(
     """Partial trace of density matrix.
 
     This function calculates the partial trace over the projection qubits
-    by summing up the projections of dmat on all bitstrings in the projection
-    register. There might be better ways to implement the partial trace...
+    by reshaping dmat and tracing out the axes of the projection register.
 
     Args:
     ----
@@ -166,18 +165,13 @@ def partial_trace(
     if len(projection_qubits) == 0:
         return dmat
     else:
-        bit_tuples = list(product(["0", "1"], repeat=len(projection_qubits)))
-        projected_dmats = np.zeros(
-            [len(bit_tuples), 2 ** len(identity_qubits), 2 ** len(identity_qubits)],
-            dtype=complex,
+        # With the qubit ordering AAA'BB of get_projector_matrix, the row and column
+        # indices of dmat split into the projection and the identity bits, and
+        # the partial trace is the trace over the projection axes.
+        # np.matrix input can not have 4 axes, so it is converted to an array first
+        dim_proj = 2 ** len(projection_qubits)
+        dim_keep = 2 ** len(identity_qubits)
+        dmat_axes = np.asarray(dmat, dtype=np.complex128).reshape(
+            dim_proj, dim_keep, dim_proj, dim_keep
         )
-        for idx in range(len(bit_tuples)):
-            bit_tuple = bit_tuples[idx]
-            bit_string = "".join(bit_tuple)
-            projector = get_projector_matrix(
-                projection_qubits, identity_qubits, proj_bit_string=bit_string
-            )
-            projected_dmats[idx] = (
-                projector.conjugate().transpose() @ dmat
-            ) @ projector
-        return np.sum(projected_dmats, axis=0)
+        return np.einsum("aiaj->ij", dmat_axes)  # type: ignore
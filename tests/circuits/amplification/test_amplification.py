@@ -12,22 +12,13 @@ from qtnmtts.circuits.amplitude_amplification._amplification_registerbox import
 )
 from pytket.utils.operators import QubitPauliOperator
 
-from pytest_lazyfixture import lazy_fixture
+from qtnmtts.circuits.utils._testing import get_n_state_qubits
 
 
-@pytest.mark.parametrize(
-    "op",
-    [
-        lazy_fixture("op_fixture"),
-    ],
-)
 def success_probability(op: QubitPauliOperator, state0: NDArray[np.complex128]):
     """Theoretical success probability and amplified one."""
-    n_state_qubits = (
-        max([p.index[0] for p_list in list(op._dict.keys()) for p in p_list.map.keys()])
-        + 1
-    )
-    op_mat = op.to_sparse_matrix(n_state_qubits).todense()
+    n_state_qubits = get_n_state_qubits(op)
+    op_mat = op.to_sparse_matrix(n_state_qubits).toarray()
     statef = op_mat @ state0
 
     alpha = sum(np.abs([np.complex128(val) for val in op._dict.values()]))
@@ -39,17 +30,11 @@ def success_probability(op: QubitPauliOperator, state0: NDArray[np.complex128]):
     ) @ state0
     success_probability_amp = np.abs((statef_amp @ statef_amp.conj().T) / alpha**2)
 
-    return lcu_success_probability.item((0, 0)), success_probability_amp.item((0, 0))
+    return lcu_success_probability.item(), success_probability_amp.item()
 
 
-@pytest.mark.parametrize(
-    "op",
-    [
-        lazy_fixture("op_fixture"),
-    ],
-)
 @pytest.mark.parametrize("AmplificationBox", [AmplificationBox])
-def test_amp_op(AmplificationBox: type, op: QubitPauliOperator):
+def test_amp_op(AmplificationBox: type, op_fixture: QubitPauliOperator):
     """Test that operator obtained from postselecting the LCU.
 
     Circuit Must be the same as the block encoded operator itself.
@@ -57,22 +42,19 @@ def test_amp_op(AmplificationBox: type, op: QubitPauliOperator):
     Args:
     ----
         AmplificationBox: The LCUBox to test.
-        op (QubitPauliOperator): The operator to test.
+        op_fixture (QubitPauliOperator): The operator to test.
 
     """
-    n_state_qubits = (
-        max([p.index[0] for p_list in list(op._dict.keys()) for p in p_list.map.keys()])
-        + 1
-    )
+    n_state_qubits = get_n_state_qubits(op_fixture)
 
     state0 = np.random.rand(2**n_state_qubits) + (
         1j * np.random.rand(2**n_state_qubits)
     )
     state0 = state0 / np.sqrt(state0.conj().T @ state0)
 
-    lcu_success_prob, amp_lcu_success_prob = success_probability(op, state0)
+    lcu_success_prob, amp_lcu_success_prob = success_probability(op_fixture, state0)
 
-    lcu_box = LCUMultiplexorBox(op, n_state_qubits)
+    lcu_box = LCUMultiplexorBox(op_fixture, n_state_qubits)
     circ_h = circuit_unitary_postselect(lcu_box.get_circuit(), lcu_box.postselect)
 
     statef = circ_h @ state0
@@ -2,22 +2,32 @@
 
 import pytest
 import numpy as np
+from numpy.typing import NDArray
 from qtnmtts.circuits.lcu import LCUMultiplexorBox
-from pytket.utils.operators import QubitPauliOperator
 from qtnmtts.circuits.core import PowerBox
-from numpy.linalg import matrix_power
-from pytest_lazyfixture import lazy_fixture
 from qtnmtts.circuits.utils._testing import qcontrol_test
 
+POWERS = [1, 2, 3, 4]
 
-@pytest.mark.parametrize(
-    "op",
-    [
-        lazy_fixture("op_fixture"),
-    ],
-)
-@pytest.mark.parametrize("power", [1, 2, 3, 4])
-def test_power_box(op: QubitPauliOperator, power: int):
+
+@pytest.fixture(scope="module")
+def lcu_unitary_powers_fixture(
+    lcu_box_fixture: LCUMultiplexorBox,
+) -> dict[int, NDArray[np.complex128]]:
+    """Fixture for the powers of the LCU unitary up to the largest tested power."""
+    scipy_u = lcu_box_fixture.get_unitary()
+    scipy_u_powers = {1: scipy_u}
+    for k in range(2, max(POWERS) + 1):
+        scipy_u_powers[k] = scipy_u_powers[k - 1] @ scipy_u
+    return scipy_u_powers
+
+
+@pytest.mark.parametrize("power", POWERS)
+def test_power_box(
+    lcu_box_fixture: LCUMultiplexorBox,
+    lcu_unitary_powers_fixture: dict[int, NDArray[np.complex128]],
+    power: int,
+):
     """Test the PowerBox.
 
     Test the unitaries of the PowerBox compared to the unitary
@@ -25,47 +35,27 @@ def test_power_box(op: QubitPauliOperator, power: int):
 
     Args:
     ----
-        op (QubitPauliOperator): QubitPauliOperator
+        lcu_box_fixture (LCUMultiplexorBox): LCU box of the operator
+        lcu_unitary_powers_fixture (dict[int, NDArray[np.complex128]]): powers of
+            the LCU unitary
         power (int): power
 
     """
-    n_state_qubits = (
-        max([p.index[0] for p_list in list(op._dict.keys()) for p in p_list.map.keys()])
-        + 1
-    )
-    lcu_box = LCUMultiplexorBox(op, n_state_qubits)
-    scipy_u = lcu_box.get_unitary()
-    scipy_u_power = matrix_power(scipy_u, power)
+    lcu_box = lcu_box_fixture
+    scipy_u_power = lcu_unitary_powers_fixture[power]
     power_box = PowerBox(lcu_box, power)
     circ_u_power = power_box.get_unitary()
     np.testing.assert_allclose(scipy_u_power, circ_u_power, atol=1e-10)
 
 
-def test_power_box_qcontrol(op_fixture: QubitPauliOperator):
+def test_power_box_qcontrol(lcu_box_fixture: LCUMultiplexorBox):
     """Test the PowerBox.qcontrol() method."""
-    n_state_qubits = (
-        max(
-            [
-                p.index[0]
-                for p_list in list(op_fixture._dict.keys())
-                for p in p_list.map.keys()
-            ]
-        )
-        + 1
-    )
-    lcu_box = LCUMultiplexorBox(op_fixture, n_state_qubits)
-    qcontrol_box = lcu_box.power(1)
+    qcontrol_box = lcu_box_fixture.power(1)
     qcontrol_test(qcontrol_box, atol=1e-10)
 
 
-@pytest.mark.parametrize(
-    "op",
-    [
-        lazy_fixture("op_fixture"),
-    ],
-)
-@pytest.mark.parametrize("power", [1, 2, 3, 4])
-def test_power_box_dagger_control(op: QubitPauliOperator, power: int):
+@pytest.mark.parametrize("power", POWERS)
+def test_power_box_dagger_control(lcu_box_fixture: LCUMultiplexorBox, power: int):
     """Test the PowerBox.dagger interaction with qcontrol.
 
     Test the unitaries of the controlled PowerBox when applying the dagger
@@ -73,15 +63,11 @@ def test_power_box_dagger_control(op: QubitPauliOperator, power: int):
 
     Args:
     ----
-        op (QubitPauliOperator): QubitPauliOperator
+        lcu_box_fixture (LCUMultiplexorBox): LCU box of the operator
         power (int): power
 
     """
-    n_state_qubits = (
-        max([p.index[0] for p_list in list(op._dict.keys()) for p in p_list.map.keys()])
-        + 1
-    )
-    lcu_box = LCUMultiplexorBox(op, n_state_qubits)
+    lcu_box = lcu_box_fixture
     power_dagger_box_qc = lcu_box.power(power).dagger.qcontrol(1)
     dagger_power_box_qc = lcu_box.dagger.power(power).qcontrol(1)
 
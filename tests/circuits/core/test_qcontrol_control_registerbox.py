@@ -13,6 +13,7 @@ from qtnmtts.circuits.core import (
     PytketQControlRegisterBox,
     QRegMap,
     QControlRegisterBox,
+    RegisterBox,
 )
 from qtnmtts.circuits.qft import QFTBox
 
@@ -20,9 +21,9 @@ from pytket.pauli import Pauli, QubitPauliString
 
 from pytket.circuit import Qubit
 
-from pytest_lazyfixture import lazy_fixture
-
 from numpy.typing import NDArray
+from typing import Any
+from scipy.sparse import identity
 
 from qtnmtts.circuits.utils import int_to_bits
 
@@ -51,37 +52,25 @@ def qcontrol_block_encode(
     circ.X(qc_box.qreg.control[0])
     circ.Ry(rotation, qc_box.qreg.control[0]).dagger()
 
-    post_select_dict = qc_box.register_box.postselect
+    post_select_dict = qc_box.register_box.postselect.copy()
     post_select_dict[qc_box.qreg.control[0]] = 0
     circ_u = circuit_unitary_postselect(circ, post_select_dict)
 
-    scipy_h = block_encoded_sparse_matrix(lcu_box).todense()
+    scipy_h = block_encoded_sparse_matrix(lcu_box)
 
     factor = np.cos(rotation * np.pi / 2) ** 2
-    scipy_u = (
-        factor * scipy_h
-        - (1 - factor)
-        * QubitPauliOperator({QubitPauliString([Qubit(0)], [Pauli.I]): 1})
-        .to_sparse_matrix(int(np.log2(scipy_h.shape[0])))
-        .todense()
+    scipy_u = factor * scipy_h - (1 - factor) * identity(
+        scipy_h.shape[0], dtype=np.complex128, format="csc"
     )
-    return circ_u, scipy_u
+    return circ_u, scipy_u.toarray()
 
 
-@pytest.mark.parametrize(
-    "op",
-    [
-        lazy_fixture("op_fixture"),
-    ],
-)
 @pytest.mark.parametrize("LCUBox", [LCUMultiplexorBox])
-def test_pytket_qcontrol_lcu(LCUBox: type, op: QubitPauliOperator):
+def test_pytket_qcontrol_lcu(
+    LCUBox: type, op_fixture: QubitPauliOperator, n_state_qubits_fixture: int
+):
     """Test the PytketQControlRegisterBix with an LCUBox."""
-    n_state_qubits = (
-        max([p.index[0] for p_list in list(op._dict.keys()) for p in p_list.map.keys()])
-        + 1
-    )
-    lcu_box = LCUBox(op, n_state_qubits)
+    lcu_box = LCUBox(op_fixture, n_state_qubits_fixture)
     n_ancilla = 1
 
     clcu_box = PytketQControlRegisterBox(lcu_box, n_ancilla)
@@ -102,9 +91,18 @@ lcu_box_test_input = LCUMultiplexorBox(
 qft_test_input = QFTBox(2)
 
 
-@pytest.mark.parametrize("register_box", [lcu_box_test_input, qft_test_input])
+@pytest.fixture(
+    scope="module", params=[lcu_box_test_input, qft_test_input], ids=["lcu", "qft"]
+)
+def test_input_fixture(request: Any) -> tuple[RegisterBox, NDArray[np.complex128]]:
+    """Fixture for a test input register box and its unitary."""
+    return request.param, request.param.get_unitary()
+
+
 @pytest.mark.parametrize("n_control", [1, 2, 3])
-def test_pytket_qcontrol_index(register_box: LCUBox, n_control: int):
+def test_pytket_qcontrol_index(
+    test_input_fixture: tuple[RegisterBox, NDArray[np.complex128]], n_control: int
+):
     """Test the control strong index of the .q_control().
 
     A test input is given for the multiplexor qcontrol method.
@@ -113,11 +111,12 @@ def test_pytket_qcontrol_index(register_box: LCUBox, n_control: int):
 
     Args:
     ----
-        register_box (LCUBox): The LCUBox.
+        test_input_fixture (tuple[RegisterBox, NDArray[np.complex128]]): The
+            register box and its unitary.
         n_control (int): The number of control qubits.
 
     """
-    reg_box_unitary = register_box.get_unitary()
+    register_box, reg_box_unitary = test_input_fixture
     for bit_index in range(2**n_control):
         bits = int_to_bits(bit_index, n_control)
         qc_reg_box = register_box.qcontrol(n_control, control_index=bit_index)
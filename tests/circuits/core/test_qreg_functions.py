@@ -3,6 +3,7 @@
 from qtnmtts.circuits.core.qreg_functions import (
     extend_new_qreg_dataclass,
     make_qreg_dataclass,
+    qreg_dataclass_dict,
 )
 from dataclasses import dataclass
 from pytket.circuit import QubitRegister
@@ -82,3 +83,29 @@ def test_extend_new_qreg_dataclass_error():
         ValueError, match="QubitRegister attribute qubits already exists in"
     ):
         extend_new_qreg_dataclass("QubitRegisterNew", qreg_old, extend_attrs)
+
+
+@dataclass(slots=True)
+class QubitRegisterSlots:
+    """Slotted Qubit Register test."""
+
+    a: QubitRegister
+    b: list[QubitRegister]
+
+
+def test_qreg_dataclass_dict_slots():
+    """Test qreg_dataclass_dict and extend_new_qreg_dataclass on slotted dataclasses."""
+    qreg_old = QubitRegisterSlots(
+        QubitRegister("a", 2), [QubitRegister("b", 1), QubitRegister("c", 1)]
+    )
+    assert qreg_dataclass_dict(qreg_old) == {"a": qreg_old.a, "b": qreg_old.b}
+
+    new_qreg: Any = extend_new_qreg_dataclass(
+        "QubitRegisterNew", qreg_old, {"d": QubitRegister("d", 3)}
+    )
+    assert not hasattr(new_qreg, "__dict__")
+    assert qreg_dataclass_dict(new_qreg) == {
+        "a": qreg_old.a,
+        "b": qreg_old.b,
+        "d": QubitRegister("d", 3),
+    }
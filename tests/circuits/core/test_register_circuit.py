@@ -1,14 +1,25 @@
 """Test OracleCircuit class."""
 
-from qtnmtts.circuits.core import RegisterCircuit, QRegMap
+from qtnmtts.circuits.core import RegisterBox, RegisterCircuit, QRegMap
 from pytket.circuit import Qubit
 from pytket._tket.circuit import Circuit
+from pytket.passes import RenameQubitsPass
 from pytket.circuit import QubitRegister
 from qtnmtts.circuits.lcu import LCUMultiplexorBox
 from qtnmtts.operators import ising_model
 import pytest
 
 
+@pytest.fixture(scope="module")
+def ising_lcu_box_fixture() -> LCUMultiplexorBox:
+    """Fixture for the LCUMultiplexorBox of the 3 qubit Ising model."""
+    n_state_qubits = 3
+    h = 1
+    j = 1
+    ising_model_3q = ising_model(3, h, j)
+    return LCUMultiplexorBox(ising_model_3q, n_state_qubits)
+
+
 def _get_qreg_pairs(
     n_fregisters: int, n_gregisters: int, f_size: int, g_size: int
 ) -> tuple[list[QubitRegister], list[QubitRegister]]:
@@ -54,55 +65,49 @@ def test_qreg_map_duplicate_error():
     ["state", "psi"],
 )
 @pytest.mark.parametrize("string1", ["a", "b"])
-def test_add_registerbox(string0: str, string1: str):
+def test_add_registerbox(
+    string0: str, string1: str, ising_lcu_box_fixture: LCUMultiplexorBox
+):
     """Test add_registerbox method."""
     init_circ = RegisterCircuit()
     x = init_circ.add_q_register(string0, 3)
     y = init_circ.add_q_register(string1, 3)
 
-    n_state_qubits = 3
-    h = 1
-    j = 1
-    ising_model_3q = ising_model(3, h, j)
-
-    lcu_box = LCUMultiplexorBox(ising_model_3q, n_state_qubits)
+    # only the qubit mapping is tested, so an empty box with the registers of the
+    # LCU box is enough
+    register_box = RegisterBox.from_Circuit(ising_lcu_box_fixture.initialise_circuit())
 
     # Test from list QubitRegister
     circ = init_circ.copy()
-    map = QRegMap(lcu_box.q_registers, circ.q_registers)
-    circ.add_registerbox(lcu_box, map)
+    map = QRegMap(register_box.q_registers, circ.q_registers)
+    circ.add_registerbox(register_box, map)
 
     assert circ.qubits == [*y, *x]
 
     # Test from dict - QubitRegister
     circ = init_circ.copy()
     map = QRegMap.from_dict(
-        dict(zip(lcu_box.q_registers, circ.q_registers, strict=True))
+        dict(zip(register_box.q_registers, circ.q_registers, strict=True))
     )
-    circ.add_registerbox(lcu_box, map)
+    circ.add_registerbox(register_box, map)
 
     assert circ.qubits == [*y, *x]
 
     # Test from list[Qubit]
     circ = init_circ.copy()
 
-    box_q_list = [qreg.to_list() for qreg in lcu_box.q_registers]
+    box_q_list = [qreg.to_list() for qreg in register_box.q_registers]
     circ_q_list = [qreg.to_list() for qreg in circ.q_registers]
 
     circ = init_circ.copy()
     map = QRegMap(box_q_list, circ_q_list)
-    circ.add_registerbox(lcu_box, map)
+    circ.add_registerbox(register_box, map)
     assert circ.qubits == [*y, *x]
 
 
-def test_add_registerbox_noqregmap():
+def test_add_registerbox_noqregmap(ising_lcu_box_fixture: LCUMultiplexorBox):
     """Test add_registerbox method without QReg."""
-    n_state_qubits = 3
-    h = 1
-    j = 1
-    ising_model_3q = ising_model(3, h, j)
-
-    lcu_box = LCUMultiplexorBox(ising_model_3q, n_state_qubits)
+    lcu_box = ising_lcu_box_fixture
 
     # adds to a subset of the circuit qubits with the same name
     circ = lcu_box.initialise_circuit()
@@ -127,7 +132,9 @@ def test_add_registerbox_noqregmap():
     ["state", "psi"],
 )
 @pytest.mark.parametrize("string1", ["a", "b"])
-def test_add_registerbox_subset_error(string0: str, string1: str):
+def test_add_registerbox_subset_error(
+    ising_lcu_box_fixture: LCUMultiplexorBox, string0: str, string1: str
+):
     """Test add_registerbox method errors."""
     init_circ = RegisterCircuit()
     init_circ.add_q_register(string0, 3)
@@ -137,12 +144,7 @@ def test_add_registerbox_subset_error(string0: str, string1: str):
     m = error_circ.add_q_register("m", 3)
     n = error_circ.add_q_register("n", 3)
 
-    n_state_qubits = 3
-    h = 1
-    j = 1
-    ising_model_3q = ising_model(3, h, j)
-
-    lcu_box = LCUMultiplexorBox(ising_model_3q, n_state_qubits)
+    lcu_box = ising_lcu_box_fixture
 
     circ = init_circ.copy()
     map = QRegMap([m, n], circ.q_registers)
@@ -170,3 +172,42 @@ def test_qreg_map_from_QRegMap_list():
         *qreg_map_list[0].circ_qubits,
         *qreg_map_list[1].circ_qubits,
     ]
+
+
+def test_add_registerbox_renamed_qubits():
+    """Test add_registerbox after the circuit qubits are renamed by a pass."""
+    p = QubitRegister("p", 1)
+    box_circ = Circuit()
+    box_circ.add_q_register(p)  # type: ignore
+    register_box = RegisterBox.from_Circuit(box_circ)
+
+    q = QubitRegister("q", 1)
+    circ = RegisterCircuit()
+    circ.add_q_register(q)  # type: ignore
+    circ.add_registerbox(register_box, QRegMap([p], [q]))
+
+    # the pass renames the qubits in place, bypassing the RegisterCircuit methods
+    r = QubitRegister("r", 1)
+    RenameQubitsPass({q[0]: r[0]}).apply(circ)
+
+    circ.add_registerbox(register_box, QRegMap([p], [r]))
+    assert circ.qubits == [r[0]]  # type: ignore
+
+    with pytest.raises(ValueError, match="qreg map circ qubits are not a subset"):
+        circ.add_registerbox(register_box, QRegMap([p], [q]))
+
+
+def test_add_registerbox_after_box_circuit_change():
+    """Test add_registerbox uses the current circuit of the register_box."""
+    p = QubitRegister("p", 1)
+    box_circ = Circuit()
+    box_circ.add_q_register(p)  # type: ignore
+    register_box = RegisterBox.from_Circuit(box_circ)
+
+    circ = register_box.initialise_circuit()
+    circ.add_registerbox(register_box)
+
+    register_box.reg_circuit.X(p[0])  # type: ignore
+    circ.add_registerbox(register_box)
+
+    assert circ.get_statevector()[1] == pytest.approx(1)  # type: ignore
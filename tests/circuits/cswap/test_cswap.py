@@ -1,25 +1,30 @@
 """Tests for the amplitude amplification circuit implementation."""
 
+from functools import reduce
 import pytest
 import numpy as np
 from numpy.typing import NDArray
 
 
-from qtnmtts.circuits.core import RegisterBox
+from qtnmtts.measurement.utils import circuit_statevector_postselect
 
 from pytket.circuit import StatePreparationBox
 from qtnmtts.circuits.cswap import CSWAPRegisterBox
 
 from pytket.circuit import QubitRegister, Qubit
 
-from qtnmtts.circuits.utils.linalg import kron_list
 
 # from pytket.utils.operators import QubitPauliOperator
 
 
-def swap_states(state0: NDArray[np.complex128], statef: NDArray[np.complex128]):
-    """Swap two states."""
-    return np.kron(statef, state0)
+def swap_states(
+    states_0: list[NDArray[np.complex128]], states_1: list[NDArray[np.complex128]]
+) -> NDArray[np.complex128]:
+    """Tensor product of the register states after the swap, states_1 first.
+
+    Built as a single outer product tensor which is then flattened.
+    """
+    return reduce(np.multiply.outer, [*states_1, *states_0]).ravel()
 
 
 def assert_cswap_box(n_state_qubits: int, n_registers: int):
@@ -62,13 +67,11 @@ def assert_cswap_box(n_state_qubits: int, n_registers: int):
 
     cswap_circ1.add_registerbox(cswap_box)  # NO map needed as same qregs
 
-    cswap_box1 = RegisterBox.from_Circuit(cswap_circ1)
-    cswap1_box_state = cswap_box1.get_statevector({control_qreg: 1})
-
-    state_0_kron = kron_list(states_0)
-    state_1_kron = kron_list(states_1)
+    cswap1_box_state = circuit_statevector_postselect(
+        cswap_circ1, {control_qreg: 1}, renorm=True
+    )
 
-    tensor_prod = swap_states(state_0_kron, state_1_kron)
+    tensor_prod = swap_states(states_0, states_1)
     np.testing.assert_allclose(cswap1_box_state, tensor_prod, atol=1e-10)
 
 
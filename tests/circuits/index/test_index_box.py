@@ -4,32 +4,27 @@ from pytket._tket.circuit import Circuit, CircBox
 from pytket.circuit import Qubit, QubitRegister
 from qtnmtts.circuits.core import RegisterBox, QRegMap
 import numpy as np
-from itertools import product
 import pytest
 
 from qtnmtts.circuits.index import IndexBox, IndexOpMap
 from qtnmtts.circuits.index.method import IndexDefault
-
-
-def _generate_ry_circbox(n_qubits: int):
-    """Generate a random Ry circuit."""
-    circ = Circuit(n_qubits)
-    for n in range(n_qubits):
-        circ.Ry(float(np.random.rand(1)), n)
-    return CircBox(circ)
+from qtnmtts.circuits.utils import int_to_bits
 
 
 @pytest.mark.parametrize("n_index_qubits", [1, 2, 3])
 @pytest.mark.parametrize("n_target_qubits", [1, 2, 3])
-def test_index_pytket_box(n_index_qubits: int, n_target_qubits: int):
+def test_index_pytket_box(
+    ry_register_boxes_fixture: dict[int, list[RegisterBox]],
+    n_index_qubits: int,
+    n_target_qubits: int,
+):
     """Test the IndexPytketBox."""
     # if I define the qubit register here
 
     index_method = IndexDefault()
 
     reg_box_list = [
-        RegisterBox.from_CircBox(_generate_ry_circbox(n_target_qubits))
-        for _ in range(2**n_index_qubits)
+        ry_register_boxes_fixture[n_target_qubits][i] for i in range(2**n_index_qubits)
     ]
 
     target_qreg = QubitRegister("t", n_target_qubits)
@@ -42,14 +37,12 @@ def test_index_pytket_box(n_index_qubits: int, n_target_qubits: int):
 
     index_box = IndexBox(index_method, input_reg_dict)
 
-    bit_strings = list(product([0, 1], repeat=index_box.n_index_qubits))
-
-    select_list: list[dict[Qubit, int]] = []
-    for bit_string in bit_strings:
-        post_pre_select: dict[Qubit, int] = dict(
-            zip(index_box.qreg.index, bit_string, strict=True)
-        )
-        select_list.append(post_pre_select)
+    n_index = index_box.n_index_qubits
+    index_qubits = index_box.qreg.index.to_list()
+    select_list: list[dict[Qubit, int]] = [
+        dict(zip(index_qubits, int_to_bits(bit_index, n_index), strict=True))
+        for bit_index in range(2**n_index)
+    ]
 
     for op, select in zip(reg_box_list, select_list, strict=False):
         op_unitary = op.get_unitary()
@@ -63,7 +56,10 @@ def test_index_pytket_box(n_index_qubits: int, n_target_qubits: int):
 @pytest.mark.parametrize("n_target_qubits", [2])
 @pytest.mark.parametrize("n_target_registers", [2])
 def test_index_pytket_box_2_target_qreg(
-    n_index_qubits: int, n_target_qubits: int, n_target_registers: int
+    ry_register_boxes_fixture: dict[int, list[RegisterBox]],
+    n_index_qubits: int,
+    n_target_qubits: int,
+    n_target_registers: int,
 ):
     """Test the IndexPytketBox."""
     from qtnmtts.circuits.index import IndexBox, IndexOpMap
@@ -75,10 +71,10 @@ def test_index_pytket_box_2_target_qreg(
 
     input_reg_dict: dict[QubitRegister, list[IndexOpMap]] = {}
     regs_box_list: list[list[RegisterBox]] = []
+    n_elements: int = 2**n_index_qubits
     for n in range(n_target_registers):
-        reg_box_list = [
-            RegisterBox.from_CircBox(_generate_ry_circbox(n_target_qubits))
-            for _ in range(2**n_index_qubits)
+        reg_box_list = ry_register_boxes_fixture[n_target_qubits][
+            n * n_elements : (n + 1) * n_elements
         ]
         regs_box_list.append(reg_box_list)
         target_qreg = QubitRegister(f"t{n}", n_target_qubits)
@@ -93,14 +89,12 @@ def test_index_pytket_box_2_target_qreg(
 
     index_box = IndexBox(index_method, input_reg_dict)
 
-    bit_strings = list(product([0, 1], repeat=index_box.n_index_qubits))
-
-    select_list: list[dict[Qubit, int]] = []
-    for bit_string in bit_strings:
-        post_pre_select: dict[Qubit, int] = dict(
-            zip(index_box.qreg.index, bit_string, strict=True)
-        )
-        select_list.append(post_pre_select)
+    n_index = index_box.n_index_qubits
+    index_qubits = index_box.qreg.index.to_list()
+    select_list: list[dict[Qubit, int]] = [
+        dict(zip(index_qubits, int_to_bits(bit_index, n_index), strict=True))
+        for bit_index in range(2**n_index)
+    ]
 
     for op1, op2, select in zip(
         regs_box_list[0], regs_box_list[1], select_list, strict=False
@@ -114,15 +108,14 @@ def test_index_pytket_box_2_target_qreg(
         np.testing.assert_allclose(op_unitary, ps_unitary, atol=1e-10)
 
 
-def test_check_target_input():
+def test_check_target_input(ry_register_boxes_fixture: dict[int, list[RegisterBox]]):
     """Test the _check_target_input method of IndexBox."""
     index_method = IndexDefault()
     n_index_qubits = 2
 
     n_target_qubits = 2
     reg_box_list = [
-        RegisterBox.from_CircBox(_generate_ry_circbox(n_target_qubits))
-        for _ in range(2**n_index_qubits)
+        ry_register_boxes_fixture[n_target_qubits][i] for i in range(2**n_index_qubits)
     ]
 
     target_qreg = QubitRegister("t", n_target_qubits)
@@ -138,3 +131,27 @@ def test_check_target_input():
         ValueError, match="qreg map circ qubits are not a subset of circ qubits"
     ):
         IndexBox(index_method, input_reg_dict)
+
+
+def test_index_pytket_box_skips_identity(
+    ry_register_boxes_fixture: dict[int, list[RegisterBox]],
+):
+    """Test IndexDefault adds no controlled box for an empty identity box."""
+    target_qreg = QubitRegister("t", 1)
+    reg_box_list = [
+        RegisterBox.from_CircBox(CircBox(Circuit(1))),
+        ry_register_boxes_fixture[1][0],
+    ]
+    op_map_list = [
+        IndexOpMap(reg_box, QRegMap([reg_box.qubits], [target_qreg]))
+        for reg_box in reg_box_list
+    ]
+    index_box = IndexBox(IndexDefault(), {target_qreg: op_map_list})
+
+    assert index_box.reg_circuit.n_gates == 1
+    for i, op in enumerate(reg_box_list):
+        select = {index_box.qreg.index[0]: i}
+        ps_unitary = index_box.get_unitary(
+            post_select_dict=select, pre_select_dict=select
+        )
+        np.testing.assert_allclose(op.get_unitary(), ps_unitary, atol=1e-10)
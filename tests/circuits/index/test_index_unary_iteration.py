@@ -4,19 +4,11 @@ from pytket._tket.circuit import Circuit, CircBox
 from pytket.circuit import Qubit, QubitRegister
 from qtnmtts.circuits.core import RegisterBox, QRegMap
 import numpy as np
-from itertools import product
 import pytest
 
 from qtnmtts.circuits.index import IndexBox, IndexOpMap
 from qtnmtts.circuits.index.method import IndexUnaryIteration, IndexMethodBase
-
-
-def _generate_ry_circbox(n_qubits: int):
-    """Generate a random Ry circuit."""
-    circ = Circuit(n_qubits)
-    for n in range(n_qubits):
-        circ.Ry(float(np.random.rand(1)), n)
-    return CircBox(circ)
+from qtnmtts.circuits.utils import int_to_bits
 
 
 def _index_box_assert(
@@ -40,15 +32,15 @@ def _index_box_assert(
 
     index_box = IndexBox(index_method, input_reg_dict)
 
-    bit_strings = list(product([0, 1], repeat=index_box.n_index_qubits))
-
+    n_index = index_box.n_index_qubits
+    index_qubits = index_box.qreg.index.to_list()
     select_list: list[dict[Qubit, int]] = []
     work_qubits_dict = {q: False for q in index_box.qreg.work}
-    for bit_string in bit_strings:
+    for bit_index in range(2**n_index):
         post_pre_select: dict[Qubit, int] = dict(
-            zip(index_box.qreg.index, bit_string, strict=True)
+            zip(index_qubits, int_to_bits(bit_index, n_index), strict=True)
         )
-        post_pre_select.update(work_qubits_dict.copy())
+        post_pre_select.update(work_qubits_dict)
         select_list.append(post_pre_select)
 
     if len(reg_box_list_list) == 1:
@@ -74,55 +66,65 @@ def _index_box_assert(
 
 @pytest.mark.parametrize("n_index_qubits", [2, 3])
 @pytest.mark.parametrize("n_target_qubits", [1, 2, 3])
-def test_index_unary_iteration_box(n_index_qubits: int, n_target_qubits: int):
+def test_index_unary_iteration_box(
+    ry_register_boxes_fixture: dict[int, list[RegisterBox]],
+    n_index_qubits: int,
+    n_target_qubits: int,
+):
     """Test Index Unary iteration for various qubit numbers."""
     index_method = IndexUnaryIteration()
 
     reg_box_list = [
-        RegisterBox.from_CircBox(_generate_ry_circbox(n_target_qubits))
-        for _ in range(2**n_index_qubits)
+        ry_register_boxes_fixture[n_target_qubits][i] for i in range(2**n_index_qubits)
     ]
 
     _index_box_assert(index_method, n_target_qubits, [reg_box_list])
 
 
 @pytest.mark.parametrize("n_elements", [5, 6, 7])
-def test_index_unary_iteration_box_not_full(n_elements: int):
+def test_index_unary_iteration_box_not_full(
+    ry_register_boxes_fixture: dict[int, list[RegisterBox]], n_elements: int
+):
     """Test Index Unary for a non full set of elements."""
     n_target_qubits = 1
 
     index_method = IndexUnaryIteration()
 
     reg_box_list = [
-        RegisterBox.from_CircBox(_generate_ry_circbox(n_target_qubits))
-        for _ in range(n_elements)
+        ry_register_boxes_fixture[n_target_qubits][i] for i in range(n_elements)
     ]
 
     _index_box_assert(index_method, n_target_qubits, [reg_box_list])
 
 
-def test_unary_iteration_2_target():
+def test_unary_iteration_2_target(
+    ry_register_boxes_fixture: dict[int, list[RegisterBox]],
+):
     """Test Index Unary iteration for 2 registers registers."""
     n_index_qubits = 2
     n_target_qubits = 2
 
     index_method = IndexUnaryIteration()
 
-    def generate_reg_box_list(n_target_qubits: int, n_index_qubits: int):
-        return [
-            RegisterBox.from_CircBox(_generate_ry_circbox(n_target_qubits))
-            for _ in range(2**n_index_qubits)
+    def generate_reg_box_list(
+        n_target_qubits: int, n_index_qubits: int, n: int
+    ) -> list[RegisterBox]:
+        n_elements: int = 2**n_index_qubits
+        return ry_register_boxes_fixture[n_target_qubits][
+            n * n_elements : (n + 1) * n_elements
         ]
 
     reg_box_list_list = [
-        generate_reg_box_list(n_target_qubits, n_index_qubits) for _ in range(2)
+        generate_reg_box_list(n_target_qubits, n_index_qubits, n) for n in range(2)
     ]
 
     _index_box_assert(index_method, n_target_qubits, reg_box_list_list)
 
 
 @pytest.mark.parametrize("n_index_qubits", [2, 3, 4])
-def test_unary_iteration_custom_toffoli(n_index_qubits: int):
+def test_unary_iteration_custom_toffoli(
+    ry_register_boxes_fixture: dict[int, list[RegisterBox]], n_index_qubits: int
+):
     """Test Index Unary iteration custom toffili."""
     circ = Circuit(3)
     circ.H(2)
@@ -148,8 +150,7 @@ def test_unary_iteration_custom_toffoli(n_index_qubits: int):
     index_method = IndexUnaryIteration(toffoli=circ)
 
     reg_box_list = [
-        RegisterBox.from_CircBox(_generate_ry_circbox(n_target_qubits))
-        for _ in range(2**n_index_qubits)
+        ry_register_boxes_fixture[n_target_qubits][i] for i in range(2**n_index_qubits)
     ]
 
     _index_box_assert(index_method, n_target_qubits, [reg_box_list])
@@ -8,19 +8,12 @@ from qtnmtts.circuits.utils import (
 from qtnmtts.measurement.utils import circuit_unitary_postselect
 from qtnmtts.circuits.lcu import LCUMultiplexorBox
 from pytket.utils import QubitPauliOperator
-from pytest_lazyfixture import lazy_fixture
 from qtnmtts.circuits.utils import is_hermitian
-from qtnmtts.circuits.utils._testing import qcontrol_test
+from qtnmtts.circuits.utils._testing import get_n_state_qubits, qcontrol_test
 
 
-@pytest.mark.parametrize(
-    "op",
-    [
-        lazy_fixture("op_fixture"),
-    ],
-)
 @pytest.mark.parametrize("LCUBox", [LCUMultiplexorBox])
-def test_lcu_op(LCUBox: type, op: QubitPauliOperator):
+def test_lcu_op(LCUBox: type, op_fixture: QubitPauliOperator):
     """Test that operator obtained from postselecting the LCU.
 
     Circuit Must be the same as the block encoded operator itself
@@ -28,27 +21,18 @@ def test_lcu_op(LCUBox: type, op: QubitPauliOperator):
     Args:
     ----
         LCUBox (LCUBox): The LCUBox to test.
-        op (QubitPauliOperator): The operator to test.
+        op_fixture (QubitPauliOperator): The operator to test.
 
     """
-    n_state_qubits = (
-        max([p.index[0] for p_list in list(op._dict.keys()) for p in p_list.map.keys()])
-        + 1
-    )
-    lcu_box = LCUBox(op, n_state_qubits)
+    n_state_qubits = get_n_state_qubits(op_fixture)
+    lcu_box = LCUBox(op_fixture, n_state_qubits)
     circ_h = circuit_unitary_postselect(lcu_box.get_circuit(), lcu_box.postselect)
-    scipy_h = block_encoded_sparse_matrix(lcu_box).todense()
+    scipy_h = block_encoded_sparse_matrix(lcu_box).toarray()
     np.testing.assert_allclose(scipy_h, circ_h, atol=1e-10)
 
 
-@pytest.mark.parametrize(
-    "op",
-    [
-        lazy_fixture("op_hermitian_fixture"),
-    ],
-)
 @pytest.mark.parametrize("LCUBox", [LCUMultiplexorBox])
-def test_is_hermitian(LCUBox: type, op: QubitPauliOperator):
+def test_is_hermitian(LCUBox: type, op_hermitian_fixture: QubitPauliOperator):
     """Test that operator obtained from postselecting the LCU.
 
     Circuit Must be the same as the block encoded operator itself
@@ -56,26 +40,17 @@ def test_is_hermitian(LCUBox: type, op: QubitPauliOperator):
     Args:
     ----
         LCUBox (LCUBox): The LCUBox to test.
-        op (QubitPauliOperator): The operator to test.
+        op_hermitian_fixture (QubitPauliOperator): The operator to test.
 
     """
-    n_state_qubits = (
-        max([p.index[0] for p_list in list(op._dict.keys()) for p in p_list.map.keys()])
-        + 1
-    )
-    lcu_box = LCUBox(op, n_state_qubits)
+    n_state_qubits = get_n_state_qubits(op_hermitian_fixture)
+    lcu_box = LCUBox(op_hermitian_fixture, n_state_qubits)
     assert is_hermitian(lcu_box)
     assert lcu_box.select_box.is_hermitian
 
 
-@pytest.mark.parametrize(
-    "op",
-    [
-        lazy_fixture("op_nonhermitian_fixture"),
-    ],
-)
 @pytest.mark.parametrize("LCUBox", [LCUMultiplexorBox])
-def test_is_not_hermitian(LCUBox: type, op: QubitPauliOperator):
+def test_is_not_hermitian(LCUBox: type, op_nonhermitian_fixture: QubitPauliOperator):
     """Test that operator obtained from postselecting the LCU.
 
     Circuit Must be the same as the block encoded operator itself
@@ -83,26 +58,17 @@ def test_is_not_hermitian(LCUBox: type, op: QubitPauliOperator):
     Args:
     ----
         LCUBox (LCUBox): The LCUBox to test.
-        op (QubitPauliOperator): The operator to test.
+        op_nonhermitian_fixture (QubitPauliOperator): The operator to test.
 
     """
-    n_state_qubits = (
-        max([p.index[0] for p_list in list(op._dict.keys()) for p in p_list.map.keys()])
-        + 1
-    )
-    lcu_box = LCUBox(op, n_state_qubits)
+    n_state_qubits = get_n_state_qubits(op_nonhermitian_fixture)
+    lcu_box = LCUBox(op_nonhermitian_fixture, n_state_qubits)
     assert not is_hermitian(lcu_box)
     assert not lcu_box.select_box.is_hermitian
 
 
-@pytest.mark.parametrize(
-    "op",
-    [
-        lazy_fixture("op_fixture"),
-    ],
-)
 @pytest.mark.parametrize("LCUBox", [LCUMultiplexorBox])
-def test_lcu_op_qcontrol(LCUBox: type, op: QubitPauliOperator):
+def test_lcu_op_qcontrol(LCUBox: type, op_fixture: QubitPauliOperator):
     """Test that operator obtained from postselecting the LCU.
 
     Circuit Must be the same as the block encoded operator itself
@@ -110,13 +76,10 @@ def test_lcu_op_qcontrol(LCUBox: type, op: QubitPauliOperator):
     Args:
     ----
         LCUBox (LCUBox): The LCUBox to test.
-        op (QubitPauliOperator): The operator to test.
+        op_fixture (QubitPauliOperator): The operator to test.
 
     """
-    n_state_qubits = (
-        max([p.index[0] for p_list in list(op._dict.keys()) for p in p_list.map.keys()])
-        + 1
-    )
-    lcu_box = LCUBox(op, n_state_qubits)
+    n_state_qubits = get_n_state_qubits(op_fixture)
+    lcu_box = LCUBox(op_fixture, n_state_qubits)
     atol = 1e-10
     qcontrol_test(lcu_box, atol)
@@ -25,21 +25,17 @@ def test_lcu_custom_empty(n_prep: int, n_state: int):
 
 def test_lcu_custom_random():
     """Test random circuit is the same as the one used to create the LCUCustomBox."""
-    prep_circuit = (
-        Circuit(2)
-        .Ry(float(np.random.rand(1)), 0)
-        .Ry(float(np.random.rand(1)), 1)
-        .CX(0, 1)
-    )
+    angles = np.random.default_rng(0).random(6).tolist()
+    prep_circuit = Circuit(2).Ry(angles[0], 0).Ry(angles[1], 1).CX(0, 1)
     prep_circuit_copy = prep_circuit.copy()
     prep_circbox = CircBox(prep_circuit)
 
     select_circuit = (
         Circuit(4)
-        .Ry(float(np.random.rand(1)), 0)
-        .Ry(float(np.random.rand(1)), 1)
-        .Ry(float(np.random.rand(1)), 2)
-        .Ry(float(np.random.rand(1)), 3)
+        .Ry(angles[2], 0)
+        .Ry(angles[3], 1)
+        .Ry(angles[4], 2)
+        .Ry(angles[5], 3)
         .CX(0, 1)
         .CX(2, 3)
     )
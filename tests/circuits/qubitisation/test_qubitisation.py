@@ -1,16 +1,15 @@
 """Tests for the QubitiseBox implementation."""
 
+from copy import copy
 import numpy as np
 import pytest
 from numpy.polynomial.chebyshev import chebval
 from numpy.typing import NDArray
-from pytest_lazyfixture import lazy_fixture
-from pytket.circuit import Qubit
-from pytket.pauli import Pauli, QubitPauliString
+from typing import Any
 from pytket.utils import QubitPauliOperator
 
 from qtnmtts.circuits.core import PowerBox, QControlRegisterBox, QRegMap
-from qtnmtts.circuits.lcu import LCUMultiplexorBox
+from qtnmtts.circuits.lcu import LCUBox as LCUBoxBase, LCUMultiplexorBox
 from qtnmtts.circuits.qubitisation import (
     QubitiseBox,
     QControlQubitiseBox,
@@ -20,54 +19,75 @@ from qtnmtts.circuits.utils import (
     block_encoded_sparse_matrix,
 )
 from qtnmtts.measurement.utils import circuit_unitary_postselect
+from qtnmtts.circuits.utils._testing import get_n_state_qubits
+
+
+@pytest.fixture(scope="module", params=[LCUMultiplexorBox], ids=lambda t: t.__name__)
+def lcu_box_eigh_fixture(
+    request: Any, op_hermitian_fixture: QubitPauliOperator
+) -> tuple[LCUBoxBase, tuple[NDArray[np.float64], NDArray[np.complex128]]]:
+    """Fixture for the LCUBox of the operator and the eigh of its block encoding.
+
+    The boxes are shared between tests and must not be mutated.
+    """
+    LCUBox = request.param
+    lcu_box = LCUBox(op_hermitian_fixture, get_n_state_qubits(op_hermitian_fixture))
+    scipy_h = block_encoded_sparse_matrix(lcu_box).toarray()
+    return lcu_box, np.linalg.eigh(scipy_h)
+
+
+@pytest.fixture(scope="module")
+def power_qcontrol_unitaries_fixture(
+    lcu_box_eigh_fixture: tuple[
+        LCUBoxBase, tuple[NDArray[np.float64], NDArray[np.complex128]]
+    ],
+) -> list[NDArray[np.complex128]]:
+    """Fixture for the unitaries of QubitiseBox(lcu_box).power(power).qcontrol(1).
+
+    The list is indexed by the power, from 0 to 8.
+    """
+    lcu_box, _ = lcu_box_eigh_fixture
+    return [
+        QubitiseBox(lcu_box).power(power).qcontrol(1).get_unitary()
+        for power in range(9)
+    ]
 
 
 def chebyshev_power_matrix(
-    mat: NDArray[np.complex128], power: int
+    e: NDArray[np.float64], v: NDArray[np.complex128], power: int
 ) -> NDArray[np.complex128]:
-    """Get the Chebyshev polynomial of a matrix."""
+    """Get the Chebyshev polynomial of a Hermitian matrix from its eigh."""
     coeffs = [0] * power + [1]
 
-    e, v = np.linalg.eigh(mat)
     chebyshev_e = chebval(e, coeffs)
-    cheb_scipy_h = v @ np.diag(chebyshev_e) @ v.conj().T
+    cheb_scipy_h = (v * chebyshev_e) @ v.conj().T
 
     return cheb_scipy_h
 
 
-@pytest.mark.parametrize(
-    "op",
-    [
-        lazy_fixture("op_hermitian_fixture"),
-    ],
-)
-@pytest.mark.parametrize("LCUBox", [LCUMultiplexorBox])
 @pytest.mark.parametrize("power", list(range(9)))
-def test_qubitisebox(LCUBox: type, op: QubitPauliOperator, power: int):
+def test_qubitisebox(
+    lcu_box_eigh_fixture: tuple[
+        LCUBoxBase, tuple[NDArray[np.float64], NDArray[np.complex128]]
+    ],
+    power: int,
+):
     """Test that operator obtained from postselecting the QubitiseBox.
 
     Args:
     ----
-        LCUBox (LCUBox): The LCUBox to test.
-        op (QubitPauliOperator): The operator to test.
+        lcu_box_eigh_fixture (tuple[LCUBox, tuple[NDArray, NDArray]]): The
+            LCUBox to test and the eigh of its block encoding.
         power (int): The power to raise the operator to.
 
     """
-    n_state_qubits = (
-        max([p.index[0] for p_list in list(op._dict.keys()) for p in p_list.map.keys()])
-        + 1
-    )
-    lcu_box = LCUBox(op, n_state_qubits)
+    lcu_box, (e, v) = lcu_box_eigh_fixture
     qubitise_box_power = QubitiseBox(lcu_box).power(power)
     circ_h = circuit_unitary_postselect(
         qubitise_box_power.reg_circuit, qubitise_box_power.register_box.postselect
     )
 
-    scipy_h = block_encoded_sparse_matrix(lcu_box).todense()
-
-    scipy_h = block_encoded_sparse_matrix(lcu_box).todense()
-
-    scipy_h = chebyshev_power_matrix(scipy_h, power)
+    scipy_h = chebyshev_power_matrix(e, v, power)
 
     np.testing.assert_allclose(circ_h, scipy_h, atol=1e-10)
 
@@ -100,92 +120,74 @@ def qcontrol_qubitise(qc_box: PowerBox) -> NDArray[np.complex128]:
     circ.Ry(rotation, qc_box.register_box.qreg.control[0]).dagger()
 
     # HACK: This is a hack to get the postselect dict from the QControlRegisterBox
-    post_select_dict = qc_box.postselect
+    post_select_dict = qc_box.postselect.copy()
     post_select_dict[qc_box.register_box.qreg.control[0]] = 0
     circ_u = circuit_unitary_postselect(circ, post_select_dict)
 
     return circ_u
 
 
-@pytest.mark.parametrize(
-    "op",
-    [
-        lazy_fixture("op_hermitian_fixture"),
-    ],
-)
-@pytest.mark.parametrize("LCUBox", [LCUMultiplexorBox])
 @pytest.mark.parametrize("power", list(range(9)))
-def test_qcontrol_qubitisebox(LCUBox: type, op: QubitPauliOperator, power: int):
+def test_qcontrol_qubitisebox(
+    lcu_box_eigh_fixture: tuple[
+        LCUBoxBase, tuple[NDArray[np.float64], NDArray[np.complex128]]
+    ],
+    power: int,
+):
     """Test the PytketQControlRegisterBox with an LCUBox."""
-    n_state_qubits = (
-        max([p.index[0] for p_list in list(op._dict.keys()) for p in p_list.map.keys()])
-        + 1
-    )
-    lcu_box = LCUBox(op, n_state_qubits)
+    lcu_box, (e, v) = lcu_box_eigh_fixture
 
     qc_qubitise = QubitiseBox(lcu_box).qcontrol(1).power(power)
     circ_u = qcontrol_qubitise(qc_qubitise)
 
-    scipy_h = block_encoded_sparse_matrix(lcu_box).todense()
-
-    scipy_h = chebyshev_power_matrix(scipy_h, power)
+    scipy_h = chebyshev_power_matrix(e, v, power)
 
     rotation = 0.1
     factor = np.cos(rotation * np.pi / 2) ** 2
-    scipy_u = (
-        factor * scipy_h
-        - (1 - factor)
-        * QubitPauliOperator({QubitPauliString([Qubit(0)], [Pauli.I]): 1})
-        .to_sparse_matrix(int(np.log2(scipy_h.shape[0])))
-        .todense()
-    )
+    identity = np.eye(scipy_h.shape[0], dtype=np.complex128)
+    scipy_u = factor * scipy_h - (1 - factor) * identity
 
     np.testing.assert_allclose(scipy_u, circ_u, atol=1e-10)
 
 
-@pytest.mark.parametrize(
-    "op",
-    [
-        lazy_fixture("op_hermitian_fixture"),
-    ],
-)
-@pytest.mark.parametrize("LCUBox", [LCUMultiplexorBox])
 @pytest.mark.parametrize("power", [2, 4, 8])
-def test_qcontrol_qubitisebox_unitary(LCUBox: type, op: QubitPauliOperator, power: int):
+def test_qcontrol_qubitisebox_unitary(
+    lcu_box_eigh_fixture: tuple[
+        LCUBoxBase, tuple[NDArray[np.float64], NDArray[np.complex128]]
+    ],
+    power_qcontrol_unitaries_fixture: list[NDArray[np.complex128]],
+    power: int,
+):
     """Unitary test for the squared controlled decomposition."""
-    n_state_qubits = (
-        max([p.index[0] for p_list in list(op._dict.keys()) for p in p_list.map.keys()])
-        + 1
-    )
-    lcu_box = LCUBox(op, n_state_qubits)
+    lcu_box, _ = lcu_box_eigh_fixture
     # Test that controlling the reflection or the LCU is equivalent
     qc_qubitise = QubitiseBox(lcu_box)
-    qc_qubitise_ref = QubitiseBox(lcu_box)
+    qc_qubitise_ref = copy(qc_qubitise)
     qc_qubitise_ref.control_reflection = False
+    qc_qubitise_u = power_qcontrol_unitaries_fixture[power]
 
     np.testing.assert_allclose(
         qc_qubitise_ref.power(power).qcontrol(1).get_unitary(),
-        qc_qubitise.power(power).qcontrol(1).get_unitary(),
+        qc_qubitise_u,
         atol=1e-10,
     )
     # Test that the squared controlled decomposition is equivalent to the single
     qc_qubitise_power_single = PowerBox(qc_qubitise, power)
     np.testing.assert_allclose(
-        qc_qubitise.power(power).qcontrol(1).get_unitary(),
+        qc_qubitise_u,
         qc_qubitise_power_single.qcontrol(1).get_unitary(),
         atol=1e-10,
     )
 
 
-@pytest.mark.parametrize(
-    "op",
-    [
-        lazy_fixture("op_hermitian_fixture"),
-    ],
-)
-@pytest.mark.parametrize("LCUBox", [LCUMultiplexorBox])
 @pytest.mark.parametrize("power", list(range(9)))
-def test_qubitisebox_correct_control(LCUBox: type, op: QubitPauliOperator, power: int):
+def test_qubitisebox_correct_control(
+    lcu_box_eigh_fixture: tuple[
+        LCUBoxBase, tuple[NDArray[np.float64], NDArray[np.complex128]]
+    ],
+    power_qcontrol_unitaries_fixture: list[NDArray[np.complex128]],
+    power: int,
+):
     """Test the control of QubitiseBox.
 
     Given the power test that the correct control is used and that qcontrol.power is
@@ -193,16 +195,14 @@ def test_qubitisebox_correct_control(LCUBox: type, op: QubitPauliOperator, power
 
     Args:
     ----
-        LCUBox (LCUBox): The LCUBox to test.
-        op (QubitPauliOperator): The operator to test.
+        lcu_box_eigh_fixture (tuple[LCUBox, tuple[NDArray, NDArray]]): The
+            LCUBox to test and the eigh of its block encoding.
+        power_qcontrol_unitaries_fixture (list[NDArray]): The unitaries of the
+            controlled powers of the QubitiseBox.
         power (int): The power to raise the operator to.
 
     """
-    n_state_qubits = (
-        max([p.index[0] for p_list in list(op._dict.keys()) for p in p_list.map.keys()])
-        + 1
-    )
-    lcu_box = LCUBox(op, n_state_qubits)
+    lcu_box, _ = lcu_box_eigh_fixture
     qubitise_box = QubitiseBox(lcu_box)
     qubitise_box_power = qubitise_box.power(power)
     qcontrol_qubitise_box_power: PowerBox = qubitise_box.qcontrol(1).power(power)
@@ -222,36 +222,28 @@ def test_qubitisebox_correct_control(LCUBox: type, op: QubitPauliOperator, power
         assert isinstance(
             qcontrol_qubitise_box_power.register_box, QControlSquareQubitiseBox
         )
-    qcontrol_qubitise_box_power_aux = qubitise_box_power.qcontrol(1)
     np.testing.assert_allclose(
         qcontrol_qubitise_box_power.get_unitary(),
-        qcontrol_qubitise_box_power_aux.get_unitary(),
+        power_qcontrol_unitaries_fixture[power],
         atol=1e-10,
     )
 
 
-@pytest.mark.parametrize(
-    "op",
-    [
-        lazy_fixture("op_nonhermitian_fixture"),
-    ],
-)
 @pytest.mark.parametrize("LCUBox", [LCUMultiplexorBox])
-def test_qubitisebox_nonhermitian(LCUBox: type, op: QubitPauliOperator):
+def test_qubitisebox_nonhermitian(
+    LCUBox: type, op_nonhermitian_fixture: QubitPauliOperator
+):
     """Test error on non Hermitian operators for QubitiseBox.
 
     Args:
     ----
         LCUBox (LCUBox): The LCUBox to test.
-        op (QubitPauliOperator): The operator to test.
+        op_nonhermitian_fixture (QubitPauliOperator): The operator to test.
         power (int): The power to raise the operator to.
 
     """
-    n_state_qubits = (
-        max([p.index[0] for p_list in list(op._dict.keys()) for p in p_list.map.keys()])
-        + 1
-    )
-    lcu_box = LCUBox(op, n_state_qubits)
+    n_state_qubits = get_n_state_qubits(op_nonhermitian_fixture)
+    lcu_box = LCUBox(op_nonhermitian_fixture, n_state_qubits)
     with pytest.raises(
         ValueError, match="QubitiseBox only available for Hermitian LCUs."
     ):
@@ -7,7 +7,7 @@ from qtnmtts.circuits.core import PytketQControlRegisterBox
 from qtnmtts.circuits.reflection.reflection_registerbox import QControlReflectionBox
 
 
-@pytest.mark.parametrize("n_qubits", np.arange(1, 7))
+@pytest.mark.parametrize("n_qubits", range(1, 7))
 def test_reflection_box(n_qubits: int):
     """Test the ReflectionBox.
 
@@ -22,10 +22,10 @@ def test_reflection_box(n_qubits: int):
     reflection_box = ReflectionBox(n_qubits)
     reflection_box_neg = ReflectionBox(n_qubits, positive=False)
 
-    reflection_unitary = -1 * np.diag(np.ones(2**n_qubits))
+    reflection_unitary = -np.eye(2**n_qubits)
     reflection_unitary[0, 0] = 1
 
-    reflection_unitary_neg = -1 * reflection_unitary
+    reflection_unitary_neg = -reflection_unitary
     np.testing.assert_allclose(
         reflection_box.get_unitary(), reflection_unitary, atol=1e-10
     )
@@ -34,7 +34,7 @@ def test_reflection_box(n_qubits: int):
     )
 
 
-@pytest.mark.parametrize("n_qubits", np.arange(1, 7))
+@pytest.mark.parametrize("n_qubits", range(1, 7))
 def test_reflection_box_qcontrol(n_qubits: int):
     """Test the ReflectionBox.qcontrol(1) method.
 
@@ -68,3 +68,14 @@ def test_reflection_box_qcontrol(n_qubits: int):
         reflection_unitary_qcontrol_neg.get_unitary(),
         atol=1e-10,
     )
+
+
+def test_reflection_box_circuits_not_shared():
+    """Test renaming one ReflectionBox does not change a second one."""
+    reflection_box = ReflectionBox(2)
+    other_box = ReflectionBox(2)
+    assert reflection_box.reg_circuit is not other_box.reg_circuit
+
+    reflection_box.rename_q_registers({reflection_box.qreg.reflection: "s"})
+    assert other_box.qreg.reflection.name == "r"
+    assert {q.reg_name for q in other_box.qubits} == {"r"}
@@ -0,0 +1,117 @@
+"""Test the truncated Taylor series of ExpQubitOper."""
+
+from math import factorial
+import pytest
+import numpy as np
+from numpy.typing import NDArray
+from pytket.circuit import Qubit
+from pytket.pauli import Pauli, QubitPauliString
+from pytket.utils import QubitPauliOperator
+from sympy import Symbol  # type: ignore
+from qtnmtts.circuits.research.tts.expand import ExpQubitOper
+
+PAULIS = [Pauli.I, Pauli.X, Pauli.Y, Pauli.Z]
+
+
+def random_operator(n_qubits: int, n_terms: int, seed: int) -> QubitPauliOperator:
+    """Return an operator of random Pauli strings with random complex coeffs."""
+    rng = np.random.default_rng(seed)
+    qubits = [Qubit(i) for i in range(n_qubits)]
+    terms: dict[QubitPauliString, complex] = {}
+    for _ in range(n_terms):
+        indices: list[int] = rng.integers(0, 4, n_qubits).tolist()  # type: ignore
+        paulis = [PAULIS[i] for i in indices]
+        coeff = complex(*rng.uniform(-0.5, 0.5, 2))
+        terms[QubitPauliString(qubits, paulis)] = coeff
+    return QubitPauliOperator(terms)
+
+
+def dense_taylor_series(
+    operator: QubitPauliOperator, k: int, n_qubits: int
+) -> NDArray[np.complex128]:
+    """Return sum(H^j/j!) for j = 0, ..., k as a dense matrix."""
+    qubits = [Qubit(i) for i in range(n_qubits)]
+    h: NDArray[np.complex128] = operator.to_sparse_matrix(qubits).toarray()  # type: ignore
+    series = np.eye(2**n_qubits, dtype=np.complex128)
+    for j in range(1, k + 1):
+        series += np.linalg.matrix_power(h, j) / factorial(j)  # type: ignore
+    return series
+
+
+def expand_dense(
+    operator: QubitPauliOperator, k: int, n_qubits: int
+) -> NDArray[np.complex128]:
+    """Return the ExpQubitOper expansion as a dense matrix."""
+    qubits = [Qubit(i) for i in range(n_qubits)]
+    exp_op = ExpQubitOper(operator, np.int64(k)).taylor_expand()
+    return exp_op.to_sparse_matrix(qubits).toarray()  # type: ignore
+
+
+@pytest.mark.parametrize("n_qubits", [1, 2, 3])
+@pytest.mark.parametrize("n_terms", [2, 5])
+@pytest.mark.parametrize("k", [4, 8])
+@pytest.mark.parametrize("seed", [0, 1])
+def test_taylor_expand_random(n_qubits: int, n_terms: int, k: int, seed: int):
+    """Test the expansion of random operators against the dense series."""
+    operator = random_operator(n_qubits, n_terms, seed)
+    np.testing.assert_allclose(
+        expand_dense(operator, k, n_qubits),
+        dense_taylor_series(operator, k, n_qubits),
+        atol=4 * 10.0**-k,
+    )
+
+
+@pytest.mark.parametrize(
+    "term",
+    [
+        QubitPauliString(),
+        QubitPauliString([Qubit(0)], [Pauli.X]),
+        QubitPauliString([Qubit(0), Qubit(1)], [Pauli.Y, Pauli.Z]),
+    ],
+)
+@pytest.mark.parametrize("k", [1, 4, 8])
+def test_taylor_expand_single_term(term: QubitPauliString, k: int):
+    """Test the expansion of identity only and single term operators."""
+    operator = QubitPauliOperator({term: 0.3 - 0.4j})
+    np.testing.assert_allclose(
+        expand_dense(operator, k, 2),
+        dense_taylor_series(operator, k, 2),
+        atol=4 * 10.0**-k,
+    )
+
+
+def test_taylor_expand_symbolic():
+    """Test symbolic coefficients are expanded and can be substituted."""
+    a = Symbol("a")  # type: ignore
+    x0 = QubitPauliString([Qubit(0)], [Pauli.X])
+    z1 = QubitPauliString([Qubit(1)], [Pauli.Z])
+    k = 6
+
+    symbolic = QubitPauliOperator({x0: a, z1: 0.25})  # type: ignore
+    exp_op = ExpQubitOper(symbolic, np.int64(k))
+    exp_op = exp_op.taylor_expand()
+    exp_op.subs({a: 0.5})  # type: ignore
+    numeric = QubitPauliOperator({x0: 0.5, z1: 0.25})
+
+    qubits = [Qubit(0), Qubit(1)]
+    np.testing.assert_allclose(
+        exp_op.to_sparse_matrix(qubits).toarray(),  # type: ignore
+        dense_taylor_series(numeric, k, 2),
+        atol=4 * 10.0**-k,
+    )
+
+
+def test_taylor_expand_many_qubits():
+    """Test operators on more than 64 qubits are expanded."""
+    coeffs = np.linspace(0.01, 0.1, 65)
+    operator = QubitPauliOperator(
+        {
+            QubitPauliString([Qubit(i)], [Pauli.Z]): coeff
+            for i, coeff in enumerate(coeffs)
+        }
+    )
+    exp_op = ExpQubitOper(operator, np.int64(2)).taylor_expand()
+
+    # only the squares of the terms of H^2 are on the identity
+    identity_coeff = exp_op.get(QubitPauliString(), 0)  # type: ignore
+    assert complex(identity_coeff) == pytest.approx(1 + np.sum(coeffs**2) / 2)  # type: ignore
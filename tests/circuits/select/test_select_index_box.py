@@ -1,27 +1,66 @@
 """SerialLCUOperator tests."""
 
+import pytest
 from pytket.utils import QubitPauliOperator
-from pytest_lazyfixture import lazy_fixture
 from qtnmtts.circuits.lcu import SerialLCUOperator
-import pytest
 from qtnmtts.circuits.core import RegisterCircuit
 import numpy as np
 from cmath import polar
 from qtnmtts.circuits.select import SelectIndexBox
 from qtnmtts.circuits.index.method import IndexDefault, IndexUnaryIteration
 from pytket.circuit import Qubit
-from itertools import product
+from pytket._tket.circuit import Circuit
 from numpy.typing import NDArray
 from qtnmtts.operators import ising_model
+from qtnmtts.circuits.utils import int_to_bits
+from qtnmtts.circuits.utils._testing import get_n_state_qubits
+from qtnmtts.measurement.utils import unitary_postselect
+
 
+def term_matrices(
+    hamiltonian: QubitPauliOperator, n_state_qubits: int
+) -> tuple[NDArray[np.float64], NDArray[np.complex128]]:
+    """Return the coefficient magnitudes and dense matrices of the operator terms.
 
-@pytest.mark.parametrize(
-    "hamiltonian",
-    [
-        lazy_fixture("op_fixture"),
-    ],
-)
-def test_seriallcu_op_map(hamiltonian: QubitPauliOperator):
+    Args:
+    ----
+        hamiltonian (QubitPauliOperator): The operator
+        n_state_qubits (int): The number of state qubits
+
+    Returns:
+    -------
+        tuple[NDArray[np.float64], NDArray[np.complex128]]: The magnitudes of the
+            coefficients and the matrices of the terms stacked along the first axis.
+
+    """
+    dim = 2**n_state_qubits
+    terms = hamiltonian._dict.items()
+    mags = np.array([polar(coeff)[0] for _, coeff in terms])
+    m_qpos = np.empty((len(terms), dim, dim), dtype=np.complex128)
+    for i, (qps, coeff) in enumerate(terms):
+        qpo = QubitPauliOperator({qps: coeff})
+        m_qpos[i] = qpo.to_sparse_matrix(n_state_qubits).toarray()
+    return mags, m_qpos
+
+
+@pytest.fixture(scope="module")
+def term_matrices_fixture(
+    op_fixture: QubitPauliOperator,
+) -> tuple[NDArray[np.float64], NDArray[np.complex128]]:
+    """Fixture for the term_matrices of the op_fixture operator.
+
+    The arrays are shared between tests and are read only.
+    """
+    mags, m_qpos = term_matrices(op_fixture, get_n_state_qubits(op_fixture))
+    mags.flags.writeable = False
+    m_qpos.flags.writeable = False
+    return mags, m_qpos
+
+
+def test_seriallcu_op_map(
+    op_fixture: QubitPauliOperator,
+    term_matrices_fixture: tuple[NDArray[np.float64], NDArray[np.complex128]],
+):
     """Test serial lcu operator op_map_list.
 
     This test takes the circuit for the serial lcu operators
@@ -31,46 +70,51 @@ def test_seriallcu_op_map(hamiltonian: QubitPauliOperator):
 
     Args:
     ----
-        hamiltonian (QubitPauliOperator): The operator
+        op_fixture (QubitPauliOperator): The operator
+        term_matrices_fixture (tuple[NDArray, NDArray]): The magnitudes and
+            matrices of the operator terms
 
     """
-    n_state_qubits = (
-        max(
-            [
-                p.index[0]
-                for p_list in list(hamiltonian._dict.keys())
-                for p in p_list.map.keys()
-            ]
-        )
-        + 1
-    )
-
-    qpos = [
-        QubitPauliOperator({qps: coeff}) for qps, coeff in hamiltonian._dict.items()
-    ]
+    n_state_qubits = get_n_state_qubits(op_fixture)
 
-    serial = SerialLCUOperator(hamiltonian, n_state_qubits)
-    mags: list[float] = []
-    for coeff in hamiltonian._dict.values():
-        mag, _ = polar(coeff)
-        mags.append(mag)
+    mags, m_qpos = term_matrices_fixture
 
+    serial = SerialLCUOperator(op_fixture, n_state_qubits)
     for ops in serial.op_map_list.values():
-        for op, mag, qpo in zip(ops, mags, qpos, strict=True):
+        circ_us: list[NDArray[np.complex128]] = []
+        for op in ops:
             circ = RegisterCircuit(n_state_qubits)
             circ.add_registerbox(op.box, op.targ_qreg_map)
-            m_circ = circ.get_unitary() * mag
-            m_qpo = qpo.to_sparse_matrix(n_state_qubits).todense()
-            np.testing.assert_allclose(m_circ, m_qpo)
-
-
-@pytest.mark.parametrize(
-    "hamiltonian",
-    [
-        lazy_fixture("op_fixture"),
-    ],
-)
-def test_select_index_box_default(hamiltonian: QubitPauliOperator):
+            circ_us.append(circ.get_unitary())
+        m_circs = np.stack(circ_us) * mags[:, None, None]
+        np.testing.assert_allclose(m_circs, m_qpos)
+
+
+def test_seriallcu_pauli_ops(
+    op_fixture: QubitPauliOperator,
+    term_matrices_fixture: tuple[NDArray[np.float64], NDArray[np.complex128]],
+):
+    """Test the phased pauli ops of each term times its magnitude is the term."""
+    n_state_qubits = get_n_state_qubits(op_fixture)
+
+    mags, m_qpos = term_matrices_fixture
+
+    serial = SerialLCUOperator(op_fixture, n_state_qubits)
+    circ_us: list[NDArray[np.complex128]] = []
+    for term, coeff in op_fixture._dict.items():  # type: ignore
+        circ = Circuit(n_state_qubits)
+        ops = serial.pauli_ops(term, complex(coeff))  # type: ignore
+        for op, qubit in zip(ops, serial.term_qubits(term), strict=True):  # type: ignore
+            circ.add_gate(op, [qubit])  # type: ignore
+        circ_us.append(circ.get_unitary())
+    m_circs = np.stack(circ_us) * mags[:, None, None]
+    np.testing.assert_allclose(m_circs, m_qpos)
+
+
+def test_select_index_box_default(
+    op_fixture: QubitPauliOperator,
+    term_matrices_fixture: tuple[NDArray[np.float64], NDArray[np.complex128]],
+):
     """Test select index box default.
 
     This test pre and post selects onto each index and compares it
@@ -78,46 +122,30 @@ def test_select_index_box_default(hamiltonian: QubitPauliOperator):
 
     Args:
     ----
-        hamiltonian (QubitPauliOperator): The operator
+        op_fixture (QubitPauliOperator): The operator
+        term_matrices_fixture (tuple[NDArray, NDArray]): The magnitudes and
+            matrices of the operator terms
 
     """
-    n_state_qubits = (
-        max(
-            [
-                p.index[0]
-                for p_list in list(hamiltonian._dict.keys())
-                for p in p_list.map.keys()
-            ]
-        )
-        + 1
-    )
-
-    qpos = [
-        QubitPauliOperator({qps: coeff}) for qps, coeff in hamiltonian._dict.items()
-    ]
-
-    mags: list[float] = []
-    for coeff in hamiltonian._dict.values():
-        mag, _ = polar(coeff)
-        mags.append(mag)
+    n_state_qubits = get_n_state_qubits(op_fixture)
 
-    m_qpos = [qpo.to_sparse_matrix(n_state_qubits).todense() for qpo in qpos]
+    mags, m_qpos = term_matrices_fixture
 
-    select_box = SelectIndexBox(IndexDefault(), hamiltonian, n_state_qubits)
+    select_box = SelectIndexBox(IndexDefault(), op_fixture, n_state_qubits)
 
-    bit_strings = list(product([0, 1], repeat=select_box.n_index_qubits))
-
-    select_list: list[dict[Qubit, int]] = []
-    for bit_string in bit_strings:
-        post_pre_select: dict[Qubit, int] = dict(
-            zip(select_box.qreg.index, bit_string, strict=True)
-        )
-        select_list.append(post_pre_select)
+    n_index = select_box.n_index_qubits
+    index_qubits = select_box.qreg.index.to_list()
+    select_list: list[dict[Qubit, int]] = [
+        dict(zip(index_qubits, int_to_bits(bit_index, n_index), strict=True))
+        for bit_index in range(2**n_index)
+    ]
 
+    # simulate once and pre and post select the unitary for each index
+    unitary = select_box.get_unitary()
     ps_unitarys: list[NDArray[np.complex128]] = []
     for select, mag in zip(select_list, mags, strict=True):
-        ps_unitary = select_box.get_unitary(
-            post_select_dict=select, pre_select_dict=select
+        ps_unitary = unitary_postselect(
+            select_box.qubits, unitary, select.copy(), select.copy()
         )
         ps_unitarys.append(ps_unitary * mag)
 
@@ -130,34 +158,27 @@ def test_select_index_box_unary():
     n_state_qubits = 4
     hamiltonian = ising_model(n_state_qubits, h=1.0, j=1.0)
 
-    qpos = [
-        QubitPauliOperator({qps: coeff}) for qps, coeff in hamiltonian._dict.items()
-    ]
-
-    mags: list[float] = []
-    for coeff in hamiltonian._dict.values():
-        mag, _ = polar(coeff)
-        mags.append(mag)
-
-    m_qpos = [qpo.to_sparse_matrix(n_state_qubits).todense() for qpo in qpos]
+    mags, m_qpos = term_matrices(hamiltonian, n_state_qubits)
 
     select_box = SelectIndexBox(IndexUnaryIteration(), hamiltonian, n_state_qubits)
 
-    bit_strings = list(product([0, 1], repeat=select_box.n_index_qubits))
-
-    select_list: list[dict[Qubit, int]] = []
+    n_index = select_box.n_index_qubits
+    index_qubits = select_box.qreg.index.to_list()
     work_qubits_dict = {q: False for q in select_box.qreg.work}
-    for bit_string in bit_strings:
+    select_list: list[dict[Qubit, int]] = []
+    for bit_index in range(2**n_index):
         post_pre_select: dict[Qubit, int] = dict(
-            zip(select_box.qreg.index, bit_string, strict=True)
+            zip(index_qubits, int_to_bits(bit_index, n_index), strict=True)
         )
-        post_pre_select.update(work_qubits_dict.copy())
+        post_pre_select.update(work_qubits_dict)
         select_list.append(post_pre_select)
 
+    # simulate once and pre and post select the unitary for each index
+    unitary = select_box.get_unitary()
     ps_unitarys: list[NDArray[np.complex128]] = []
     for select, mag in zip(select_list, mags, strict=False):
-        ps_unitary = select_box.get_unitary(
-            post_select_dict=select, pre_select_dict=select
+        ps_unitary = unitary_postselect(
+            select_box.qubits, unitary, select.copy(), select.copy()
         )
         ps_unitarys.append(ps_unitary * mag)
 
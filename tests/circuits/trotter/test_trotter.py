@@ -4,21 +4,46 @@ import pytest
 import numpy as np
 from qtnmtts.circuits.trotter import TrotterPauliExpBox
 from pytket.utils import QubitPauliOperator
-from pytest_lazyfixture import lazy_fixture
 from scipy.linalg import expm
 from numpy.typing import NDArray
 from sympy import Symbol  # type: ignore
-from qtnmtts.circuits.utils._testing import qcontrol_test
+from qtnmtts.circuits.utils._testing import get_n_state_qubits, qcontrol_test
+
+
+def pauli_term_matrices(
+    op: QubitPauliOperator, n_state_qubits: int
+) -> list[tuple[complex, NDArray[np.complex128]]]:
+    """Return the coefficients and dense Pauli matrices of the terms, reversed."""
+    return [
+        (
+            complex(coeff),
+            QubitPauliOperator({qps: 1}).to_sparse_matrix(n_state_qubits).toarray(),
+        )
+        for qps, coeff in reversed(op._dict.items())
+    ]
+
+
+@pytest.fixture(scope="module")
+def pauli_term_matrices_fixture(
+    op_hermitian_fixture: QubitPauliOperator,
+) -> list[tuple[complex, NDArray[np.complex128]]]:
+    """Fixture for the pauli_term_matrices of the op_hermitian_fixture operator."""
+    return pauli_term_matrices(
+        op_hermitian_fixture, get_n_state_qubits(op_hermitian_fixture)
+    )
 
 
 def scipy_trotterbox(
-    op: QubitPauliOperator, n_state_qubits: int, time_slice: float
+    term_mats: list[tuple[complex, NDArray[np.complex128]]],
+    n_state_qubits: int,
+    time_slice: float,
 ) -> NDArray[np.complex128]:
     """Return the scipy matrix for the TrotterPauliExpBox.
 
     Args:
     ----
-        op (QubitPauliOperator): The hamiltonian to be approximated.
+        term_mats (list[tuple[complex, NDArray]]): The pauli_term_matrices of the
+            hamiltonian to be approximated.
         n_state_qubits (int): The number of qubits in the state register.
         time_slice (float): The time slice of the Trotter step.
 
@@ -27,83 +52,62 @@ def scipy_trotterbox(
         np.ndarray: The scipy matrix for the TrotterPauliExpBox.
 
     """
-    time_slice_op: QubitPauliOperator = op * time_slice  # type: ignore
-    qpo_terms = [
-        QubitPauliOperator({qps: coeff})
-        for qps, coeff in time_slice_op._dict.items()  # type: ignore
-    ]
-    qpo_terms_mat = reversed(
-        [qpo.to_sparse_matrix(n_state_qubits).todense() for qpo in qpo_terms]
-    )
     scipy_u = np.eye(2**n_state_qubits, dtype=np.complex128)
-    # Due to pytket angle convention
-    qpo_terms_expmat = [expm(-1j * np.pi * 0.5 * mat) for mat in qpo_terms_mat]
-    for mat in qpo_terms_expmat:
-        scipy_u = scipy_u @ mat
+    for coeff, mat in term_mats:
+        # Due to pytket angle convention
+        scipy_u = scipy_u @ expm(-1j * np.pi * 0.5 * time_slice * coeff * mat)
     return scipy_u
 
 
-@pytest.mark.parametrize(
-    "op",
-    [
-        lazy_fixture("op_hermitian_fixture"),
-    ],
-)
-def test_trotterpauliexpbox(op: QubitPauliOperator):
+def test_trotterpauliexpbox(
+    op_hermitian_fixture: QubitPauliOperator,
+    pauli_term_matrices_fixture: list[tuple[complex, NDArray[np.complex128]]],
+):
     """Test the TrotterPauliExpBox."""
-    n_state_qubits = (
-        max([p.index[0] for p_list in list(op._dict.keys()) for p in p_list.map.keys()])
-        + 1
-    )
+    n_state_qubits = get_n_state_qubits(op_hermitian_fixture)
     time_slice = 0.1
-    trotter_box = TrotterPauliExpBox(op, n_state_qubits, time_slice)
+    trotter_box = TrotterPauliExpBox(op_hermitian_fixture, n_state_qubits, time_slice)
     trotterbox_u = trotter_box.get_unitary()
-    scipy_u = scipy_trotterbox(op, n_state_qubits, time_slice)
+    scipy_u = scipy_trotterbox(pauli_term_matrices_fixture, n_state_qubits, time_slice)
     np.testing.assert_allclose(trotterbox_u, scipy_u, atol=1e-10)
 
     symbol = Symbol("t")
-    trotter_box = TrotterPauliExpBox(op, n_state_qubits, symbol)
+    trotter_box = TrotterPauliExpBox(op_hermitian_fixture, n_state_qubits, symbol)
     trotter_box.symbol_substitution({symbol: time_slice})
     trotterbox_u = trotter_box.get_unitary()
-    scipy_u = scipy_trotterbox(op, n_state_qubits, time_slice)
     np.testing.assert_allclose(trotterbox_u, scipy_u, atol=1e-10)
 
 
-@pytest.mark.parametrize(
-    "op",
-    [
-        lazy_fixture("op_hermitian_fixture"),
-    ],
-)
-def test_trotter_qcontrol(op: QubitPauliOperator):
+def test_trotter_qcontrol(op_hermitian_fixture: QubitPauliOperator):
     """Test the qcontrol() method of TrotterPauliExpBox."""
-    n_state_qubits = (
-        max([p.index[0] for p_list in list(op._dict.keys()) for p in p_list.map.keys()])
-        + 1
-    )
+    n_state_qubits = get_n_state_qubits(op_hermitian_fixture)
     time_slice = 0.1
-    trotterbox = TrotterPauliExpBox(op, n_state_qubits, time_slice)
+    trotterbox = TrotterPauliExpBox(op_hermitian_fixture, n_state_qubits, time_slice)
     qcontrol_test(trotterbox, atol=1e-10)
 
 
-@pytest.mark.parametrize(
-    "op",
-    [
-        lazy_fixture("op_hermitian_fixture"),
-    ],
-)
 @pytest.mark.parametrize("power", [2, 3, 4, 5])
-def test_trotter_power(op: QubitPauliOperator, power: int):
+def test_trotter_power(op_hermitian_fixture: QubitPauliOperator, power: int):
     """Test the power() method of the TrotterPauliExpBox."""
-    n_state_qubits = (
-        max([p.index[0] for p_list in list(op._dict.keys()) for p in p_list.map.keys()])
-        + 1
-    )
+    n_state_qubits = get_n_state_qubits(op_hermitian_fixture)
     time_slice = 0.1
-    trotter_box = TrotterPauliExpBox(op, n_state_qubits, time_slice)
-    trotterbox_u_scipy = trotter_box.get_unitary()
-    for _ in range(power - 1):
-        trotterbox_u_scipy = trotterbox_u_scipy @ trotter_box.get_unitary()
+    trotter_box = TrotterPauliExpBox(op_hermitian_fixture, n_state_qubits, time_slice)
+    trotterbox_u_scipy = np.linalg.matrix_power(trotter_box.get_unitary(), power)
 
     trotter_box_circ_u = trotter_box.power(power).get_unitary()
     np.testing.assert_allclose(trotter_box_circ_u, trotterbox_u_scipy, atol=1e-10)
+
+
+def test_trotter_prebuilt_terms(
+    op_hermitian_fixture: QubitPauliOperator,
+    pauli_term_matrices_fixture: list[tuple[complex, NDArray[np.complex128]]],
+):
+    """Test building TrotterPauliExpBox from PauliTerms matches the operator."""
+    n_state_qubits = get_n_state_qubits(op_hermitian_fixture)
+    terms = TrotterPauliExpBox.pauli_terms(op_hermitian_fixture)
+    for time_slice in [0.1, 0.3]:
+        trotter_box = TrotterPauliExpBox(terms, n_state_qubits, time_slice)
+        scipy_u = scipy_trotterbox(
+            pauli_term_matrices_fixture, n_state_qubits, time_slice
+        )
+        np.testing.assert_allclose(trotter_box.get_unitary(), scipy_u, atol=1e-10)
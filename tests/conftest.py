@@ -1,511 +1,149 @@
 """Conftest file for test parameterisation with fixture."""
 
+from functools import cache
+from operator import itemgetter
+import numpy as np
 import pytest
-from pytest_lazyfixture import lazy_fixture
 from pytket.utils.operators import QubitPauliOperator
 from pytket.pauli import Pauli, QubitPauliString
 from pytket.circuit import Qubit
+from pytket._tket.circuit import Circuit, CircBox
 from typing import Any
-
-
-@pytest.fixture()
-def ham_1q_posreal_0() -> QubitPauliOperator:
-    hamiltonian = QubitPauliOperator(
-        {
-            QubitPauliString([Qubit(0)], [Pauli.X]): 0.1,
-            QubitPauliString([Qubit(0)], [Pauli.Y]): 0.4,
-        }
-    )
-    return hamiltonian
-
-
-@pytest.fixture()
-def ham_1q_posreal_1() -> QubitPauliOperator:
-    hamiltonian = QubitPauliOperator(
-        {
-            QubitPauliString([Qubit(0)], [Pauli.Y]): 0.3,
-            QubitPauliString([Qubit(0)], [Pauli.X]): 0.2,
-        }
-    )
-    return hamiltonian
-
-
-@pytest.fixture()
-def ham_1q_posreal_2() -> QubitPauliOperator:
-    hamiltonian = QubitPauliOperator(
-        {
-            QubitPauliString([Qubit(0)], [Pauli.Z]): 0.5,
-            QubitPauliString([Qubit(0)], [Pauli.X]): 0.1,
-        }
-    )
-    return hamiltonian
-
-
-@pytest.fixture()
-def ham_1q_posreal_3() -> QubitPauliOperator:
-    hamiltonian = QubitPauliOperator(
-        {
-            QubitPauliString([Qubit(0)], [Pauli.Y]): 0.5,
-            QubitPauliString([Qubit(0)], [Pauli.Z]): 0.1,
-        }
-    )
-    return hamiltonian
-
-
-@pytest.fixture()
-def ham_1q_posreal_4() -> QubitPauliOperator:
-    hamiltonian = QubitPauliOperator(
-        {
-            QubitPauliString([Qubit(0)], [Pauli.I]): 0.3,
-            QubitPauliString([Qubit(0)], [Pauli.X]): 0.2,
-        }
-    )
-    return hamiltonian
-
-
-@pytest.fixture()
-def ham_1q_posreal_5() -> QubitPauliOperator:
-    hamiltonian = QubitPauliOperator(
-        {
-            QubitPauliString(): 0.5,
-            QubitPauliString([Qubit(0)], [Pauli.X]): 0.1,
-        }
-    )
-    return hamiltonian
-
-
-@pytest.fixture()
-def ham_1q_posreal_6() -> QubitPauliOperator:
-    hamiltonian = QubitPauliOperator(
-        {
-            QubitPauliString([Qubit(0)], [Pauli.Y]): 0.5,
-            QubitPauliString([Qubit(0)], [Pauli.I]): 0.1,
-        }
-    )
-    return hamiltonian
-
-
-@pytest.fixture()
-def ham_1q_negreal_0() -> QubitPauliOperator:
-    hamiltonian = QubitPauliOperator(
-        {
-            QubitPauliString([Qubit(0)], [Pauli.X]): -0.1,
-            QubitPauliString([Qubit(0)], [Pauli.Z]): -0.4,
-        }
-    )
-    return hamiltonian
-
-
-@pytest.fixture()
-def ham_1q_posimaginary_0() -> QubitPauliOperator:
-    hamiltonian = QubitPauliOperator(
-        {
-            QubitPauliString([Qubit(0)], [Pauli.X]): 0.1j,
-            QubitPauliString([Qubit(0)], [Pauli.Y]): 0.4j,
-        }
-    )
-    return hamiltonian
-
-
-@pytest.fixture()
-def ham_1q_negimaginary_1() -> QubitPauliOperator:
-    hamiltonian = QubitPauliOperator(
-        {
-            QubitPauliString([Qubit(0)], [Pauli.Y]): -0.3j,
-            QubitPauliString([Qubit(0)], [Pauli.X]): -0.2j,
-        }
-    )
-    return hamiltonian
-
-
-@pytest.fixture()
-def ham_2q_posreal_0() -> QubitPauliOperator:
-    hamiltonian = QubitPauliOperator(
-        {
-            QubitPauliString([Qubit(0), Qubit(1)], [Pauli.Z, Pauli.X]): 0.5,
-            QubitPauliString([Qubit(0), Qubit(1)], [Pauli.X, Pauli.Z]): 0.1,
-        }
-    )
-    return hamiltonian
-
-
-@pytest.fixture()
-def ham_2q_posreal_1() -> QubitPauliOperator:
-    hamiltonian = QubitPauliOperator(
-        {
-            QubitPauliString([Qubit(0), Qubit(1)], [Pauli.Y, Pauli.Z]): 0.3,
-            QubitPauliString([Qubit(0), Qubit(1)], [Pauli.X, Pauli.X]): 0.2,
-        }
-    )
-    return hamiltonian
-
-
-@pytest.fixture()
-def ham_2q_posreal_2() -> QubitPauliOperator:
-    hamiltonian = QubitPauliOperator(
-        {
-            QubitPauliString([Qubit(0), Qubit(1)], [Pauli.Y, Pauli.Y]): 0.5,
-            QubitPauliString([Qubit(0), Qubit(1)], [Pauli.X, Pauli.Z]): 0.1,
-        }
-    )
-    return hamiltonian
-
-
-@pytest.fixture()
-def ham_2q_posreal_3() -> QubitPauliOperator:
-    hamiltonian = QubitPauliOperator(
-        {
-            QubitPauliString(): 0.5,
-            QubitPauliString([Qubit(0), Qubit(1)], [Pauli.X, Pauli.Z]): 0.1,
-        }
-    )
-    return hamiltonian
-
-
-@pytest.fixture()
-def ham_2q_posreal_4() -> QubitPauliOperator:
-    hamiltonian = QubitPauliOperator(
-        {
-            QubitPauliString([Qubit(0), Qubit(1)], [Pauli.I, Pauli.I]): 0.5,
-            QubitPauliString([Qubit(0), Qubit(1)], [Pauli.X, Pauli.Z]): 0.1,
-        }
-    )
-    return hamiltonian
-
-
-@pytest.fixture()
-def ham_2q_negreal_0() -> QubitPauliOperator:
-    hamiltonian = QubitPauliOperator(
-        {
-            QubitPauliString([Qubit(0), Qubit(1)], [Pauli.Z, Pauli.X]): -0.5,
-            QubitPauliString([Qubit(0), Qubit(1)], [Pauli.X, Pauli.Z]): -0.1,
-        }
-    )
-    return hamiltonian
-
-
-@pytest.fixture()
-def ham_2q_negreal_1() -> QubitPauliOperator:
-    hamiltonian = QubitPauliOperator(
-        {
-            QubitPauliString([Qubit(0), Qubit(1)], [Pauli.Y, Pauli.Z]): -0.3,
-            QubitPauliString([Qubit(0), Qubit(1)], [Pauli.X, Pauli.X]): -0.2,
-        }
-    )
-    return hamiltonian
-
-
-@pytest.fixture()
-def ham_2q_posimaginary_0() -> QubitPauliOperator:
-    hamiltonian = QubitPauliOperator(
-        {
-            QubitPauliString([Qubit(0), Qubit(1)], [Pauli.Z, Pauli.X]): 0.5j,
-            QubitPauliString([Qubit(0), Qubit(1)], [Pauli.X, Pauli.Z]): 0.1j,
-        }
-    )
-    return hamiltonian
-
-
-@pytest.fixture()
-def ham_2q_posimaginary_1() -> QubitPauliOperator:
-    hamiltonian = QubitPauliOperator(
-        {
-            QubitPauliString([Qubit(0), Qubit(1)], [Pauli.Y, Pauli.Z]): 0.3j,
-            QubitPauliString([Qubit(0), Qubit(1)], [Pauli.X, Pauli.X]): 0.2j,
-        }
-    )
-    return hamiltonian
-
-
-@pytest.fixture()
-def ham_2q_negimaginary_0() -> QubitPauliOperator:
-    hamiltonian = QubitPauliOperator(
-        {
-            QubitPauliString([Qubit(0), Qubit(1)], [Pauli.Z, Pauli.X]): -0.5j,
-            QubitPauliString([Qubit(0), Qubit(1)], [Pauli.X, Pauli.Z]): -0.1j,
-        }
-    )
-    return hamiltonian
-
-
-@pytest.fixture()
-def ham_2q_negimaginary_1() -> QubitPauliOperator:
-    hamiltonian = QubitPauliOperator(
-        {
-            QubitPauliString([Qubit(0), Qubit(1)], [Pauli.Y, Pauli.Z]): -0.3j,
-            QubitPauliString([Qubit(0), Qubit(1)], [Pauli.X, Pauli.X]): -0.2j,
-        }
-    )
-    return hamiltonian
-
-
-@pytest.fixture()
-def ham_2q_mixed_0() -> QubitPauliOperator:
-    hamiltonian = QubitPauliOperator(
-        {
-            QubitPauliString([Qubit(0), Qubit(1)], [Pauli.Z, Pauli.X]): 0.7,
-            QubitPauliString([Qubit(0), Qubit(1)], [Pauli.X, Pauli.Z]): -0.9j,
-        }
-    )
-    return hamiltonian
-
-
-@pytest.fixture()
-def ham_2q_mixed_1() -> QubitPauliOperator:
-    hamiltonian = QubitPauliOperator(
-        {
-            QubitPauliString([Qubit(0), Qubit(1)], [Pauli.Y, Pauli.Z]): 0.7,
-            QubitPauliString([Qubit(0), Qubit(1)], [Pauli.X, Pauli.X]): -0.8j,
-        }
-    )
-    return hamiltonian
-
-
-@pytest.fixture()
-def ham_3q_posreal_0() -> QubitPauliOperator:
-    hamiltonian = QubitPauliOperator(
-        {
-            QubitPauliString(
-                [Qubit(0), Qubit(1), Qubit(2)], [Pauli.Z, Pauli.X, Pauli.Y]
-            ): 0.5,
-            QubitPauliString(
-                [Qubit(0), Qubit(1), Qubit(2)], [Pauli.X, Pauli.Z, Pauli.Z]
-            ): 0.1,
-            QubitPauliString(
-                [Qubit(0), Qubit(1), Qubit(2)], [Pauli.Y, Pauli.Y, Pauli.X]
-            ): 0.2,
-            QubitPauliString(
-                [Qubit(0), Qubit(1), Qubit(2)], [Pauli.X, Pauli.X, Pauli.Y]
-            ): 0.3,
-        }
-    )
-    return hamiltonian
-
-
-@pytest.fixture()
-def ham_3q_posreal_1() -> QubitPauliOperator:
-    hamiltonian = QubitPauliOperator(
-        {
-            QubitPauliString(
-                [Qubit(0), Qubit(1), Qubit(2)], [Pauli.Y, Pauli.Z, Pauli.X]
-            ): 0.5,
-            QubitPauliString(
-                [Qubit(0), Qubit(1), Qubit(2)], [Pauli.X, Pauli.X, Pauli.Z]
-            ): 0.1,
-            QubitPauliString(
-                [Qubit(0), Qubit(1), Qubit(2)], [Pauli.Y, Pauli.Y, Pauli.Y]
-            ): 0.2,
-            QubitPauliString(
-                [Qubit(0), Qubit(1), Qubit(2)], [Pauli.X, Pauli.Z, Pauli.X]
-            ): 0.3,
-        }
-    )
-    return hamiltonian
-
-
-@pytest.fixture()
-def ham_3q_negreal_0() -> QubitPauliOperator:
-    hamiltonian = QubitPauliOperator(
-        {
-            QubitPauliString(
-                [Qubit(0), Qubit(1), Qubit(2)], [Pauli.Z, Pauli.X, Pauli.Y]
-            ): -0.5,
-            QubitPauliString(
-                [Qubit(0), Qubit(1), Qubit(2)], [Pauli.X, Pauli.Z, Pauli.Z]
-            ): -0.1,
-            QubitPauliString(
-                [Qubit(0), Qubit(1), Qubit(2)], [Pauli.Y, Pauli.Y, Pauli.X]
-            ): -0.2,
-            QubitPauliString(
-                [Qubit(0), Qubit(1), Qubit(2)], [Pauli.X, Pauli.X, Pauli.Y]
-            ): -0.3,
-        }
-    )
-    return hamiltonian
-
-
-@pytest.fixture()
-def ham_3q_negreal_1() -> QubitPauliOperator:
-    hamiltonian = QubitPauliOperator(
-        {
-            QubitPauliString(
-                [Qubit(0), Qubit(1), Qubit(2)], [Pauli.Y, Pauli.Z, Pauli.X]
-            ): -0.5,
-            QubitPauliString(
-                [Qubit(0), Qubit(1), Qubit(2)], [Pauli.X, Pauli.X, Pauli.Z]
-            ): -0.1,
-            QubitPauliString(
-                [Qubit(0), Qubit(1), Qubit(2)], [Pauli.Y, Pauli.Y, Pauli.Y]
-            ): -0.2,
-            QubitPauliString(
-                [Qubit(0), Qubit(1), Qubit(2)], [Pauli.X, Pauli.Z, Pauli.X]
-            ): -0.3,
-        }
-    )
-    return hamiltonian
-
-
-@pytest.fixture()
-def ham_3q_posimaginary_0() -> QubitPauliOperator:
-    hamiltonian = QubitPauliOperator(
-        {
-            QubitPauliString(
-                [Qubit(0), Qubit(1), Qubit(2)], [Pauli.Z, Pauli.X, Pauli.Y]
-            ): 0.5j,
-            QubitPauliString(
-                [Qubit(0), Qubit(1), Qubit(2)], [Pauli.X, Pauli.Z, Pauli.Z]
-            ): 0.1j,
-            QubitPauliString(
-                [Qubit(0), Qubit(1), Qubit(2)], [Pauli.Y, Pauli.Y, Pauli.X]
-            ): 0.2j,
-            QubitPauliString(
-                [Qubit(0), Qubit(1), Qubit(2)], [Pauli.X, Pauli.X, Pauli.Y]
-            ): 0.3j,
-        }
-    )
-    return hamiltonian
-
-
-@pytest.fixture()
-def ham_3q_posimaginary_1() -> QubitPauliOperator:
-    hamiltonian = QubitPauliOperator(
-        {
-            QubitPauliString(
-                [Qubit(0), Qubit(1), Qubit(2)], [Pauli.Y, Pauli.Z, Pauli.X]
-            ): 0.5j,
-            QubitPauliString(
-                [Qubit(0), Qubit(1), Qubit(2)], [Pauli.X, Pauli.X, Pauli.Z]
-            ): 0.1j,
-            QubitPauliString(
-                [Qubit(0), Qubit(1), Qubit(2)], [Pauli.Y, Pauli.Y, Pauli.Y]
-            ): 0.2j,
-            QubitPauliString(
-                [Qubit(0), Qubit(1), Qubit(2)], [Pauli.X, Pauli.Z, Pauli.X]
-            ): 0.3j,
-        }
-    )
-    return hamiltonian
-
-
-@pytest.fixture()
-def ham_3q_negimaginary_0() -> QubitPauliOperator:
-    hamiltonian = QubitPauliOperator(
-        {
-            QubitPauliString(
-                [Qubit(0), Qubit(1), Qubit(2)], [Pauli.Z, Pauli.X, Pauli.Y]
-            ): -0.5j,
-            QubitPauliString(
-                [Qubit(0), Qubit(1), Qubit(2)], [Pauli.X, Pauli.Z, Pauli.Z]
-            ): -0.1j,
-            QubitPauliString(
-                [Qubit(0), Qubit(1), Qubit(2)], [Pauli.Y, Pauli.Y, Pauli.X]
-            ): -0.2j,
-            QubitPauliString(
-                [Qubit(0), Qubit(1), Qubit(2)], [Pauli.X, Pauli.X, Pauli.Y]
-            ): -0.3j,
-        }
-    )
-    return hamiltonian
-
-
-@pytest.fixture()
-def ham_3q_negimaginary_1() -> QubitPauliOperator:
-    hamiltonian = QubitPauliOperator(
-        {
-            QubitPauliString(
-                [Qubit(0), Qubit(1), Qubit(2)], [Pauli.Y, Pauli.Z, Pauli.X]
-            ): -0.5j,
-            QubitPauliString(
-                [Qubit(0), Qubit(1), Qubit(2)], [Pauli.X, Pauli.X, Pauli.Z]
-            ): -0.1j,
-            QubitPauliString(
-                [Qubit(0), Qubit(1), Qubit(2)], [Pauli.Y, Pauli.Y, Pauli.Y]
-            ): -0.2j,
-            QubitPauliString(
-                [Qubit(0), Qubit(1), Qubit(2)], [Pauli.X, Pauli.Z, Pauli.X]
-            ): -0.3j,
-        }
-    )
-    return hamiltonian
-
-
-@pytest.fixture()
-def ham_3q_mixed_0() -> QubitPauliOperator:
-    hamiltonian = QubitPauliOperator(
-        {
-            QubitPauliString(
-                [Qubit(0), Qubit(1), Qubit(2)], [Pauli.Z, Pauli.X, Pauli.Y]
-            ): 0.5,
-            QubitPauliString(
-                [Qubit(0), Qubit(1), Qubit(2)], [Pauli.X, Pauli.Z, Pauli.Z]
-            ): 0.1,
-            QubitPauliString(
-                [Qubit(0), Qubit(1), Qubit(2)], [Pauli.Y, Pauli.Y, Pauli.X]
-            ): 0.7j,
-            QubitPauliString(
-                [Qubit(0), Qubit(1), Qubit(2)], [Pauli.X, Pauli.X, Pauli.Y]
-            ): -0.6j,
-        }
-    )
-    return hamiltonian
-
-
-@pytest.fixture(
-    params=[
-        lazy_fixture("ham_1q_posreal_0"),
-        lazy_fixture("ham_1q_posreal_1"),
-        lazy_fixture("ham_1q_posreal_2"),
-        lazy_fixture("ham_1q_posreal_3"),
-        lazy_fixture("ham_1q_posreal_4"),
-        lazy_fixture("ham_1q_posreal_5"),
-        lazy_fixture("ham_1q_posreal_6"),
-        lazy_fixture("ham_1q_negreal_0"),
-        lazy_fixture("ham_2q_posreal_0"),
-        lazy_fixture("ham_2q_posreal_1"),
-        lazy_fixture("ham_2q_posreal_2"),
-        lazy_fixture("ham_2q_posreal_3"),
-        lazy_fixture("ham_2q_posreal_4"),
-        lazy_fixture("ham_2q_negreal_0"),
-        lazy_fixture("ham_2q_negreal_1"),
-        lazy_fixture("ham_3q_posreal_0"),
-        lazy_fixture("ham_3q_posreal_1"),
-        lazy_fixture("ham_3q_negreal_0"),
-        lazy_fixture("ham_3q_negreal_1"),
-    ]
-)
+from qtnmtts.circuits.core import RegisterBox
+from qtnmtts.circuits.lcu import LCUMultiplexorBox
+from qtnmtts.circuits.utils._testing import get_n_state_qubits
+
+# Test hamiltonians as (id, {pauli string: coefficient}), the i-th letter of a
+# pauli string acts on Qubit(i) and the empty string is the identity
+HERMITIAN_HAMILTONIANS: list[tuple[str, dict[str, complex]]] = [
+    ("ham_1q_posreal_0", {"X": 0.1, "Y": 0.4}),
+    ("ham_1q_posreal_1", {"Y": 0.3, "X": 0.2}),
+    ("ham_1q_posreal_2", {"Z": 0.5, "X": 0.1}),
+    ("ham_1q_posreal_3", {"Y": 0.5, "Z": 0.1}),
+    ("ham_1q_posreal_4", {"I": 0.3, "X": 0.2}),
+    ("ham_1q_posreal_5", {"": 0.5, "X": 0.1}),
+    ("ham_1q_posreal_6", {"Y": 0.5, "I": 0.1}),
+    ("ham_1q_negreal_0", {"X": -0.1, "Z": -0.4}),
+    ("ham_2q_posreal_0", {"ZX": 0.5, "XZ": 0.1}),
+    ("ham_2q_posreal_1", {"YZ": 0.3, "XX": 0.2}),
+    ("ham_2q_posreal_2", {"YY": 0.5, "XZ": 0.1}),
+    ("ham_2q_posreal_3", {"": 0.5, "XZ": 0.1}),
+    ("ham_2q_posreal_4", {"II": 0.5, "XZ": 0.1}),
+    ("ham_2q_negreal_0", {"ZX": -0.5, "XZ": -0.1}),
+    ("ham_2q_negreal_1", {"YZ": -0.3, "XX": -0.2}),
+    ("ham_3q_posreal_0", {"ZXY": 0.5, "XZZ": 0.1, "YYX": 0.2, "XXY": 0.3}),
+    ("ham_3q_posreal_1", {"YZX": 0.5, "XXZ": 0.1, "YYY": 0.2, "XZX": 0.3}),
+    ("ham_3q_negreal_0", {"ZXY": -0.5, "XZZ": -0.1, "YYX": -0.2, "XXY": -0.3}),
+    ("ham_3q_negreal_1", {"YZX": -0.5, "XXZ": -0.1, "YYY": -0.2, "XZX": -0.3}),
+]
+NONHERMITIAN_HAMILTONIANS: list[tuple[str, dict[str, complex]]] = [
+    ("ham_1q_posimaginary_0", {"X": 0.1j, "Y": 0.4j}),
+    ("ham_1q_negimaginary_1", {"Y": -0.3j, "X": -0.2j}),
+    ("ham_2q_posimaginary_0", {"ZX": 0.5j, "XZ": 0.1j}),
+    ("ham_2q_posimaginary_1", {"YZ": 0.3j, "XX": 0.2j}),
+    ("ham_2q_negimaginary_0", {"ZX": -0.5j, "XZ": -0.1j}),
+    ("ham_2q_negimaginary_1", {"YZ": -0.3j, "XX": -0.2j}),
+    ("ham_2q_mixed_0", {"ZX": 0.7, "XZ": -0.9j}),
+    ("ham_2q_mixed_1", {"YZ": 0.7, "XX": -0.8j}),
+    ("ham_3q_posimaginary_0", {"ZXY": 0.5j, "XZZ": 0.1j, "YYX": 0.2j, "XXY": 0.3j}),
+    ("ham_3q_posimaginary_1", {"YZX": 0.5j, "XXZ": 0.1j, "YYY": 0.2j, "XZX": 0.3j}),
+    ("ham_3q_negimaginary_0", {"ZXY": -0.5j, "XZZ": -0.1j, "YYX": -0.2j, "XXY": -0.3j}),
+    ("ham_3q_negimaginary_1", {"YZX": -0.5j, "XXZ": -0.1j, "YYY": -0.2j, "XZX": -0.3j}),
+    ("ham_3q_mixed_0", {"ZXY": 0.5, "XZZ": 0.1, "YYX": 0.7j, "XXY": -0.6j}),
+]
+
+
+_HAMILTONIAN_TERMS = dict(HERMITIAN_HAMILTONIANS + NONHERMITIAN_HAMILTONIANS)
+
+
+@cache
+def _pauli_string(paulis: str) -> QubitPauliString:
+    """Return the QubitPauliString of a table pauli string, shared between rows."""
+    return QubitPauliString(
+        [Qubit(i) for i in range(len(paulis))],
+        [getattr(Pauli, pauli) for pauli in paulis],
+    )
+
+
+@cache
+def _hamiltonian(name: str) -> QubitPauliOperator:
+    """Return the test hamiltonian with the given id, built once per session.
+
+    The tests only read the operators, so the same object is shared by all the
+    operator fixtures and survives pytest rebuilding the session fixtures.
+    """
+    return QubitPauliOperator(
+        {
+            _pauli_string(paulis): coeff
+            for paulis, coeff in _HAMILTONIAN_TERMS[name].items()
+        }
+    )
+
+
+@pytest.fixture(scope="session", params=HERMITIAN_HAMILTONIANS, ids=itemgetter(0))
 def op_hermitian_fixture(request: Any) -> QubitPauliOperator:
     """Fixture for parameterising tests with different hermitian operators."""
-    return request.param
+    return _hamiltonian(request.param[0])
 
 
-@pytest.fixture(
-    params=[
-        lazy_fixture("ham_1q_posimaginary_0"),
-        lazy_fixture("ham_1q_negimaginary_1"),
-        lazy_fixture("ham_2q_posimaginary_0"),
-        lazy_fixture("ham_2q_posimaginary_1"),
-        lazy_fixture("ham_2q_negimaginary_0"),
-        lazy_fixture("ham_2q_negimaginary_1"),
-        lazy_fixture("ham_2q_mixed_0"),
-        lazy_fixture("ham_2q_mixed_1"),
-        lazy_fixture("ham_3q_posimaginary_0"),
-        lazy_fixture("ham_3q_posimaginary_1"),
-        lazy_fixture("ham_3q_negimaginary_0"),
-        lazy_fixture("ham_3q_negimaginary_1"),
-        lazy_fixture("ham_3q_mixed_0"),
-    ]
-)
+@pytest.fixture(scope="session", params=NONHERMITIAN_HAMILTONIANS, ids=itemgetter(0))
 def op_nonhermitian_fixture(request: Any) -> QubitPauliOperator:
     """Fixture for parameterising tests with different nonhermitian operators."""
-    return request.param
+    return _hamiltonian(request.param[0])
 
 
 @pytest.fixture(
-    params=[
-        lazy_fixture("op_hermitian_fixture"),
-        lazy_fixture("op_nonhermitian_fixture"),
-    ]
+    scope="session",
+    params=HERMITIAN_HAMILTONIANS + NONHERMITIAN_HAMILTONIANS,
+    ids=itemgetter(0),
 )
 def op_fixture(request: Any) -> QubitPauliOperator:
     """Fixture for parameterising tests with different operators."""
-    return request.param
+    return _hamiltonian(request.param[0])
+
+
+@pytest.fixture(scope="session")
+def n_state_qubits_fixture(op_fixture: QubitPauliOperator) -> int:
+    """Fixture for the number of state qubits of the op_fixture operator."""
+    return get_n_state_qubits(op_fixture)
+
+
+@cache
+def _lcu_multiplexor_box(
+    terms: tuple[tuple[QubitPauliString, complex], ...], n_state_qubits: int
+) -> LCUMultiplexorBox:
+    """Return the LCUMultiplexorBox of an operator given as its terms.
+
+    Parametrised session fixtures are rebuilt when pytest switches parameters, so
+    the box is cached on the terms to keep a single box per operator.
+    """
+    return LCUMultiplexorBox(QubitPauliOperator(dict(terms)), n_state_qubits)
+
+
+@pytest.fixture(scope="session")
+def lcu_box_fixture(
+    op_fixture: QubitPauliOperator, n_state_qubits_fixture: int
+) -> LCUMultiplexorBox:
+    """Fixture for the LCUMultiplexorBox of the op_fixture operator."""
+    return _lcu_multiplexor_box(tuple(op_fixture._dict.items()), n_state_qubits_fixture)
+
+
+def _generate_ry_circbox(n_qubits: int, seed: int) -> CircBox:
+    """Generate a random Ry circuit, the same circuit for the same seed."""
+    rng = np.random.default_rng(seed)
+    circ = Circuit(n_qubits)
+    for n, angle in enumerate(rng.random(n_qubits).tolist()):
+        circ.Ry(angle, n)
+    return CircBox(circ)
+
+
+@pytest.fixture(scope="session")
+def ry_register_boxes_fixture() -> dict[int, list[RegisterBox]]:
+    """Fixture for the seeded Ry RegisterBoxes, by number of qubits then seed."""
+    return {
+        n_qubits: [
+            RegisterBox.from_CircBox(_generate_ry_circbox(n_qubits, seed))
+            for seed in range(16)
+        ]
+        for n_qubits in range(1, 4)
+    }
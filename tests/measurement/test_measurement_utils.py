@@ -0,0 +1,82 @@
+"""Test the measurement utils."""
+
+from collections.abc import Callable
+from typing import Any
+import pytest
+from pytket._tket.circuit import Circuit
+from pytket.backends.backend import Backend
+from pytket.circuit import PauliExpBox
+from pytket.extensions.qiskit import AerBackend  # type: ignore
+from pytket.pauli import Pauli
+from qtnmtts.measurement.utils import compile_for_backend
+
+
+def pauli_exp_circuit() -> Circuit:
+    """Return a circuit that has to be compiled for the AerBackend."""
+    circ = Circuit(2)
+    circ.add_gate(PauliExpBox([Pauli.X, Pauli.Y], 0.3), [0, 1])  # type: ignore
+    circ.measure_all()
+    return circ
+
+
+def aer_backend() -> Backend:
+    """Return a new AerBackend, each backend has its own compiled circuit cache."""
+    return AerBackend()  # type: ignore
+
+
+def count_calls(
+    monkeypatch: pytest.MonkeyPatch, backend: Backend, name: str
+) -> list[int]:
+    """Count the calls of a backend method, the count is the list length."""
+    calls: list[int] = []
+    method: Callable[..., Any] = getattr(backend, name)
+
+    def counted(*args: Any, **kwargs: Any) -> Any:
+        calls.append(1)
+        return method(*args, **kwargs)
+
+    monkeypatch.setattr(backend, name, counted)
+    return calls
+
+
+def test_compile_for_backend_valid_circuit():
+    """Test a valid circuit is returned unchanged."""
+    circ = Circuit(2)
+    circ.H(0)  # type: ignore
+    circ.measure_all()
+    assert compile_for_backend(aer_backend(), circ) is circ
+
+
+def test_compile_for_backend_cache(monkeypatch: pytest.MonkeyPatch):
+    """Test a keyed circuit is compiled once and each call returns a copy."""
+    backend = aer_backend()
+    compile_calls = count_calls(monkeypatch, backend, "get_compiled_circuit")
+    circ = pauli_exp_circuit()
+
+    compiled = compile_for_backend(backend, circ, "circ")
+    assert backend.valid_circuit(compiled)
+    compiled.X(0)  # type: ignore
+
+    compiled_again = compile_for_backend(backend, circ.copy(), "circ")
+    assert len(compile_calls) == 1
+    assert compiled_again is not compiled
+    assert compiled_again != compiled
+
+    # circuits without a key are not cached
+    compile_for_backend(backend, circ)
+    compile_for_backend(backend, circ)
+    assert len(compile_calls) == 3
+
+
+def test_compile_for_backend_skips_validation(monkeypatch: pytest.MonkeyPatch):
+    """Test a returned circuit is not validated again, but its copies are."""
+    backend = aer_backend()
+    compiled = compile_for_backend(backend, pauli_exp_circuit())
+    valid_calls = count_calls(monkeypatch, backend, "valid_circuit")
+
+    assert compile_for_backend(backend, compiled) is compiled
+    assert len(valid_calls) == 0
+
+    compiled_copy = compiled.copy()
+    assert compile_for_backend(backend, compiled_copy) is compiled_copy
+    assert len(valid_calls) == 1
@@ -0,0 +1,111 @@
+"""Test the shot based operator measurement."""
+
+import pytest
+import numpy as np
+from pytket._tket.circuit import Circuit
+from pytket.backends.backend import Backend
+from pytket.circuit import Qubit
+from pytket.extensions.qiskit import AerBackend  # type: ignore
+from pytket.pauli import Pauli, QubitPauliString
+from pytket.utils.operators import QubitPauliOperator
+from qtnmtts.measurement.shots import operator_expectation, qubitwise_commuting_groups
+
+
+def aer_backend() -> Backend:
+    """Return a new AerBackend."""
+    return AerBackend()  # type: ignore
+
+
+def pauli_string(paulis: str, offset: int = 0) -> QubitPauliString:
+    """Return the Pauli string with letter i acting on Qubit(offset + i)."""
+    letters = {"I": Pauli.I, "X": Pauli.X, "Y": Pauli.Y, "Z": Pauli.Z}
+    qubits = [Qubit(offset + i) for i in range(len(paulis))]
+    return QubitPauliString(qubits, [letters[p] for p in paulis])
+
+
+def ghz_circuit(n_qubits: int) -> Circuit:
+    """Return the circuit preparing the GHZ state."""
+    circ = Circuit(n_qubits)
+    circ.H(0)  # type: ignore
+    for i in range(n_qubits - 1):
+        circ.CX(i, i + 1)  # type: ignore
+    return circ
+
+
+def test_qubitwise_commuting_groups():
+    """Test each pauli is in one group and commutes qubit-wise with its basis."""
+    rng = np.random.default_rng(0)
+    paulis = list(
+        {pauli_string("".join(rng.choice(list("IXYZ"), 4))) for _ in range(40)}
+    )
+
+    groups = qubitwise_commuting_groups(paulis)
+
+    grouped = [pauli for _, members in groups for pauli in members]
+    assert sorted(map(str, grouped)) == sorted(map(str, paulis))
+    for basis, members in groups:
+        for pauli in members:
+            for qubit, p in pauli.map.items():
+                assert p == Pauli.I or basis[qubit] == p
+
+
+def test_qubitwise_commuting_groups_example():
+    """Test the greedy grouping of a small set of paulis."""
+    x0, x0x1, z0, z1 = (pauli_string(p) for p in ["X", "XX", "Z", "IZ"])
+
+    groups = qubitwise_commuting_groups([x0, z0, x0x1, z1])
+
+    assert [(basis, members) for basis, members in groups] == [
+        (x0x1, [x0, x0x1]),
+        (pauli_string("ZZ"), [z0, z1]),
+    ]
+
+
+@pytest.mark.parametrize("n_shots", [10, 100])
+def test_operator_expectation(n_shots: int):
+    """Test the expectation of GHZ stabilizers against state_expectation.
+
+    The stabilizer outcomes are deterministic, so the shot estimate is exact.
+    """
+    circ = ghz_circuit(3)
+    qpo = QubitPauliOperator(
+        {
+            QubitPauliString(): 0.5,
+            pauli_string("ZZ"): 0.3,
+            pauli_string("IZZ"): -0.2,
+            pauli_string("XXX"): 0.4,
+            pauli_string("YYX"): 0.1j,
+            pauli_string("XYY"): -0.7,
+        }
+    )
+
+    expectation = operator_expectation(aer_backend(), circ, qpo, n_shots)
+
+    state_expectation = qpo.state_expectation(circ.get_statevector())  # type: ignore
+    assert expectation == pytest.approx(state_expectation)  # type: ignore
+
+
+@pytest.mark.parametrize("post_select", [0, 1])
+def test_operator_expectation_post_select(post_select: int):
+    """Test the expectation with post selection on an ancilla qubit.
+
+    The ancilla controls an X on the state, so post selecting it gives |00> or
+    |10>.
+    """
+    circ = Circuit(2)
+    ancilla = Qubit("a", 0)
+    circ.add_qubit(ancilla)  # type: ignore
+    circ.H(ancilla)  # type: ignore
+    circ.CX(ancilla, Qubit(0))  # type: ignore
+    qpo = QubitPauliOperator(
+        {pauli_string("Z"): 0.5, pauli_string("IZ"): 0.25, pauli_string("ZZ"): 1.0}
+    )
+
+    expectation = operator_expectation(
+        aer_backend(), circ, qpo, 100, post_select_dict={ancilla: post_select}
+    )
+
+    state = np.zeros(4)
+    state[2 * post_select] = 1
+    state_expectation = qpo.state_expectation(state)  # type: ignore
+    assert expectation == pytest.approx(state_expectation)  # type: ignore
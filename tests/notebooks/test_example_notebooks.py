@@ -1,21 +1,31 @@
 """Test that all example notebooks can be executed without error."""
 
 import os
-import glob
+from copy import deepcopy
+from pathlib import Path
 import nbformat
 from nbconvert.preprocessors import ExecutePreprocessor
 import pytest
 
 
 MAX_RETRIES = 5
+# per cell timeout in seconds, can be lowered in CI to fail fast on a hung cell
+CELL_TIMEOUT = int(os.environ.get("QTNM_NB_TIMEOUT", "600"))
 
 
 def execute_notebook(notebook_path: str, retries: int = MAX_RETRIES):
     """Execute a Jupyter notebook and return any errors."""
+    with open(notebook_path) as f:
+        nb_template = nbformat.read(f, as_version=4)  # type: ignore
     for attempt in range(1, retries + 1):
-        with open(notebook_path) as f:
-            nb = nbformat.read(f, as_version=4)  # type: ignore
-        ep = ExecutePreprocessor(timeout=600, kernel_name="python3")
+        # the preprocessor writes the outputs into the notebook
+        nb = deepcopy(nb_template)  # type: ignore
+        ep = ExecutePreprocessor(
+            timeout=CELL_TIMEOUT,
+            kernel_name="python3",
+            interrupt_on_timeout=True,
+            startup_timeout=60,
+        )
         try:
             ep.preprocess(nb, {"metadata": {"path": os.path.dirname(notebook_path)}})  # type: ignore
             return None  # Success, no error
@@ -27,11 +37,14 @@ def execute_notebook(notebook_path: str, retries: int = MAX_RETRIES):
             return error_message
 
 
-directory = "./examples/circuits/"
-ipynb_files = glob.glob(os.path.join(directory, "*.ipynb"))
+directory = Path(__file__).parents[2] / "examples" / "circuits"
+ipynb_files = sorted(str(path) for path in directory.glob("*.ipynb"))
 
 
-@pytest.mark.parametrize("notebook_path", ipynb_files)
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    "notebook_path", ipynb_files, ids=[Path(path).stem for path in ipynb_files]
+)
 def test_notebook_execution(notebook_path: str):
     """Test that the notebook can be executed without error."""
     error = execute_notebook(notebook_path)
@@ -0,0 +1,66 @@
+"""Test the linear algebra utils."""
+
+from itertools import product
+import pytest
+import numpy as np
+from numpy.typing import NDArray
+from qtnmtts.utils.linalg_utils import get_projector_matrix, partial_trace
+
+
+def projector_sum_partial_trace(
+    dmat: NDArray[np.complex128],
+    projection_qubits: list[int],
+    identity_qubits: list[int],
+) -> NDArray[np.complex128]:
+    """Return the partial trace as the sum of the projections of dmat."""
+    reduced = np.zeros(
+        (2 ** len(identity_qubits), 2 ** len(identity_qubits)), dtype=complex
+    )
+    for bit_tuple in product(["0", "1"], repeat=len(projection_qubits)):
+        projector = get_projector_matrix(
+            projection_qubits, identity_qubits, proj_bit_string="".join(bit_tuple)
+        )
+        reduced += projector.conjugate().transpose() @ dmat @ projector
+    return reduced
+
+
+def random_density_matrix(n_qubits: int, seed: int) -> NDArray[np.complex128]:
+    """Return a random density matrix."""
+    rng = np.random.default_rng(seed)
+    dim = 2**n_qubits
+    a = rng.normal(size=(dim, dim)) + 1j * rng.normal(size=(dim, dim))
+    dmat = a @ a.conj().T
+    return dmat / np.trace(dmat)
+
+
+@pytest.mark.filterwarnings("ignore:the matrix subclass:PendingDeprecationWarning")
+@pytest.mark.parametrize("n_proj", [1, 2, 3])
+@pytest.mark.parametrize("n_keep", [1, 2])
+def test_partial_trace(n_proj: int, n_keep: int):
+    """Test the partial trace against the sum of the projections."""
+    projection_qubits = list(range(n_proj))
+    identity_qubits = list(range(n_proj, n_proj + n_keep))
+    dmat = random_density_matrix(n_proj + n_keep, n_proj + 10 * n_keep)
+
+    expected = projector_sum_partial_trace(dmat, projection_qubits, identity_qubits)
+
+    np.testing.assert_allclose(
+        partial_trace(dmat, projection_qubits, identity_qubits), expected
+    )
+    np.testing.assert_allclose(
+        partial_trace(
+            np.matrix(dmat),  # type: ignore
+            projection_qubits,
+            identity_qubits,
+        ),
+        expected,
+    )
+
+
+def test_partial_trace_real_input():
+    """Test the partial trace of a real matrix is complex."""
+    dmat = np.diag([0.5, 0.25, 0.125, 0.125])
+    reduced = partial_trace(dmat, [0], [1])  # type: ignore
+
+    assert reduced.dtype == np.complex128
+    np.testing.assert_allclose(reduced, np.diag([0.625, 0.375]))